@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: benchmark CN() calls against precomputed Clark names
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import timeit
+
+from ezodf.xmlns import CN
+from ezodf.clarknames import OFFICE_VALUE_TYPE, OFFICE_VALUE
+from ezodf.cells import Cell, get_cell_value
+
+COUNT = 1000000
+
+xmlcell = Cell(3.1415).xmlnode
+
+def with_cn():
+    value_type = xmlcell.get(CN('office:value-type'))
+    return xmlcell.get(CN('office:value'))
+
+def with_constants():
+    value_type = xmlcell.get(OFFICE_VALUE_TYPE)
+    return xmlcell.get(OFFICE_VALUE)
+
+def cell_value():
+    return get_cell_value(xmlcell)
+
+def bench(func):
+    seconds = min(timeit.repeat(func, number=COUNT, repeat=3))
+    return seconds / COUNT * 1e9
+
+print("attribute access per cell, two lookups:")
+before = bench(with_cn)
+after = bench(with_constants)
+print("  CN() calls:        %6.1f ns" % before)
+print("  Clark constants:   %6.1f ns" % after)
+print("  overhead removed:  %6.1f ns (%.0f%%)" % (before - after, (before - after) / before * 100.))
+print("decoding a float cell by get_cell_value(): %6.1f ns" % bench(cell_value))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: benchmark full-sheet scans with 'wrapper' and 'native' element binding
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import io
+import timeit
+
+import ezodf
+from ezodf.table import Table
+
+NROWS = 2000
+NCOLS = 20
+REPEAT = 3
+
+def create_document():
+    doc = ezodf.newdoc('ods')
+    table = doc.sheets.append(Table('Sheet1', size=(NROWS, NCOLS)))
+    table.set_values('A1', [[row * NCOLS + col for col in range(NCOLS)] for row in range(NROWS)])
+    stream = io.BytesIO()
+    doc.saveas(stream)
+    return stream.getvalue()
+
+def scan_rows(table):
+    # without the column index every cell element is created by lxml at
+    # every access
+    total = 0.
+    for row in table.rows():
+        for cell in row:
+            total += cell.value
+    return total
+
+def scan_columns(table):
+    # the cached column index keeps the cell elements alive
+    total = 0.
+    for column in table.columns():
+        for cell in column:
+            total += cell.value
+    return total
+
+def bench(binding, data):
+    ezodf.config.set_element_binding(binding)
+    try:
+        table = ezodf.opendoc(io.BytesIO(data)).sheets[0]
+        table.nrows() # load and normalize the table
+        results = [min(timeit.repeat(lambda: scan_rows(table), number=1, repeat=REPEAT))]
+        scan_columns(table) # build the column index
+        results.append(min(timeit.repeat(lambda: scan_columns(table), number=1, repeat=REPEAT)))
+        results.append(min(timeit.repeat(lambda: scan_rows(table), number=1, repeat=REPEAT)))
+        return results
+    finally:
+        ezodf.config.reset_element_binding()
+
+data = create_document()
+print("full-sheet scans of %d x %d cells, Cell.value of every cell:" % (NROWS, NCOLS))
+wrapper = bench('wrapper', data)
+native = bench('native', data)
+for name, before, after in zip(('rows()', 'columns()', 'rows()*'), wrapper, native):
+    print("  %-10s wrapper: %6.1f ms  native: %6.1f ms  (%+.0f%%)" % (
+        name, before * 1000., after * 1000., (after - before) / before * 100.))
+print("  * cell elements kept alive by the column index")
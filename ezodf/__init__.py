@@ -22,6 +22,9 @@ from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
 from .document import opendoc, newdoc
+from .streamreader import iter_rows
+from .streamwriter import StreamingSpreadsheetWriter
+from .evaluator import Evaluator
 
 # register classes by import
 from .whitespaces import LineBreak, Tabulator, Spaces, SoftPageBreak
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: python -m ezodf
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
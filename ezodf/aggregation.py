@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: aggregation of numerical cell values
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# numpy is an optional dependency, used if installed
+
+from .compatibility import is_string
+from .clarknames import TABLE_COVERED_TABLE_CELL, TABLE_VISIBILITY
+from .cells import get_cell_number
+
+AGGREGATES = ('sum', 'count', 'min', 'max', 'mean')
+VISIBLE = (None, 'visible')
+# below this count of values the numpy overhead exceeds the gain
+NUMPY_THRESHOLD = 1000
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def hidden_columns(column_runs, left, right):
+    """ Get the set of indices of the hidden columns in the range
+    [`left`, `right`), `column_runs` is an iterable of (xmlcolumn, count)
+    tuples like the result of the `iterruns()` method of the column
+    controllers, which resolve the column definitions of the table.
+    """
+    hidden = set()
+    start = 0
+    for xmlcolumn, count in column_runs:
+        stop = start + count
+        if xmlcolumn.get(TABLE_VISIBILITY) not in VISIBLE:
+            hidden.update(range(max(start, left), min(stop, right)))
+        if stop >= right:
+            break
+        start = stop
+    return hidden
+
+
+def number_decoder(skip_hidden, skip_covered):
+    """ Get a decode function for :meth:`itervalues`, returns the value of
+    numerical cells as float and `None` for all other cells.
+    """
+    if not (skip_hidden or skip_covered):
+        return get_cell_number
+
+    def decode(xmlcell):
+        if skip_covered and xmlcell.tag == TABLE_COVERED_TABLE_CELL:
+            return None
+        if skip_hidden and xmlcell.getparent().get(TABLE_VISIBILITY) not in VISIBLE:
+            return None
+        return get_cell_number(xmlcell)
+    return decode
+
+
+def check_funcs(funcs):
+    if is_string(funcs):
+        funcs = (funcs, )
+    funcs = tuple(funcs)
+    for name in funcs:
+        if name not in AGGREGATES:
+            raise ValueError("unknown aggregate function: '%s'" % name)
+    return funcs
+
+
+def aggregate_runs(runs, funcs, skip_columns=()):
+    """ Aggregate the numbers of `runs`, an iterable of (values, count) tuples
+    like the result of :meth:`itervalues`, `values` is a list of floats and
+    `None` for non-numerical cells; values at the positions `skip_columns` are
+    ignored. Returns a dict of function name and result, the result of 'min',
+    'max' and 'mean' is `None` if there are no numbers.
+    """
+    numbers = []
+    counts = []
+    for values, count in runs:
+        if skip_columns:
+            values = [value for index, value in enumerate(values)
+                      if index not in skip_columns]
+        values = [value for value in values if value is not None]
+        if values:
+            numbers.append(values)
+            counts.append(count)
+
+    numpy = _import_numpy()
+    if numpy is not None and sum(len(values) * count for values, count in
+                                 zip(numbers, counts)) >= NUMPY_THRESHOLD:
+        return _aggregate_numpy(numpy, numbers, counts, funcs)
+    return _aggregate_python(numbers, counts, funcs)
+
+
+def _aggregate_python(numbers, counts, funcs):
+    total = 0.
+    count = 0
+    minimum = maximum = None
+    for values, repeat in zip(numbers, counts):
+        total += sum(values) * repeat
+        count += len(values) * repeat
+        low, high = min(values), max(values)
+        if minimum is None or low < minimum:
+            minimum = low
+        if maximum is None or high > maximum:
+            maximum = high
+    results = {
+        'sum': total,
+        'count': count,
+        'min': minimum,
+        'max': maximum,
+        'mean': total / count if count else None,
+    }
+    return dict((name, results[name]) for name in funcs)
+
+
+def _aggregate_numpy(numpy, numbers, counts, funcs):
+    lengths = [len(values) for values in numbers]
+    array = numpy.fromiter((value for values in numbers for value in values),
+                           dtype=float, count=sum(lengths))
+    if all(count == 1 for count in counts):
+        weights = None
+        total = array.sum()
+        count = array.size
+    else: # repeated rows
+        weights = numpy.repeat(numpy.array(counts, dtype=float), lengths)
+        total = numpy.dot(array, weights)
+        count = int(weights.sum())
+    results = {}
+    for name in funcs:
+        if name == 'sum':
+            results[name] = float(total)
+        elif name == 'count':
+            results[name] = count
+        elif name == 'min':
+            results[name] = float(array.min())
+        elif name == 'max':
+            results[name] = float(array.max())
+        else:
+            results[name] = float(total / count)
+    return results
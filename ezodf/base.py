@@ -7,7 +7,7 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
-from .xmlns import etree, register_class, wrap
+from .xmlns import etree, register_class, wrap, _class_registry
 from .compatibility import itermap, tostr
 
 def safelen(text):
@@ -15,13 +15,16 @@ def safelen(text):
 
 @register_class
 class GenericWrapper(object):
+    # subclasses without own instance attributes should declare an empty
+    # __slots__, so the wrapper objects get no __dict__
+    __slots__ = ('xmlnode', '__weakref__')
     TAG = 'GenericWrapper'
 
     def __init__(self, xmlnode=None):
         if xmlnode is not None:
             self.xmlnode = xmlnode
         else:
-            self.xmlnode = etree.Element(self.TAG)
+            self.xmlnode = _class_registry.new_element(self)
 
     def __iter__(self):
         return itermap(wrap, self.xmlnode.iterchildren())
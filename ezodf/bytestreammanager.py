@@ -20,14 +20,14 @@ class ByteStreamManager(FileManager):
             self._zipfile_as_bytes = buffer
         super(ByteStreamManager, self).__init__()
 
-    def save(self, filename, backup=False):
+    def save(self, filename, backup=False, compresslevel=None, workers=None):
         if is_stream(filename):
-            filename.write(self.tobytes())
+            filename.write(self.tobytes(compresslevel, workers))
         else:
             with open(filename, 'wb') as fp:
-                fp.write(self.tobytes())
+                fp.write(self.tobytes(compresslevel, workers))
 
-    def has_zip(self):
+    def _zipfile_available(self):
         return self._zipfile_as_bytes is not None
 
     def _open_bytestream(self):
@@ -7,9 +7,20 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
-from .xmlns import register_class, CN
+from datetime import date, datetime
+from decimal import Decimal
+from numbers import Number
+
+from .xmlns import register_class, wrap, etree
+from .clarknames import (OFFICE_BOOLEAN_VALUE, OFFICE_CURRENCY,
+    OFFICE_DATE_VALUE, OFFICE_STRING_VALUE, OFFICE_TIME_VALUE, OFFICE_VALUE,
+    OFFICE_VALUE_TYPE, TABLE_CONTENT_VALIDATION_NAME,
+    TABLE_COVERED_TABLE_CELL, TABLE_FORMULA, TABLE_NUMBER_COLUMNS_SPANNED,
+    TABLE_NUMBER_MATRIX_COLUMNS_SPANNED, TABLE_NUMBER_MATRIX_ROWS_SPANNED,
+    TABLE_NUMBER_ROWS_SPANNED, TABLE_PROTECT, TABLE_STYLE_NAME,
+    TABLE_TABLE_CELL)
 from .base import GenericWrapper
-from .text import Paragraph, Span
+from .text import Paragraph, Heading, Span
 from .propertymixins import StringProperty, BooleanProperty
 from .compatibility import tostr, is_string
 
@@ -18,31 +29,187 @@ VALID_VALUE_TYPES = frozenset( ('float', 'percentage', 'currency', 'date', 'time
 NUMERIC_TYPES = frozenset( ('float', 'percentage', 'currency') )
 
 TYPE_VALUE_MAP = {
-    'string': CN('office:string-value'),
-    'float': CN('office:value'),
-    'percentage': CN('office:value'),
-    'currency': CN('office:value'),
-    'date': CN('office:date-value'),
-    'time': CN('office:time-value'),
-    'boolean': CN('office:boolean-value'),
+    'string': OFFICE_STRING_VALUE,
+    'float': OFFICE_VALUE,
+    'percentage': OFFICE_VALUE,
+    'currency': OFFICE_VALUE,
+    'date': OFFICE_DATE_VALUE,
+    'time': OFFICE_TIME_VALUE,
+    'boolean': OFFICE_BOOLEAN_VALUE,
 }
 
 # These Classes are supported to read their plaintext content from the
 # cell-content.
 SUPPORTED_CELL_CONTENT = ("Paragraph", "Heading")
+SUPPORTED_CELL_CONTENT_TAGS = frozenset( (Paragraph.TAG, Heading.TAG) )
+
+def _plaintext(element):
+    # paragraphs without child elements are the most common cell content
+    if len(element) == 0:
+        return element.text or ""
+    return wrap(element).plaintext()
+
+def get_cell_value(xmlcell):
+    """ Get the decoded value of the <table:table-cell> element `xmlcell`,
+    same result as :attr:`Cell.value` but without creating a wrapper object.
+    """
+    value_type = xmlcell.get(OFFICE_VALUE_TYPE)
+    if value_type is None:
+        return None
+    elif value_type == 'string':
+        return "\n".join([_plaintext(element) for element in xmlcell
+                          if element.tag in SUPPORTED_CELL_CONTENT_TAGS])
+    value = xmlcell.get(TYPE_VALUE_MAP[value_type])
+    if value is None:
+        pass
+    elif value_type in NUMERIC_TYPES:
+        value = float(value)
+    elif value_type == 'boolean':
+        value = True if value == 'true' else False
+    return value
+
+def get_cell_number(xmlcell, default=None):
+    """ Get the value of numeric cells (float, percentage, currency) of the
+    <table:table-cell> element `xmlcell` as float, or `default` for all other
+    cells.
+    """
+    if xmlcell.get(OFFICE_VALUE_TYPE) in NUMERIC_TYPES:
+        value = xmlcell.get(OFFICE_VALUE)
+        if value is not None:
+            return float(value)
+    return default
+
+def _set_number(xmlcell, value):
+    xmlcell.set(OFFICE_VALUE_TYPE, 'float')
+    xmlcell.set(OFFICE_VALUE, tostr(value))
+
+def _set_boolean(xmlcell, value):
+    xmlcell.set(OFFICE_VALUE_TYPE, 'boolean')
+    xmlcell.set(OFFICE_BOOLEAN_VALUE, 'true' if value else 'false')
+
+def _set_date(xmlcell, value):
+    xmlcell.set(OFFICE_VALUE_TYPE, 'date')
+    xmlcell.set(OFFICE_DATE_VALUE, value.isoformat())
+
+def _set_string(xmlcell, value):
+    xmlcell.set(OFFICE_VALUE_TYPE, 'string')
+    text = tostr(value)
+    if '  ' in text or '\t' in text or '\n' in text:
+        xmlcell.append(Paragraph(text).xmlnode)
+    else: # no whitespace encoding required
+        etree.SubElement(xmlcell, Paragraph.TAG).text = text
+
+_VALUE_SETTERS = {
+    bool: _set_boolean,
+    int: _set_number,
+    float: _set_number,
+    Decimal: _set_number,
+    date: _set_date,
+    datetime: _set_date,
+}
+
+def _get_value_setter(value_type):
+    try:
+        return _VALUE_SETTERS[value_type]
+    except KeyError:
+        pass
+    if issubclass(value_type, bool):
+        setter = _set_boolean
+    elif issubclass(value_type, Number):
+        setter = _set_number
+    elif issubclass(value_type, date):
+        setter = _set_date
+    else:
+        setter = _set_string
+    _VALUE_SETTERS[value_type] = setter
+    return setter
+
+def _clear_cell_value(xmlcell):
+    value_type = xmlcell.get(OFFICE_VALUE_TYPE)
+    if value_type is not None:
+        attrib = xmlcell.attrib
+        del attrib[OFFICE_VALUE_TYPE]
+        attrib.pop(TYPE_VALUE_MAP.get(value_type, OFFICE_VALUE), None)
+        if value_type == 'currency':
+            attrib.pop(OFFICE_CURRENCY, None)
+    if len(xmlcell):
+        del xmlcell[:]
+
+def set_cell_value(xmlcell, value):
+    """ Set the value of the <table:table-cell> element `xmlcell`, like
+    :meth:`Cell.set_value` but without creating a wrapper object.
+
+    The value type is determined by the type of `value`: bool -> 'boolean',
+    numbers (int, float, Decimal) -> 'float', date and datetime -> 'date' and
+    all other types -> 'string'; `None` clears the cell.
+    """
+    _clear_cell_value(xmlcell)
+    if value is not None:
+        _get_value_setter(type(value))(xmlcell, value)
+
+class CellView(object):
+    """ Read-only snapshot of a table cell: decoded value, value type, style
+    name, span as (rows, cols) tuple and covered state. Much lighter than a
+    :class:`Cell` wrapper, created by :func:`get_cell_view`.
+    """
+    __slots__ = ('value', 'value_type', 'style_name', 'span', 'covered')
+
+    def __init__(self, value, value_type, style_name, span, covered):
+        self.value = value
+        self.value_type = value_type
+        self.style_name = style_name
+        self.span = span
+        self.covered = covered
+
+    def __eq__(self, other):
+        if not isinstance(other, CellView):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def _astuple(self):
+        return (self.value, self.value_type, self.style_name, self.span, self.covered)
+
+    def __repr__(self):
+        return "CellView(value=%r, value_type=%r, style_name=%r, span=%r, covered=%r)" % \
+               self._astuple()
+
+_NO_SPAN = (1, 1)
+
+def get_cell_view(xmlcell):
+    """ Get a :class:`CellView` of the <table:table-cell> element `xmlcell`
+    without creating a wrapper object.
+    """
+    get = xmlcell.get
+    rows = get(TABLE_NUMBER_ROWS_SPANNED)
+    cols = get(TABLE_NUMBER_COLUMNS_SPANNED)
+    if rows is None and cols is None:
+        span = _NO_SPAN
+    else:
+        span = (1 if rows is None else max(1, int(rows)),
+                1 if cols is None else max(1, int(cols)))
+    return CellView(get_cell_value(xmlcell), get(OFFICE_VALUE_TYPE),
+                    get(TABLE_STYLE_NAME), span,
+                    xmlcell.tag == TABLE_COVERED_TABLE_CELL)
 
 @register_class
 class Cell(GenericWrapper):
-    CELL_ONLY_ATTRIBS = (CN('table:number-rows-spanned'),
-                         CN('table:number-columns-spanned'),
-                         CN('table:number-matrix-columns-spanned'),
-                         CN('table:number-matrix-rows-spanned'))
-
-    TAG = CN('table:table-cell')
-    style_name = StringProperty(CN('table:style-name'))
-    formula = StringProperty(CN('table:formula'))
-    protected = BooleanProperty(CN('table:protect'))
-    content_validation_name = StringProperty(CN('table:content-validation-name'))
+    __slots__ = ()
+    CELL_ONLY_ATTRIBS = (TABLE_NUMBER_ROWS_SPANNED,
+                         TABLE_NUMBER_COLUMNS_SPANNED,
+                         TABLE_NUMBER_MATRIX_COLUMNS_SPANNED,
+                         TABLE_NUMBER_MATRIX_ROWS_SPANNED)
+
+    TAG = TABLE_TABLE_CELL
+    style_name = StringProperty(TABLE_STYLE_NAME)
+    formula = StringProperty(TABLE_FORMULA)
+    protected = BooleanProperty(TABLE_PROTECT)
+    content_validation_name = StringProperty(TABLE_CONTENT_VALIDATION_NAME)
 
     def __init__(self, value=None, value_type=None, currency=None, style_name=None, xmlnode=None):
         super(Cell, self).__init__(xmlnode=xmlnode)
@@ -56,27 +223,11 @@ class Cell(GenericWrapper):
 
     @property
     def value_type(self):
-        return self.get_attr(CN('office:value-type'))
+        return self.get_attr(OFFICE_VALUE_TYPE)
 
     @property
     def value(self):
-        def convert(value, value_type):
-            if value is None:
-                pass
-            elif value_type in NUMERIC_TYPES:
-                value = float(value)
-            elif value_type == 'boolean':
-                value = True if value == 'true' else False
-            return value
-
-        t = self.value_type
-        if  t is None:
-            result = None
-        elif t == 'string':
-            result = self.plaintext()
-        else:
-            result = convert(self.xmlnode.get(TYPE_VALUE_MAP[t]), t)
-        return result
+        return get_cell_value(self.xmlnode)
 
     def set_value(self, value, value_type=None, currency=None):
 
@@ -134,10 +285,10 @@ class Cell(GenericWrapper):
         self._set_value_type(value_type)
 
         if currency and (value_type == 'currency'):
-            self.set_attr(CN('office:currency'), currency)
+            self.set_attr(OFFICE_CURRENCY, currency)
 
     def _set_value_type(self, value_type):
-        self.set_attr(CN('office:value-type'), value_type)
+        self.set_attr(OFFICE_VALUE_TYPE, value_type)
 
     def _clear_old_value(self):
         self._clear_value_attribute(self.value_type)
@@ -188,12 +339,12 @@ class Cell(GenericWrapper):
 
     @property
     def currency(self):
-        return self.xmlnode.get(CN('office:currency'))
+        return self.xmlnode.get(OFFICE_CURRENCY)
 
     @property
     def span(self):
-        rows = self.xmlnode.get(CN('table:number-rows-spanned'))
-        cols = self.xmlnode.get(CN('table:number-columns-spanned'))
+        rows = self.xmlnode.get(TABLE_NUMBER_ROWS_SPANNED)
+        cols = self.xmlnode.get(TABLE_NUMBER_COLUMNS_SPANNED)
         rows = 1 if rows is None else max(1, int(rows))
         cols = 1 if cols is None else max(1, int(cols))
         return (rows, cols)
@@ -208,25 +359,26 @@ class Cell(GenericWrapper):
             self._set_span_attributes(rows, cols)
 
     def _del_span_attributes(self):
-        del self.xmlnode.attrib[CN('table:number-rows-spanned')]
-        del self.xmlnode.attrib[CN('table:number-columns-spanned')]
+        del self.xmlnode.attrib[TABLE_NUMBER_ROWS_SPANNED]
+        del self.xmlnode.attrib[TABLE_NUMBER_COLUMNS_SPANNED]
 
     def _set_span_attributes(self, rows, cols):
-        self.xmlnode.set(CN('table:number-rows-spanned'), tostr(rows))
-        self.xmlnode.set(CN('table:number-columns-spanned'), tostr(cols))
+        self.xmlnode.set(TABLE_NUMBER_ROWS_SPANNED, tostr(rows))
+        self.xmlnode.set(TABLE_NUMBER_COLUMNS_SPANNED, tostr(cols))
 
     @property
     def covered(self):
-        return self.xmlnode.tag == CN('table:covered-table-cell')
+        return self.xmlnode.tag == TABLE_COVERED_TABLE_CELL
 
     def _set_covered(self, value):
+        # Cell and CoveredCell have the same slots layout, switching the class
+        # replaces the former instance attribute TAG
         if value:
-            self.TAG = CN('table:covered-table-cell')
-            self.xmlnode.tag = self.TAG
+            self.__class__ = CoveredCell
             self._remove_exclusive_cell_attributes()
         else:
-            self.TAG = CN('table:table-cell')
-            self.xmlnode.tag = self.TAG
+            self.__class__ = Cell
+        self.xmlnode.tag = self.TAG
 
     def _remove_exclusive_cell_attributes(self):
         for key in self.CELL_ONLY_ATTRIBS:
@@ -235,8 +387,75 @@ class Cell(GenericWrapper):
 
 @register_class
 class CoveredCell(Cell):
-    TAG = CN('table:covered-table-cell')
+    __slots__ = ()
+    TAG = TABLE_COVERED_TABLE_CELL
 
     @property
     def kind(self):
         return 'Cell'
+
+
+class RepeatedCell(Cell):
+    """ Copy-on-write wrapper of a cell inside a run of repeated rows or cells
+    of a run-length table. Reading does not touch the run, the first
+    modification calls `isolate()`, which splits the run and returns the
+    single cell element to modify. Do not modify the `xmlnode` directly.
+    """
+    # not registered, wrap() never creates this class
+    __slots__ = ('_isolate_cell', )
+
+    def __init__(self, xmlnode, isolate):
+        # bypasses __setattr__, wrappers are created for whole columns
+        object.__setattr__(self, 'xmlnode', xmlnode)
+        object.__setattr__(self, '_isolate_cell', isolate)
+
+    def _isolate(self):
+        isolate = self._isolate_cell
+        if isolate is not None:
+            object.__setattr__(self, '_isolate_cell', None)
+            object.__setattr__(self, 'xmlnode', isolate())
+
+    def __setattr__(self, name, value):
+        # property setters like style_name or text
+        self._isolate()
+        super(RepeatedCell, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        self._isolate()
+        super(RepeatedCell, self).__delattr__(name)
+
+    @property
+    def kind(self):
+        return 'Cell'
+
+    def plaintext(self):
+        return "\n".join([_plaintext(e) for e in self.xmlnode.iterchildren()
+                          if e.tag in SUPPORTED_CELL_CONTENT_TAGS])
+
+    def _set_covered(self, value):
+        # RepeatedCell has another slots layout than CoveredCell, just switch
+        # the tag
+        self._isolate()
+        if value:
+            self._remove_exclusive_cell_attributes()
+        self.xmlnode.tag = TABLE_COVERED_TABLE_CELL if value else TABLE_TABLE_CELL
+
+
+def _isolating_method(name):
+    method = getattr(Cell, name)
+    def isolating_method(self, *args, **kwargs):
+        self._isolate()
+        return method(self, *args, **kwargs)
+    isolating_method.__name__ = str(name)
+    isolating_method.__doc__ = method.__doc__
+    return isolating_method
+
+# all methods, which modify the cell or return wrappers of the cell content,
+# these wrappers could modify the content
+for _name in ('set_value', 'append_text', '_set_span', '_set_value_type',
+              '_clear_old_value', '__iter__', '__getitem__', '__setitem__',
+              '__delitem__', '__iadd__', 'insert', 'get_child', 'set_child',
+              'del_child', 'findall', 'find', 'set_attr', 'set_bool_attr',
+              'append', 'insert_before', 'remove', 'replace', 'clear'):
+    setattr(RepeatedCell, _name, _isolating_method(_name))
+del _name
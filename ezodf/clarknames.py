@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: precomputed Clark notation names of ODF tags and attributes
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Generated by gen_clarknames.py - do not edit!
+# Constant names: 'table:table-cell' -> TABLE_TABLE_CELL
+DR3D_SCENE = '{urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0}scene'
+DRAW_A = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}a'
+DRAW_CAPTION = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}caption'
+DRAW_CIRCLE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}circle'
+DRAW_CONNECTOR = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}connector'
+DRAW_CONTROL = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}control'
+DRAW_CUSTOM_SHAPE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}custom-shape'
+DRAW_ELLIPSE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}ellipse'
+DRAW_FRAME = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}frame'
+DRAW_G = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}g'
+DRAW_LINE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}line'
+DRAW_MEASURE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}measure'
+DRAW_NAME = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}name'
+DRAW_PAGE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}page'
+DRAW_PAGE_THUMBNAIL = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}page-thumbnail'
+DRAW_PATH = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}path'
+DRAW_POLYGON = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}polygon'
+DRAW_POLYLINE = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}polyline'
+DRAW_RECT = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}rect'
+DRAW_REGULAR_POLYGON = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}regular-polygon'
+GRDDL_TRANSFORMATION = '{http://www.w3.org/2003/g/data-view#}transformation'
+MANIFEST_FILE_ENTRY = '{urn:oasis:names:tc:opendocument:xmlns:manifest:1.0}file-entry'
+MANIFEST_FULL_PATH = '{urn:oasis:names:tc:opendocument:xmlns:manifest:1.0}full-path'
+MANIFEST_MANIFEST = '{urn:oasis:names:tc:opendocument:xmlns:manifest:1.0}manifest'
+MANIFEST_MEDIA_TYPE = '{urn:oasis:names:tc:opendocument:xmlns:manifest:1.0}media-type'
+MANIFEST_VERSION = '{urn:oasis:names:tc:opendocument:xmlns:manifest:1.0}version'
+META_DOCUMENT_STATISTIC = '{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}document-statistic'
+META_KEYWORD = '{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}keyword'
+META_NAME = '{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}name'
+META_USER_DEFINED = '{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}user-defined'
+META_VALUE_TYPE = '{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}value-type'
+OFFICE_AUTOMATIC_STYLES = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}automatic-styles'
+OFFICE_BODY = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}body'
+OFFICE_BOOLEAN_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}boolean-value'
+OFFICE_CHART = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}chart'
+OFFICE_CURRENCY = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}currency'
+OFFICE_DATE_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}date-value'
+OFFICE_DDE_SOURCE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}dde-source'
+OFFICE_DOCUMENT = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}document'
+OFFICE_DOCUMENT_CONTENT = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}document-content'
+OFFICE_DOCUMENT_META = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}document-meta'
+OFFICE_DOCUMENT_STYLES = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}document-styles'
+OFFICE_DRAWING = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}drawing'
+OFFICE_FONT_FACE_DECLS = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}font-face-decls'
+OFFICE_FORMS = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}forms'
+OFFICE_IMAGE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}image'
+OFFICE_MASTER_STYLES = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}master-styles'
+OFFICE_META = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}meta'
+OFFICE_MIMETYPE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}mimetype'
+OFFICE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}name'
+OFFICE_PRESENTATION = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}presentation'
+OFFICE_SCRIPTS = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}scripts'
+OFFICE_SETTINGS = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}settings'
+OFFICE_SPREADSHEET = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}spreadsheet'
+OFFICE_STRING_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}string-value'
+OFFICE_STYLES = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}styles'
+OFFICE_TARGET_FRAME_NAME = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}target-frame-name'
+OFFICE_TEXT = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}text'
+OFFICE_TIME_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}time-value'
+OFFICE_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}value'
+OFFICE_VALUE_TYPE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}value-type'
+STYLE_AUTO_UPDATE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}auto-update'
+STYLE_CLASS = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}class'
+STYLE_DATA_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}data-style-name'
+STYLE_DEFAULT_OUTLINE_LEVEL = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}default-outline-level'
+STYLE_DEFAULT_STYLE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}default-style'
+STYLE_DISPLAY_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}display-name'
+STYLE_FAMILY = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}family'
+STYLE_FONT_FACE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}font-face'
+STYLE_FOOTER_STYLE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}footer-style'
+STYLE_HEADER_STYLE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}header-style'
+STYLE_LIST_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}list-style-name'
+STYLE_MASTER_PAGE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}master-page-name'
+STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}name'
+STYLE_NEXT_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}next-style-name'
+STYLE_PAGE_LAYOUT = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}page-layout'
+STYLE_PAGE_USAGE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}page-usage'
+STYLE_PARENT_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}parent-style-name'
+STYLE_STYLE = '{urn:oasis:names:tc:opendocument:xmlns:style:1.0}style'
+TABLE_CALCULATION_SETTINGS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}calculation-settings'
+TABLE_CONSOLIDATION = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}consolidation'
+TABLE_CONTENT_VALIDATIONS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}content-validations'
+TABLE_CONTENT_VALIDATION_NAME = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}content-validation-name'
+TABLE_COVERED_TABLE_CELL = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}covered-table-cell'
+TABLE_DATABASE_RANGES = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}database-ranges'
+TABLE_DATA_PILOT_TABLES = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}data-pilot-tables'
+TABLE_DDE_LINKS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}dde-links'
+TABLE_DEFAULT_CELL_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}default-cell-style-name'
+TABLE_FORMULA = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}formula'
+TABLE_LABEL_RANGES = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}label-ranges'
+TABLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}name'
+TABLE_NAMED_EXPRESSIONS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}named-expressions'
+TABLE_NUMBER_COLUMNS_REPEATED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-columns-repeated'
+TABLE_NUMBER_COLUMNS_SPANNED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-columns-spanned'
+TABLE_NUMBER_MATRIX_COLUMNS_SPANNED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-matrix-columns-spanned'
+TABLE_NUMBER_MATRIX_ROWS_SPANNED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-matrix-rows-spanned'
+TABLE_NUMBER_ROWS_REPEATED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-rows-repeated'
+TABLE_NUMBER_ROWS_SPANNED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}number-rows-spanned'
+TABLE_PRINT = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}print'
+TABLE_PROTECT = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}protect'
+TABLE_PROTECTED = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}protected'
+TABLE_PROTECTION_KEY = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}protection-key'
+TABLE_SCENARIO = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}scenario'
+TABLE_SHAPES = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}shapes'
+TABLE_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}style-name'
+TABLE_TABLE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table'
+TABLE_TABLE_CELL = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-cell'
+TABLE_TABLE_COLUMN = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-column'
+TABLE_TABLE_COLUMNS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-columns'
+TABLE_TABLE_COLUMN_GROUP = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-column-group'
+TABLE_TABLE_HEADER_COLUMNS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-header-columns'
+TABLE_TABLE_HEADER_ROWS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-header-rows'
+TABLE_TABLE_ROW = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-row'
+TABLE_TABLE_ROWS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-rows'
+TABLE_TABLE_ROW_GROUP = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-row-group'
+TABLE_TABLE_SOURCE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}table-source'
+TABLE_TRACKED_CHANGES = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}tracked-changes'
+TABLE_VISIBILITY = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}visibility'
+TEXT_A = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}a'
+TEXT_ALPHABETICAL_INDEX = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}alphabetical-index'
+TEXT_ALPHABETICAL_INDEX_AUTO_MARK_FILE = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}alphabetical-index-auto-mark-file'
+TEXT_BIBLIOGRAPHY = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}bibliography'
+TEXT_C = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}c'
+TEXT_CHANGE = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}change'
+TEXT_CHANGE_END = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}change-end'
+TEXT_CHANGE_START = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}change-start'
+TEXT_COND_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}cond-style-name'
+TEXT_CONTINUE_NUMBERING = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}continue-numbering'
+TEXT_DDE_CONNECTION_DECLS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}dde-connection-decls'
+TEXT_H = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}h'
+TEXT_ID = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}id'
+TEXT_ILLUSTRATION_INDEX = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}illustration-index'
+TEXT_IS_LIST_HEADER = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}is-list-header'
+TEXT_LEVEL = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}level'
+TEXT_LINE_BREAK = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}line-break'
+TEXT_LIST = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}list'
+TEXT_LIST_HEADER = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}list-header'
+TEXT_LIST_ITEM = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}list-item'
+TEXT_NAME = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}name'
+TEXT_NUMBER = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}number'
+TEXT_NUMBERED_PARAGRAPH = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}numbered-paragraph'
+TEXT_OBJECT_INDEX = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}object-index'
+TEXT_OUTLINE_LEVEL = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}outline-level'
+TEXT_P = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}p'
+TEXT_PAGE_SEQUENCE = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}page-sequence'
+TEXT_PROTECTED = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}protected'
+TEXT_PROTECTION_KEY = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}protection-key'
+TEXT_RESTART_NUMBERING = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}restart-numbering'
+TEXT_S = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}s'
+TEXT_SECTION = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}section'
+TEXT_SEQUENCE_DECLS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}sequence-decls'
+TEXT_SOFT_PAGE_BREAK = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}soft-page-break'
+TEXT_SPAN = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}span'
+TEXT_START_VALUE = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}start-value'
+TEXT_STYLE_NAME = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}style-name'
+TEXT_TAB = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}tab'
+TEXT_TABLE_INDEX = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}table-index'
+TEXT_TABLE_OF_CONTENT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}table-of-content'
+TEXT_USER_FIELD_DECL = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-field-decl'
+TEXT_USER_FIELD_DECLS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-field-decls'
+TEXT_USER_FIELD_GET = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-field-get'
+TEXT_USER_FIELD_INPUT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-field-input'
+TEXT_USER_FIELD_SET = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-field-set'
+TEXT_USER_INDEX = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}user-index'
+TEXT_VARIABLE_DECL = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}variable-decl'
+TEXT_VARIABLE_DECLS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}variable-decls'
+TEXT_VARIABLE_GET = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}variable-get'
+TEXT_VARIABLE_INPUT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}variable-input'
+TEXT_VARIABLE_SET = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}variable-set'
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+XLINK_SHOW = '{http://www.w3.org/1999/xlink}show'
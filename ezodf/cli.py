@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: command line interface for batch conversions
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+from contextlib import contextmanager
+from timeit import default_timer
+
+from .compatibility import PY3, tostr
+from .const import MIMETYPES
+from .clarknames import TEXT_H, TEXT_P
+from .document import opendoc
+from .streamreader import get_mimetype, iter_sheets
+from .xmlns import wrap
+
+SPREADSHEET_MIMETYPES = (MIMETYPES['ods'], MIMETYPES['ots'])
+FLAT_XML_EXTENSIONS = ('fodt', 'fods', 'fodp', 'fodg')
+ODF_EXTENSIONS = frozenset(['.' + ext for ext in MIMETYPES] +
+                           ['.' + ext for ext in FLAT_XML_EXTENSIONS])
+# restart worker processes from time to time, releases the memory of
+# fragmented heaps after processing huge documents
+MAX_TASKS_PER_CHILD = 100
+
+
+def find_files(paths):
+    """ Get the list of (filename, relative name) tuples for `paths`,
+    directories are searched recursively for files with an OpenDocumentFormat
+    file extension. The relative name is the path relative to the searched
+    directory or the basename for files.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in ODF_EXTENSIONS:
+                        filename = os.path.join(root, name)
+                        files.append((filename, os.path.relpath(filename, path)))
+        else:
+            files.append((path, os.path.basename(path)))
+    return files
+
+
+def output_stem(filename, relname, output_dir=None):
+    """ Get the output path of the file `filename` without extension, in the
+    folder of the input file or in `output_dir` by the relative name `relname`.
+    """
+    if output_dir is None:
+        return os.path.splitext(filename)[0]
+    return os.path.join(output_dir, os.path.splitext(relname)[0])
+
+
+def _safe_name(name):
+    return re.sub(r'[^\w.-]+', '_', name, flags=re.UNICODE).strip('.') or '_'
+
+
+def _unique_name(name, used):
+    """ Get `name` or, if it is in the set `used`, `name` with the first free
+    numeric suffix like 'name-2' and add the result to `used`. Names differing
+    only in case are the same name on case insensitive file systems.
+    """
+    unique = name
+    count = 1
+    while unique.lower() in used:
+        count += 1
+        unique = '%s-%d' % (name, count)
+    used.add(unique.lower())
+    return unique
+
+
+@contextmanager
+def _output_file(path, binary=False):
+    """ Open output file `path`, the incomplete file is removed if an error
+    occurs while writing.
+    """
+    folder = os.path.dirname(path)
+    if folder and not os.path.isdir(folder):
+        try:
+            os.makedirs(folder)
+        except OSError: # created by another worker process
+            if not os.path.isdir(folder):
+                raise
+    if binary:
+        stream = open(path, 'wb')
+    else:
+        stream = io.open(path, 'w', encoding='utf-8', newline='')
+    try:
+        yield stream
+    except Exception:
+        stream.close()
+        os.remove(path)
+        raise
+    stream.close()
+
+
+def _format_value(value):
+    if value is None:
+        return ''
+    if value is True or value is False:
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float):
+        return tostr(int(value)) if value.is_integer() else repr(value)
+    return value
+
+
+def _is_spreadsheet(filename):
+    return get_mimetype(filename) in SPREADSHEET_MIMETYPES
+
+
+def _sheet_key(sheet):
+    return int(sheet) if sheet.isdigit() else sheet
+
+
+def _iter_selected_sheets(filename, options):
+    if options.sheet is None:
+        for name, rows in iter_sheets(filename):
+            yield name, rows
+        return
+    key = _sheet_key(options.sheet)
+    for index, (name, rows) in enumerate(iter_sheets(filename)):
+        if key == index or key == name:
+            yield name, rows
+            return
+    raise KeyError("sheet '%s' not found." % options.sheet)
+
+
+def _iter_paragraphs(filename):
+    """ Yields all paragraphs and headings of a non spreadsheet document as
+    wrapper objects in document order.
+    """
+    with opendoc(filename) as doc:
+        for xmlnode in doc.body.xmlnode.iter(TEXT_P, TEXT_H):
+            yield wrap(xmlnode)
+
+
+def to_csv(filename, stem, options):
+    if not _is_spreadsheet(filename):
+        raise TypeError("'%s' is not a spreadsheet document." % filename)
+    outputs = []
+    used = set() # different sheet names can have the same safe name
+    for name, rows in _iter_selected_sheets(filename, options):
+        if options.sheet is None:
+            suffix = '-%s.csv' % _unique_name(_safe_name(name), used)
+        else:
+            suffix = '.csv'
+        path = stem + suffix
+        with _output_file(path, binary=not PY3) as stream:
+            writer = csv.writer(stream)
+            for row in rows:
+                row = [_format_value(value) for value in row]
+                if not PY3:
+                    row = [value.encode('utf-8') for value in row]
+                writer.writerow(row)
+        outputs.append(path)
+    return outputs
+
+
+def to_text(filename, stem, options):
+    path = stem + '.txt'
+    with _output_file(path) as stream:
+        if _is_spreadsheet(filename):
+            for index, (name, rows) in enumerate(_iter_selected_sheets(filename, options)):
+                if index:
+                    stream.write('\n')
+                for row in rows:
+                    stream.write('\t'.join(_format_value(value) for value in row))
+                    stream.write('\n')
+        else:
+            for paragraph in _iter_paragraphs(filename):
+                stream.write(paragraph.plaintext())
+                stream.write('\n')
+    return [path]
+
+
+def _json_line(record):
+    return tostr(json.dumps(record, ensure_ascii=False)) + '\n'
+
+
+def to_jsonl(filename, stem, options):
+    path = stem + '.jsonl'
+    with _output_file(path) as stream:
+        if _is_spreadsheet(filename):
+            for name, rows in _iter_selected_sheets(filename, options):
+                for row in rows:
+                    stream.write(_json_line({'sheet': name, 'values': list(row)}))
+        else:
+            for paragraph in _iter_paragraphs(filename):
+                stream.write(_json_line({'kind': paragraph.kind,
+                                         'text': paragraph.plaintext()}))
+    return [path]
+
+
+def info(filename, stem, options):
+    mimetype = get_mimetype(filename)
+    lines = ["%s: %s" % (filename, mimetype)]
+    if mimetype in SPREADSHEET_MIMETYPES:
+        for name, rows in iter_sheets(filename):
+            nrows = ncols = 0
+            for row in rows:
+                nrows += 1
+                ncols = max(ncols, len(row))
+            lines.append("  sheet '%s': %d rows x %d columns" % (name, nrows, ncols))
+    else:
+        counts = {'Paragraph': 0, 'Heading': 0}
+        for paragraph in _iter_paragraphs(filename):
+            counts[paragraph.kind] += 1
+        lines.append("  %d paragraphs, %d headings" % (counts['Paragraph'], counts['Heading']))
+    return lines
+
+
+COMMANDS = {
+    'to-csv': to_csv,
+    'to-text': to_text,
+    'to-jsonl': to_jsonl,
+    'info': info,
+}
+
+
+def process_file(task):
+    """ Process one (command, filename, stem, options) task, `stem` is the
+    output path without extension. Returns a tuple (filename, seconds, result,
+    error), `result` is the list of output files or info lines and `error` is
+    `None` or the error message.
+    """
+    command, filename, stem, options = task
+    start = default_timer()
+    try:
+        result = COMMANDS[command](filename, stem, options)
+        error = None
+    except Exception as e:
+        result = None
+        error = "%s: %s" % (type(e).__name__, e)
+    return filename, default_timer() - start, result, error
+
+
+def run(command, files, options, jobs=1):
+    """ Process all (filename, stem) tuples of `files` by `command` across a
+    pool of `jobs` worker processes, yields the results of
+    :func:`process_file` in order of completion.
+    """
+    tasks = [(command, filename, stem, options) for filename, stem in files]
+    if jobs < 2 or len(tasks) < 2:
+        for task in tasks:
+            yield process_file(task)
+        return
+    pool = multiprocessing.Pool(min(jobs, len(tasks)), maxtasksperchild=MAX_TASKS_PER_CHILD)
+    try:
+        for result in pool.imap_unordered(process_file, tasks):
+            yield result
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _jobs(value):
+    jobs = int(value)
+    if jobs < 1:
+        raise argparse.ArgumentTypeError("job count has to be >= 1")
+    return jobs
+
+
+def create_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('paths', nargs='+', metavar='PATH',
+                        help="input file or directory, directories are searched recursively")
+    common.add_argument('-j', '--jobs', type=_jobs, default=multiprocessing.cpu_count(),
+                        help="count of worker processes, default is the CPU count")
+    common.add_argument('-q', '--quiet', action='store_true',
+                        help="report failures only")
+
+    convert = argparse.ArgumentParser(add_help=False)
+    convert.add_argument('-o', '--output-dir', default=None,
+                         help="output directory, default is the folder of the input file")
+    convert.add_argument('-s', '--sheet', default=None,
+                         help="export only this sheet of spreadsheets, name or index")
+
+    parser = argparse.ArgumentParser(prog='python -m ezodf',
+                                     description="Batch conversion of OpenDocumentFormat files.")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+    subparsers.add_parser('to-csv', parents=[common, convert],
+                          help="export sheets of spreadsheets as CSV files")
+    subparsers.add_parser('to-text', parents=[common, convert],
+                          help="export the plain text content as text file")
+    subparsers.add_parser('to-jsonl', parents=[common, convert],
+                          help="export rows or paragraphs as JSON lines file")
+    subparsers.add_parser('info', parents=[common],
+                          help="show document type and content summary")
+    return parser
+
+
+def main(argv=None):
+    """ Command line entry point, returns the exit code: 0 if all files were
+    processed successfully, else 1.
+    """
+    options = create_parser().parse_args(argv)
+    command = options.command
+    output_dir = getattr(options, 'output_dir', None)
+    if output_dir is not None and not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    files = []
+    collisions = []
+    stems = {}
+    for filename, relname in find_files(options.paths):
+        stem = output_stem(filename, relname, output_dir)
+        key = os.path.normcase(os.path.abspath(stem))
+        if command != 'info' and key in stems:
+            # parallel workers would overwrite the output of each other
+            collisions.append((filename, 0., None, "output '%s' collides with the output of "
+                               "'%s'" % (stem, stems[key])))
+        else:
+            stems[key] = filename
+            files.append((filename, stem))
+
+    failures = 0
+    start = default_timer()
+    results = itertools.chain(collisions, run(command, files, options, options.jobs))
+    for filename, seconds, result, error in results:
+        if error is not None:
+            failures += 1
+            print("%8.3fs  %s FAILED: %s" % (seconds, filename, error), file=sys.stderr)
+            continue
+        if command == 'info':
+            print('\n'.join(result))
+        if not options.quiet:
+            if command == 'info':
+                print("%8.3fs  %s" % (seconds, filename), file=sys.stderr)
+            else:
+                print("%8.3fs  %s -> %s" % (seconds, filename, ', '.join(result)), file=sys.stderr)
+    if not options.quiet or failures:
+        print("%d files, %d failed, %.3fs" % (len(files) + len(collisions), failures,
+                                              default_timer() - start),
+              file=sys.stderr)
+    return 1 if failures else 0
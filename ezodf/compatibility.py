@@ -38,6 +38,8 @@ if PY3:
     def is_stream(instance):
         return  isinstance(instance, StringIO)
 
+    from functools import lru_cache
+
 else: # PY2
     # distiguish StringIO
     from cStringIO import StringIO
@@ -82,3 +84,24 @@ else: # PY2
         return (isinstance(instance, InputType) or
                 isinstance(instance, OutputType) or
                 isinstance(instance, SlowStringIO))
+
+    def lru_cache(maxsize=128):
+        """ Simplified functools.lru_cache for functions with hashable
+        positional arguments, the cache is cleared if it is full.
+        """
+        def decorator(func):
+            cache = {}
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    if len(cache) >= maxsize:
+                        cache.clear()
+                    result = func(*args)
+                    cache[args] = result
+                    return result
+            wrapper.cache_clear = cache.clear
+            wrapper.__doc__ = func.__doc__
+            wrapper.__name__ = func.__name__
+            return wrapper
+        return decorator
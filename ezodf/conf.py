@@ -8,7 +8,8 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
-from .const import DEFAULT_MAXCOUNT, DEFAULT_TABLE_EXPAND_STRATEGY
+from .const import DEFAULT_MAXCOUNT, DEFAULT_TABLE_EXPAND_STRATEGY, DEFAULT_ELEMENT_BINDING
+from .xmlns import _class_registry
 
 class TableExpandStrategyConfig(object):
     def __init__(self):
@@ -43,7 +44,8 @@ class Config(object):
         """ Set the global Spreadsheet/Table expand strategy for repeated rows
         and columns.
 
-        :param str strategy: ``'all' | 'all_but_last' | 'all_less_maxcount'`` see :ref:`openods`
+        :param str strategy: ``'all' | 'all_but_last' | 'all_less_maxcount' | 'runlength'``
+          see :ref:`openods`
         :param 2-tuple maxcount: additional parameter for the strategy ``'all_less_maxcount'``;
           maxcount=(10, 20) means: expand all rows with a repetition parameter less 10 and
           expand all columns with a repetition parameter less 20, all rows/columns
@@ -59,5 +61,27 @@ class Config(object):
         """
         self.table_expand_strategy.reset()
 
+    def set_element_binding(self, binding):
+        """ Set the global binding of XML elements and wrapper objects like
+        :class:`Cell` or :class:`Paragraph`, affects only documents opened
+        afterwards.
+
+        :param str binding: ``'wrapper'`` creates a new wrapper object at every
+          access of an element; ``'native'`` parses documents into lxml custom
+          element classes built from the registered wrapper classes, every
+          element creates its wrapper object just once and keeps it as long as
+          the element is referenced, see :ref:`element_binding`
+
+        """
+        _class_registry.set_binding(binding)
+
+    def get_element_binding(self):
+        """ Get the current element binding, ``'wrapper'`` or ``'native'``. """
+        return _class_registry.binding
+
+    def reset_element_binding(self):
+        """ Reset the global element binding to ``'wrapper'``. """
+        _class_registry.set_binding(DEFAULT_ELEMENT_BINDING)
+
 # the real global configuration object
 config = Config()
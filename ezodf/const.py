@@ -214,3 +214,4 @@ MIMETYPE_BODYTAG_MAP = {
 
 DEFAULT_TABLE_EXPAND_STRATEGY = "all_less_maxcount"
 DEFAULT_MAXCOUNT = (32, 32)
+DEFAULT_ELEMENT_BINDING = "wrapper"
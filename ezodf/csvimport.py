@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: CSV import of tables
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import csv
+import io
+import re
+from datetime import date, datetime
+
+from .xmlns import etree
+from .clarknames import (TABLE_NAME, TABLE_TABLE, TABLE_TABLE_CELL,
+    TABLE_TABLE_COLUMN, TABLE_TABLE_ROW)
+from .compatibility import PY3, is_string
+from .cells import _get_value_setter
+from .table import Table
+
+# leading zeros like '007' are not numbers, but ids or zip codes
+NUMBER = re.compile(r'[+-]?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?\Z')
+INTEGER = re.compile(r'[+-]?(?:0|[1-9]\d*)\Z')
+ISO_DATE = re.compile(r'(\d{4})-(\d\d)-(\d\d)(?:[T ](\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?)?\Z')
+BOOLEANS = {'true': True, 'false': False}
+NUMBER_CHARS = frozenset('0123456789+-')
+BOOLEAN_CHARS = frozenset('tTfF')
+
+
+def _parse_date(match, text):
+    year, month, day, hour, minute, second, fraction = match.groups()
+    try:
+        if hour is None:
+            return date(int(year), int(month), int(day))
+        microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+        return datetime(int(year), int(month), int(day), int(hour), int(minute),
+                        int(second), microsecond)
+    except ValueError: # invalid date like '2026-02-30'
+        return text
+
+
+def infer_value(text):
+    """ Convert the CSV field `text` into a cell value: integers as int, other
+    decimal numbers as float, 'true' and 'false' (case insensitive) as bool,
+    ISO dates as date or datetime, empty fields as `None` and everything else
+    as string.
+    """
+    if not text:
+        return None
+    # dispatch by the first char, most text fields fail this test
+    first = text[0]
+    if first in NUMBER_CHARS:
+        if NUMBER.match(text):
+            return int(text) if INTEGER.match(text) else float(text)
+        match = ISO_DATE.match(text)
+        if match:
+            return _parse_date(match, text)
+    elif first in BOOLEAN_CHARS:
+        return BOOLEANS.get(text.lower(), text)
+    return text
+
+
+def _string_value(text):
+    return text if text else None
+
+
+def _open_csv(fileobj, encoding):
+    if is_string(fileobj):
+        if PY3:
+            return io.open(fileobj, 'r', encoding=encoding, newline=''), True
+        return open(fileobj, 'rb'), True
+    return fileobj, False
+
+
+def iter_csv_rows(fileobj, dialect='excel', infer_types=True, encoding='utf-8', **fmtparams):
+    """ Iterate over the rows of the CSV file `fileobj` as lists of cell
+    values, the file is read as stream.
+
+    :param fileobj: a filename or a file object opened in text mode with
+      ``newline=''``
+    :param dialect: CSV dialect, see :func:`csv.reader`
+    :param bool infer_types: convert fields by :func:`infer_value`, else all
+      fields are strings
+    :param str encoding: encoding of file `fileobj`, if it is a filename
+    :param fmtparams: formatting parameters of :func:`csv.reader`
+    """
+    convert = infer_value if infer_types else _string_value
+    stream, close = _open_csv(fileobj, encoding)
+    try:
+        for fields in csv.reader(stream, dialect, **fmtparams):
+            if not PY3:
+                fields = [field.decode(encoding) for field in fields]
+            yield [convert(field) for field in fields]
+    finally:
+        if close:
+            stream.close()
+
+
+def _build_row(values):
+    xmlrow = etree.Element(TABLE_TABLE_ROW)
+    for value in values:
+        xmlcell = etree.SubElement(xmlrow, TABLE_TABLE_CELL)
+        if value is not None: # new cells need no clearing by set_cell_value()
+            _get_value_setter(type(value))(xmlcell, value)
+    return xmlrow
+
+
+def csv_to_table(fileobj, name, dialect='excel', infer_types=True, encoding='utf-8', **fmtparams):
+    """ Returns a new :class:`Table` with the content of the CSV file
+    `fileobj`, see :meth:`Table.from_csv`.
+
+    The table is built with expanded rows, cells and columns and is not
+    normalized again at the first content access.
+    """
+    xmltable = etree.Element(TABLE_TABLE)
+    xmltable.set(TABLE_NAME, Table._normalize_sheet_name(name))
+    xmlrows = [_build_row(values) for values in
+               iter_csv_rows(fileobj, dialect, infer_types, encoding, **fmtparams)]
+    # a table requires at least one row and one cell
+    ncols = max([len(xmlrow) for xmlrow in xmlrows] or [0]) or 1
+    if not xmlrows:
+        xmlrows.append(_build_row([None]))
+
+    for _ in range(ncols):
+        etree.SubElement(xmltable, TABLE_TABLE_COLUMN)
+    for xmlrow in xmlrows:
+        # fill up short rows, a table has the same count of cells in every row
+        for _ in range(ncols - len(xmlrow)):
+            etree.SubElement(xmlrow, TABLE_TABLE_CELL)
+        xmltable.append(xmlrow)
+    table = Table(xmlnode=xmltable)
+    table._init_normalized_controllers(*Table._controller_classes())
+    return table
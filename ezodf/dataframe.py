@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: pandas DataFrame import and export of tables
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# pandas is an optional dependency and imported at the first usage
+
+import numbers
+from datetime import datetime
+
+from .xmlns import etree
+from .clarknames import (OFFICE_CURRENCY, OFFICE_DATE_VALUE, OFFICE_TIME_VALUE,
+    OFFICE_VALUE_TYPE, TABLE_NAME, TABLE_NUMBER_COLUMNS_REPEATED, TABLE_TABLE,
+    TABLE_TABLE_CELL, TABLE_TABLE_COLUMN, TABLE_TABLE_ROW)
+from .compatibility import tostr
+from .cells import get_cell_value, set_cell_value
+from .timeparser import TimeParser
+from .table import Table
+
+
+def _import_pandas():
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError("DataFrame support requires the 'pandas' package.")
+    return pandas
+
+
+def _decode_typed_value(xmlcell):
+    # like get_cell_value(), but date and time cells as datetime and timedelta
+    value_type = xmlcell.get(OFFICE_VALUE_TYPE)
+    try:
+        if value_type == 'date':
+            value = TimeParser.parse(xmlcell.get(OFFICE_DATE_VALUE))
+            if not isinstance(value, datetime):
+                value = datetime(value.year, value.month, value.day)
+            return value
+        elif value_type == 'time':
+            return TimeParser.parse(xmlcell.get(OFFICE_TIME_VALUE))
+    except (ValueError, TypeError):
+        pass # unsupported format like fractional seconds, keep the string
+    return get_cell_value(xmlcell)
+
+
+def _is_empty(values):
+    for value in values:
+        if value is not None:
+            return False
+    return True
+
+
+def _read_rows(table):
+    """ Returns all rows of `table` without trailing empty rows and columns,
+    runs of repeated rows are decoded just once.
+    """
+    rect = (0, 0, table.nrows(), table.ncols())
+    runs = list(table._cellmatrix.itervalues(rect, _decode_typed_value))
+    while runs and _is_empty(runs[-1][0]):
+        runs.pop()
+    ncols = 0
+    for values, count in runs:
+        for index in range(len(values), ncols, -1):
+            if values[index-1] is not None:
+                ncols = index
+                break
+    rows = []
+    for values, count in runs:
+        rows.extend([values[:ncols]] * count)
+    return rows, ncols
+
+
+def _column_indices(names, usecols):
+    """ Get the column indices of `usecols`, a list of column names or column
+    indices, raises ValueError for unknown columns.
+    """
+    indices = []
+    ncols = len(names)
+    for col in usecols:
+        if col in names:
+            indices.append(names.index(col))
+        elif isinstance(col, numbers.Integral) and not isinstance(col, bool) \
+                and -ncols <= col < ncols:
+            indices.append(col)
+        else:
+            raise ValueError("usecols: unknown column %r, columns are: %s" %
+                             (col, ', '.join(repr(name) for name in names)))
+    return indices
+
+
+def table_to_dataframe(table, header=True, usecols=None, dtypes=None):
+    """ Returns the content of `table` as :class:`pandas.DataFrame`, see
+    :meth:`Table.to_dataframe`.
+    """
+    pandas = _import_pandas()
+    rows, ncols = _read_rows(table)
+    if header and rows:
+        names = [('Unnamed: %d' % index) if name is None else tostr(name)
+                 for index, name in enumerate(rows.pop(0))]
+    else:
+        names = list(range(ncols))
+    indices = None if usecols is None else _column_indices(names, usecols)
+
+    columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+    if indices is not None:
+        names = [names[index] for index in indices]
+        columns = [columns[index] for index in indices]
+
+    # build by column position, a dict by name would merge repeated header names
+    dataframe = pandas.DataFrame(dict(enumerate(columns)), columns=range(len(columns)))
+    dataframe.columns = names
+    if dtypes:
+        dataframe = dataframe.astype(dtypes)
+    return dataframe
+
+
+def _column_values(series):
+    # NaN and NaT -> None, numpy scalars -> Python objects
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _build_column(ncols):
+    column = etree.Element(TABLE_TABLE_COLUMN)
+    if ncols > 1:
+        column.set(TABLE_NUMBER_COLUMNS_REPEATED, tostr(ncols))
+    return column
+
+
+def _build_row(values, currencies):
+    xmlrow = etree.Element(TABLE_TABLE_ROW)
+    for value, currency in zip(values, currencies):
+        xmlcell = etree.SubElement(xmlrow, TABLE_TABLE_CELL)
+        set_cell_value(xmlcell, value)
+        if currency and xmlcell.get(OFFICE_VALUE_TYPE) == 'float':
+            xmlcell.set(OFFICE_VALUE_TYPE, 'currency')
+            xmlcell.set(OFFICE_CURRENCY, currency)
+    return xmlrow
+
+
+def dataframe_to_table(dataframe, name, header=True, index=False, currency=None):
+    """ Returns a new :class:`Table` with the content of `dataframe`, see
+    :meth:`Sheets.from_dataframe`.
+    """
+    if index:
+        dataframe = dataframe.reset_index()
+    names = list(dataframe.columns)
+    currency = currency or {}
+    currencies = [currency.get(name) for name in names]
+    columns = [_column_values(dataframe.iloc[:, col]) for col in range(len(names))]
+
+    xmltable = etree.Element(TABLE_TABLE)
+    xmltable.set(TABLE_NAME, Table._normalize_sheet_name(name))
+    xmltable.append(_build_column(max(1, len(names))))
+    if header:
+        xmltable.append(_build_row([tostr(name) for name in names], [None] * len(names)))
+    for values in zip(*columns):
+        xmltable.append(_build_row(values, currencies))
+    if len(xmltable) == 1: # a table requires at least one row and one cell
+        xmltable.append(_build_row([None], [None]))
+    return Table(xmlnode=xmltable)
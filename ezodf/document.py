@@ -10,9 +10,10 @@ __author__ = "mozman <mozman@gmx.at>"
 import os
 from .compatibility import tostr, is_bytes, is_zipfile, StringIO, is_stream
 from .const import MIMETYPES, MIMETYPE_BODYTAG_MAP, FILE_EXT_FOR_MIMETYPE
-from .xmlns import subelement, CN, etree, wrap, ALL_NSMAP, fake_element
+from .xmlns import subelement, CN, etree, wrap, ALL_NSMAP, fake_element, parse_xml_file
 from .filemanager import FileManager
 from .bytestreammanager import ByteStreamManager
+from .mmapmanager import MMapFileManager
 from .meta import OfficeDocumentMeta
 from .styles import OfficeDocumentStyles
 from .content import OfficeDocumentContent
@@ -36,14 +37,18 @@ def is_valid_stream(buffer):
         return False
 
 
-def opendoc(filename):
+def _filemanager_class(use_mmap=False):
+    return MMapFileManager if use_mmap else FileManager
+
+
+def opendoc(filename, use_mmap=False):
     if is_stream(filename):
         fm = ByteStreamManager(filename)
     elif filename is not None:
-        fm = FileManager(filename)
+        fm = _filemanager_class(use_mmap)(filename)
     else:
         try:
-            xmlnode = etree.parse(filename).getroot()
+            xmlnode = parse_xml_file(filename).getroot()
             return FlatXMLDocument(filename=filename, xmlnode=xmlnode)
         except etree.ParseError:
             raise IOError("File '%s' is neither a zip-package nor a flat "
@@ -68,17 +73,17 @@ def __detect_mime_type(file_manager):
     return mime_type
 
 
-def newdoc(doctype="odt", filename="", template=None):
+def newdoc(doctype="odt", filename="", template=None, use_mmap=False):
     if template is None:
         mimetype = MIMETYPES[doctype]
         document = PackagedDocument(None, mimetype)
         document.docname = filename
     else:
-        document = _new_doc_from_template(filename, template)
+        document = _new_doc_from_template(filename, template, use_mmap)
     return document
 
 
-def _new_doc_from_template(filename, templatename):
+def _new_doc_from_template(filename, templatename, use_mmap=False):
     # TODO: only works with zip packaged documents
     def get_filemanager(buffer):
         if is_stream(buffer):
@@ -86,7 +91,7 @@ def _new_doc_from_template(filename, templatename):
         elif is_valid_stream(buffer):
             return ByteStreamManager(buffer)
         elif is_zipfile(buffer):
-            return FileManager(buffer)
+            return _filemanager_class(use_mmap)(buffer)
         else:
             raise IOError('File does not exist or it is not a zipfile: %s' % tostr(buffer))
 
@@ -111,17 +116,34 @@ class _BaseDocument(object):
     def __init__(self):
         self.backup = True
 
-    def saveas(self, filename):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Release all opened files and cached objects, the document is still
+        usable.
+        """
+        for container in (getattr(self, 'sheets', None), getattr(self, 'pages', None)):
+            if container is not None:
+                container.cache.clear()
+
+    def saveas(self, filename, compresslevel=None, workers=None):
         self.docname = filename
-        self.save()
+        self.save(compresslevel, workers)
 
-    def save(self):
+    def save(self, compresslevel=None, workers=None):
+        """ Save document, see :meth:`PackagedDocument.save` for the arguments
+        `compresslevel` and `workers`.
+        """
         if self.docname is None:
             raise IOError('No filename specified!')
         observer.broadcast('prepare_saving', root=self.body.get_xmlroot())
         self.meta.touch()
         self.meta.inc_editing_cycles()
-        self._saving_routine()
+        self._saving_routine(compresslevel=compresslevel, workers=workers)
         observer.broadcast('post_saving', root=self.body.get_xmlroot())
 
     @property
@@ -180,7 +202,17 @@ class FlatXMLDocument(_BaseDocument):
         application_body = subelement(office_body, bodytag)
         return wrap(application_body)
 
-    def _saving_routine(self):
+    def saveas(self, filename):
+        self.docname = filename
+        self.save()
+
+    def save(self):
+        """ Save document, flat XML documents are not compressed, therefore
+        the arguments `compresslevel` and `workers` are not supported.
+        """
+        super(FlatXMLDocument, self).save()
+
+    def _saving_routine(self, **options):
         if os.path.exists(self.docname) and self.backup:
             self._backupfile(self.docname)
         self._writefile(self.docname)
@@ -228,8 +260,13 @@ class PackagedDocument(_BaseDocument):
         self.body = self.content.get_application_body(self.application_body_tag)
         self._create_shortcuts(self.body)
 
-    def _saving_routine(self):
-        self.filemanager.save(self.docname, backup=self.backup)
+    def _saving_routine(self, compresslevel=None, workers=None):
+        self.filemanager.save(self.docname, backup=self.backup,
+                              compresslevel=compresslevel, workers=workers)
 
-    def tobytes(self):
-        return self.filemanager.tobytes()
+    def close(self):
+        super(PackagedDocument, self).close()
+        self.filemanager.close()
+
+    def tobytes(self, compresslevel=None, workers=None):
+        return self.filemanager.tobytes(compresslevel, workers)
@@ -0,0 +1,678 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: evaluation of spreadsheet formulas
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from itertools import chain
+
+from .xmlns import wrap
+from .clarknames import TABLE_FORMULA
+from .compatibility import is_string
+from .cells import get_cell_value
+from .formula import tokenize, Reference, REFERENCE, STRING
+
+# error values, written as string cells
+DIV0_ERROR = '#DIV/0!'
+VALUE_ERROR = '#VALUE!'
+REF_ERROR = '#REF!'
+NAME_ERROR = '#NAME?'
+NA_ERROR = '#N/A'
+CIRCULAR_ERROR = 'Err:522'
+
+OPERATORS = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<operator><>|<=|>=|[-+*/^&=<>%();])
+  | (?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+  | (?P<error>\#[A-Za-z0-9/!?]+)
+""", re.VERBOSE)
+
+# binary operators: precedence, lowest first
+PRECEDENCE = {
+    '=': 1, '<>': 1, '<': 1, '>': 1, '<=': 1, '>=': 1,
+    '&': 2,
+    '+': 3, '-': 3,
+    '*': 4, '/': 4,
+    '^': 5,
+}
+
+
+class FormulaError(Exception):
+    """ Error value of a formula like '#DIV/0!'. """
+    def __init__(self, code):
+        super(FormulaError, self).__init__(code)
+        self.code = code
+
+
+def _expression(formula):
+    # remove the namespace prefix like 'of:='
+    prefix, sep, expression = formula.partition('=')
+    if not sep or (prefix and ':' not in prefix):
+        raise FormulaError(NAME_ERROR)
+    return expression
+
+
+def _lex(formula):
+    """ Returns the list of (kind, value) tokens of the OpenFormula string
+    `formula`, kind is 'number', 'string', 'reference', 'operator', 'name'
+    or 'error'.
+    """
+    tokens = []
+    for kind, text in tokenize(_expression(formula)):
+        if kind == STRING:
+            tokens.append((STRING, text[1:-1].replace('""', '"')))
+        elif kind == REFERENCE:
+            reference = Reference.parse(text)
+            if reference is None:
+                raise FormulaError(REF_ERROR)
+            tokens.append((REFERENCE, reference))
+        else:
+            position = 0
+            while position < len(text):
+                match = OPERATORS.match(text, position)
+                if match is None:
+                    raise FormulaError(NAME_ERROR)
+                position = match.end()
+                kind = match.lastgroup
+                if kind == 'number':
+                    tokens.append((kind, float(match.group())))
+                elif kind != 'space':
+                    tokens.append((kind, match.group()))
+    return tokens
+
+
+class _Parser(object):
+    """ Precedence climbing parser, builds an expression tree of tuples:
+
+        ('number', float), ('string', str), ('error', str),
+        ('reference', Reference), ('call', name, [args]),
+        ('binary', operator, left, right), ('unary', operator, operand)
+    """
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        try:
+            return self.tokens[self.position]
+        except IndexError:
+            return (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, value):
+        kind, token = self.next()
+        if token != value:
+            raise FormulaError(VALUE_ERROR)
+
+    def parse(self):
+        tree = self.expression(1)
+        if self.position != len(self.tokens):
+            raise FormulaError(VALUE_ERROR)
+        return tree
+
+    def expression(self, min_precedence):
+        left = self.unary()
+        while True:
+            kind, token = self.peek()
+            precedence = PRECEDENCE.get(token, 0) if kind == 'operator' else 0
+            if precedence < min_precedence:
+                return left
+            self.next()
+            # '^' is left associative in OpenFormula
+            right = self.expression(precedence + 1)
+            left = ('binary', token, left, right)
+
+    def unary(self):
+        kind, token = self.peek()
+        if kind == 'operator' and token in ('-', '+'):
+            self.next()
+            return ('unary', token, self.unary())
+        operand = self.primary()
+        while self.peek() == ('operator', '%'):
+            self.next()
+            operand = ('unary', '%', operand)
+        return operand
+
+    def primary(self):
+        kind, token = self.next()
+        if kind in ('number', STRING, REFERENCE, 'error'):
+            return (kind, token)
+        if kind == 'operator' and token == '(':
+            tree = self.expression(1)
+            self.expect(')')
+            return tree
+        if kind == 'name':
+            name = token.upper()
+            if self.peek() == ('operator', '('):
+                self.next()
+                return ('call', name, self.arguments())
+            if name in ('TRUE', 'FALSE'):
+                return ('call', name, [])
+        raise FormulaError(NAME_ERROR if kind == 'name' else VALUE_ERROR)
+
+    def arguments(self):
+        args = []
+        if self.peek() == ('operator', ')'):
+            self.next()
+            return args
+        while True:
+            args.append(self.expression(1))
+            kind, token = self.next()
+            if token == ')':
+                return args
+            if token != ';':
+                raise FormulaError(VALUE_ERROR)
+
+
+def parse_expression(formula):
+    """ Parse the OpenFormula string `formula` like ``'of:=[.A1]*2'`` into an
+    expression tree, raises :class:`FormulaError` for invalid formulas.
+    """
+    return _Parser(_lex(formula)).parse()
+
+
+class _Range(object):
+    """ Evaluated cell range, `rows` is a list of rows of cell values. """
+    __slots__ = ('rows', )
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def values(self):
+        for row in self.rows:
+            for value in row:
+                yield value
+
+
+def _to_number(value):
+    if value is None:
+        return 0.
+    if isinstance(value, bool):
+        return 1. if value else 0.
+    if isinstance(value, float):
+        return value
+    if is_string(value):
+        try:
+            return float(value)
+        except ValueError:
+            raise FormulaError(VALUE_ERROR)
+    return float(value)
+
+
+def _to_string(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float):
+        return ('%.15g' % value)
+    return value
+
+
+def _to_bool(value):
+    if is_string(value):
+        raise FormulaError(VALUE_ERROR)
+    return bool(_to_number(value))
+
+
+def _compare(operator, left, right):
+    if left is None:
+        left = '' if is_string(right) else 0.
+    if right is None:
+        right = '' if is_string(left) else 0.
+    if is_string(left) and is_string(right):
+        left, right = left.lower(), right.lower()
+    elif is_string(left) or is_string(right):
+        # numbers are less than strings
+        if operator in ('=', '<>'):
+            return operator == '<>'
+        left, right = is_string(left), is_string(right)
+    if operator == '=':
+        return left == right
+    if operator == '<>':
+        return left != right
+    if operator == '<':
+        return left < right
+    if operator == '>':
+        return left > right
+    if operator == '<=':
+        return left <= right
+    return left >= right
+
+
+def _numbers(args, strict=True):
+    # numbers of ranges, ignores strings, booleans and empty cells in
+    # ranges; direct arguments are converted
+    for arg in args:
+        if isinstance(arg, _Range):
+            for value in arg.values():
+                if isinstance(value, float):
+                    yield value
+        elif strict:
+            yield _to_number(arg)
+        elif isinstance(arg, float):
+            yield arg
+
+
+def _sum(args):
+    return sum(_numbers(args))
+
+def _average(args):
+    numbers = list(_numbers(args))
+    if not numbers:
+        raise FormulaError(DIV0_ERROR)
+    return sum(numbers) / len(numbers)
+
+def _min(args):
+    numbers = list(_numbers(args))
+    return min(numbers) if numbers else 0.
+
+def _max(args):
+    numbers = list(_numbers(args))
+    return max(numbers) if numbers else 0.
+
+def _count(args):
+    return float(len(list(_numbers(args, strict=False))))
+
+def _vlookup(args):
+    if not 3 <= len(args) <= 4:
+        raise FormulaError(VALUE_ERROR)
+    value, table, column = args[:3]
+    sorted_ = _to_bool(args[3]) if len(args) == 4 else True
+    if not isinstance(table, _Range) or isinstance(value, _Range):
+        raise FormulaError(VALUE_ERROR)
+    column = int(_to_number(column))
+    if column < 1:
+        raise FormulaError(VALUE_ERROR)
+    if column > len(table.rows[0]):
+        raise FormulaError(REF_ERROR)
+    found = None
+    for row in table.rows:
+        key = row[0]
+        if key is None:
+            continue
+        if sorted_:
+            if is_string(key) != is_string(value):
+                continue
+            if _compare('<=', key, value):
+                found = row
+            else:
+                break
+        elif _compare('=', key, value) and is_string(key) == is_string(value):
+            found = row
+            break
+    if found is None:
+        raise FormulaError(NA_ERROR)
+    return found[column - 1]
+
+FUNCTIONS = {
+    'SUM': _sum,
+    'AVERAGE': _average,
+    'MIN': _min,
+    'MAX': _max,
+    'COUNT': _count,
+    'VLOOKUP': _vlookup,
+    'TRUE': lambda args: True,
+    'FALSE': lambda args: False,
+}
+
+
+class _Formula(object):
+    """ Formula cell of the dependency graph. """
+    __slots__ = ('key', 'tree', 'error', 'cells', 'ranges')
+
+    def __init__(self, key, text):
+        self.key = key
+        self.error = None
+        self.cells = [] # referenced cells as keys
+        self.ranges = [] # referenced ranges as (sheet, top, left, bottom, right)
+        try:
+            self.tree = parse_expression(text)
+        except FormulaError as error:
+            self.tree = None
+            self.error = error.code
+
+
+class _IntervalIndex(object):
+    """ Index of the intervals [start, stop) of row or column indices, finds
+    the intervals containing an index without checking all intervals: the
+    intervals are grouped by length in classes of powers of 2, and only the
+    intervals starting near the index are checked in each class.
+    """
+    __slots__ = ('_classes', )
+
+    def __init__(self):
+        self._classes = defaultdict(list) # length class -> sorted [(start, stop, item)]
+
+    def add(self, start, stop, item):
+        self._classes[(stop - start).bit_length() - 1].append((start, stop, item))
+
+    def sort(self):
+        for intervals in self._classes.values():
+            intervals.sort()
+
+    def find(self, index):
+        """ Yields the items of all intervals containing `index`. """
+        for length_class, intervals in self._classes.items():
+            # intervals of this class are shorter than 2**(length_class+1)
+            first = bisect_left(intervals, (index + 2 - (2 << length_class), ))
+            last = bisect_left(intervals, (index + 1, ))
+            for start, stop, item in intervals[first:last]:
+                if index < stop:
+                    yield item
+
+
+class Evaluator(object):
+    """ Evaluates the formulas of a spreadsheet document and writes the results
+    as cached cell values, supports arithmetic, comparison and concatenation
+    operators and the functions SUM, AVERAGE, MIN, MAX, COUNT, IF, VLOOKUP,
+    TRUE and FALSE.
+
+    The dependency graph of the formula cells is built at the construction,
+    call :meth:`update` after adding formulas or inserting/deleting rows or
+    columns.
+
+    :param sheets: :class:`Sheets` object of a spreadsheet document or a
+      list of :class:`Table` objects
+    """
+    def __init__(self, sheets):
+        self._tables = dict((table.name, table) for table in sheets)
+        self.update()
+
+    def update(self):
+        """ Rebuild the dependency graph, all formulas are dirty afterwards. """
+        self._formulas = {} # key -> _Formula, key is (sheet, row, col)
+        self._formula_rows = defaultdict(list) # (sheet, col) -> sorted rows of formulas
+        self._cell_dependents = defaultdict(set) # key -> formula keys
+        # ranges are indexed by their shorter side: each column of a tall range
+        # indexes its row interval, each row of a wide range its column interval
+        self._column_ranges = defaultdict(_IntervalIndex) # (sheet, col) -> row intervals
+        self._row_ranges = defaultdict(_IntervalIndex) # (sheet, row) -> column intervals
+        for name, table in self._tables.items():
+            self._collect_formulas(name, table)
+        for rows in self._formula_rows.values():
+            rows.sort()
+        for formula in self._formulas.values():
+            self._link(formula)
+        for index in chain(self._column_ranges.values(), self._row_ranges.values()):
+            index.sort()
+        self._dirty = set(self._formulas)
+
+    def _collect_formulas(self, name, table):
+        rect = (0, 0, table.nrows(), table.ncols())
+        decode = lambda xmlcell: xmlcell.get(TABLE_FORMULA)
+        row = 0
+        for texts, count in table._cellmatrix.itervalues(rect, decode):
+            for col, text in enumerate(texts):
+                if text is None:
+                    continue
+                for index in range(row, row + count):
+                    key = (name, index, col)
+                    self._formulas[key] = _Formula(key, text)
+                    self._formula_rows[(name, col)].append(index)
+            row += count
+
+    def _link(self, formula):
+        def walk(tree):
+            kind = tree[0]
+            if kind == REFERENCE:
+                add_reference(tree[1])
+            elif kind == 'call':
+                for arg in tree[2]:
+                    walk(arg)
+            elif kind == 'binary':
+                walk(tree[2])
+                walk(tree[3])
+            elif kind == 'unary':
+                walk(tree[2])
+
+        def add_reference(reference):
+            try:
+                sheet, rect = self._resolve(formula.key[0], reference)
+            except FormulaError:
+                return
+            top, left, bottom, right = rect
+            if reference.end is None:
+                key = (sheet, top, left)
+                formula.cells.append(key)
+                self._cell_dependents[key].add(formula.key)
+            else:
+                formula.ranges.append((sheet, ) + rect)
+                if right - left <= bottom - top:
+                    for col in range(left, right):
+                        self._column_ranges[(sheet, col)].add(top, bottom, formula.key)
+                else:
+                    for row in range(top, bottom):
+                        self._row_ranges[(sheet, row)].add(left, right, formula.key)
+
+        if formula.tree is not None:
+            walk(formula.tree)
+
+    def _resolve(self, owner, reference):
+        # returns (sheet name, (top, left, bottom, right)), exclusive bottom/right
+        start_sheet, end_sheet = reference.sheets(owner)
+        if start_sheet != end_sheet or start_sheet not in self._tables:
+            raise FormulaError(REF_ERROR)
+        table = self._tables[start_sheet]
+        start = reference.start
+        end = reference.end or start
+        top = 0 if start.row is None else start.row
+        left = 0 if start.column is None else start.column
+        bottom = table.nrows() - 1 if end.row is None else end.row
+        right = table.ncols() - 1 if end.column is None else end.column
+        top, bottom = min(top, bottom), max(top, bottom)
+        left, right = min(left, right), max(left, right)
+        if bottom >= table.nrows() or right >= table.ncols():
+            raise FormulaError(REF_ERROR)
+        return start_sheet, (top, left, bottom + 1, right + 1)
+
+    def _formulas_in_range(self, sheet, top, left, bottom, right):
+        for col in range(left, right):
+            rows = self._formula_rows.get((sheet, col))
+            if rows:
+                for row in rows[bisect_left(rows, top):bisect_right(rows, bottom - 1)]:
+                    yield (sheet, row, col)
+
+    def _precedents(self, formula):
+        """ Formula cells referenced by `formula`. """
+        for key in formula.cells:
+            if key in self._formulas:
+                yield key
+        for sheet, top, left, bottom, right in formula.ranges:
+            for key in self._formulas_in_range(sheet, top, left, bottom, right):
+                yield key
+
+    def _dependents(self, key):
+        """ Formula cells referencing the cell `key`. """
+        sheet, row, col = key
+        result = set(self._cell_dependents.get(key, ()))
+        index = self._column_ranges.get((sheet, col))
+        if index is not None:
+            result.update(index.find(row))
+        index = self._row_ranges.get((sheet, row))
+        if index is not None:
+            result.update(index.find(col))
+        return result
+
+    def mark_dirty(self, sheet, pos):
+        """ Mark the cell `pos` of sheet `sheet` as changed, all depending
+        formulas are recalculated by the next :meth:`recalculate` call.
+        """
+        self._dirty.add((sheet, ) + tuple(pos))
+
+    def set_value(self, sheet, pos, value):
+        """ Set the value of the cell `pos` (row, col) of sheet `sheet` by
+        :meth:`Cell.set_value` and mark the cell as dirty.
+        """
+        self._cell(sheet, pos).set_value(value)
+        self.mark_dirty(sheet, pos)
+
+    def recalculate(self):
+        """ Evaluate all dirty formulas and all formulas depending on dirty
+        cells in dependency order, returns the count of evaluated formulas.
+        """
+        keys = self._dirty_formulas()
+        self._dirty = set()
+        order, cyclic = self._topological_order(keys)
+        for key in order:
+            self._evaluate(self._formulas[key])
+        for key in cyclic:
+            self._formulas[key].error = CIRCULAR_ERROR
+            self._write(key, CIRCULAR_ERROR)
+        return len(order) + len(cyclic)
+
+    def recalculate_all(self):
+        """ Evaluate all formulas. """
+        self._dirty = set(self._formulas)
+        return self.recalculate()
+
+    def _dirty_formulas(self):
+        result = set()
+        queue = deque(self._dirty)
+        while queue:
+            key = queue.popleft()
+            if key in self._formulas:
+                result.add(key)
+            for dependent in self._dependents(key):
+                if dependent not in result:
+                    result.add(dependent)
+                    queue.append(dependent)
+        return result
+
+    def _topological_order(self, keys):
+        # Kahn's algorithm, returns (ordered keys, keys of cycles)
+        indegree = dict.fromkeys(keys, 0)
+        dependents = defaultdict(list)
+        for key in keys:
+            for precedent in set(self._precedents(self._formulas[key])):
+                if precedent in indegree:
+                    indegree[key] += 1
+                    dependents[precedent].append(key)
+        queue = deque(sorted(key for key, count in indegree.items() if count == 0))
+        order = []
+        while queue:
+            key = queue.popleft()
+            order.append(key)
+            for dependent in dependents[key]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        cyclic = sorted(key for key, count in indegree.items() if count > 0)
+        return order, cyclic
+
+    def _evaluate(self, formula):
+        if formula.tree is None:
+            value = formula.error
+        else:
+            try:
+                value = self._eval(formula.tree, formula.key[0])
+                if isinstance(value, _Range):
+                    value = self._single_value(value)
+                if value is None:
+                    value = 0.
+                formula.error = None
+            except FormulaError as error:
+                value = formula.error = error.code
+        self._write(formula.key, value)
+
+    @staticmethod
+    def _single_value(cells):
+        if len(cells.rows) == 1 and len(cells.rows[0]) == 1:
+            return cells.rows[0][0]
+        raise FormulaError(VALUE_ERROR)
+
+    def _cell(self, sheet, pos):
+        return wrap(self._tables[sheet]._cellmatrix.get_cell(pos))
+
+    def _write(self, key, value):
+        sheet, row, col = key
+        self._cell(sheet, (row, col)).set_value(value)
+
+    def _eval(self, tree, owner):
+        kind = tree[0]
+        if kind in ('number', STRING):
+            return tree[1]
+        if kind == 'error':
+            raise FormulaError(tree[1])
+        if kind == REFERENCE:
+            return self._read(owner, tree[1])
+        if kind == 'call':
+            return self._call(tree[1], tree[2], owner)
+        if kind == 'unary':
+            operand = self._scalar(tree[2], owner)
+            if tree[1] == '-':
+                return -_to_number(operand)
+            if tree[1] == '%':
+                return _to_number(operand) / 100.
+            return _to_number(operand)
+        operator = tree[1]
+        left = self._scalar(tree[2], owner)
+        right = self._scalar(tree[3], owner)
+        if operator in ('=', '<>', '<', '>', '<=', '>='):
+            return _compare(operator, left, right)
+        if operator == '&':
+            return _to_string(left) + _to_string(right)
+        left, right = _to_number(left), _to_number(right)
+        if operator == '+':
+            return left + right
+        if operator == '-':
+            return left - right
+        if operator == '*':
+            return left * right
+        if operator == '/':
+            if right == 0.:
+                raise FormulaError(DIV0_ERROR)
+            return left / right
+        try:
+            return float(left ** right)
+        except (ZeroDivisionError, OverflowError, TypeError):
+            raise FormulaError(VALUE_ERROR)
+
+    def _scalar(self, tree, owner):
+        value = self._eval(tree, owner)
+        if isinstance(value, _Range):
+            value = self._single_value(value)
+        return value
+
+    def _call(self, name, args, owner):
+        if name == 'IF': # lazy evaluation
+            if not 1 <= len(args) <= 3:
+                raise FormulaError(VALUE_ERROR)
+            if _to_bool(self._scalar(args[0], owner)):
+                return self._eval(args[1], owner) if len(args) > 1 else True
+            return self._eval(args[2], owner) if len(args) > 2 else False
+        try:
+            function = FUNCTIONS[name]
+        except KeyError:
+            raise FormulaError(NAME_ERROR)
+        return function([self._eval(arg, owner) for arg in args])
+
+    def _read(self, owner, reference):
+        sheet, rect = self._resolve(owner, reference)
+        self._check_errors(sheet, rect)
+        rows = []
+        cellmatrix = self._tables[sheet]._cellmatrix
+        for values, count in cellmatrix.itervalues(rect, get_cell_value):
+            rows.extend([values] * count)
+        if reference.end is None:
+            return rows[0][0]
+        return _Range(rows)
+
+    def _check_errors(self, sheet, rect):
+        # referenced formulas with error values raise their errors
+        top, left, bottom, right = rect
+        for key in self._formulas_in_range(sheet, top, left, bottom, right):
+            error = self._formulas[key].error
+            if error is not None:
+                raise FormulaError(error)
@@ -8,17 +8,35 @@ from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
 import os
+import copy
+import zlib
+import struct
 import zipfile
 import random
 from datetime import datetime
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError: # Python 2 without the 'futures' backport
+    ThreadPoolExecutor = None
 
-from .xmlns import etree, CN
+from .xmlns import etree, CN, parse_xml
 from .manifest import Manifest
 from .compatibility import tobytes, bytes2unicode, is_bytes, is_zipfile
 from .compatibility import is_stream, StringIO
 
 FNCHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
 
+# zip-file format details, see also the zipfile module
+ENCRYPTED_FLAG = 0x01
+DATA_DESCRIPTOR_FLAG = 0x08
+FH_FILENAME_LENGTH = 10
+FH_EXTRA_FIELD_LENGTH = 11
+RAW_COPY_CHUNK_SIZE = 1 << 20
+# private attributes of ZipFile used by write_raw_member(), without these
+# attributes (Python 2, other implementations) the public ZipFile.writestr()
+# is used
+ZIPFILE_INTERNALS = ('fp', 'filelist', 'NameToInfo', '_writecheck', '_didModify', 'start_dir')
+
 class FileObject(object):
     __slots__ = ['element', 'media_type', 'zipinfo']
 
@@ -46,10 +64,22 @@ class FileManager(object):
     def __init__(self, zipname=None):
         self.directory = dict()
         self.zipname = zipname
+        self._zipfile = None
+        self._bytestream = None
+        self._members = frozenset()
         self.manifest = Manifest(self.get_bytes('META-INF/manifest.xml'))
         self.register('META-INF/manifest.xml', self.manifest, 'text/xml')
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def has_zip(self):
+        return self._get_zipfile() is not None
+
+    def _zipfile_available(self):
         if self.zipname is not None:
             return is_zipfile(self.zipname)
         return False
@@ -57,6 +87,30 @@ class FileManager(object):
     def _open_bytestream(self):
         return open(self.zipname, 'rb')
 
+    def _get_zipfile(self):
+        """ Returns the opened zip-package or None, the zip-package is opened
+        at the first request and stays open until :meth:`close` is called.
+        """
+        if self._zipfile is None and self._zipfile_available():
+            bytestream = self._open_bytestream()
+            try:
+                self._zipfile = zipfile.ZipFile(bytestream, 'r')
+            except:
+                bytestream.close()
+                raise
+            self._bytestream = bytestream
+            self._members = frozenset(self._zipfile.namelist())
+        return self._zipfile
+
+    def close(self):
+        """ Close the zip-package, it will be reopened if required. """
+        if self._zipfile is not None:
+            self._zipfile.close()
+            self._bytestream.close()
+        self._zipfile = None
+        self._bytestream = None
+        self._members = frozenset()
+
     def tmpfilename(self, basefile=None):
         def randomname(count):
             return ''.join(random.sample(FNCHARS, count))
@@ -75,7 +129,7 @@ class FileManager(object):
         #     self.manifest.add(name, media_type)
         self.manifest.add(name, media_type)
 
-    def save(self, filename, backup=True):
+    def save(self, filename, backup=True, compresslevel=None, workers=None):
         # always create a new zipfile
         write_to_memory = False
         if is_stream(filename):
@@ -85,13 +139,15 @@ class FileManager(object):
         else:
             tmpfilename = self.tmpfilename(filename)
         zippo = zipfile.ZipFile(tmpfilename, 'w', zipfile.ZIP_DEFLATED)
-        self._tozip(zippo)
+        self._tozip(zippo, compresslevel, workers)
         zippo.close()
 
         if write_to_memory:
             # job done
             return
 
+        # release the source zip-package, reopened on demand from new location
+        self.close()
         if os.path.exists(filename):
             if backup:
                 # existing document becomes the backup file
@@ -110,17 +166,10 @@ class FileManager(object):
 
     def get_bytes(self, filename):
         """ Returns a byte stream or None. """
-        filecontent = None
-        if self.has_zip():
-            bytestream = self._open_bytestream()
-            zipfile_ = zipfile.ZipFile(bytestream, 'r')
-            try:
-                filecontent = zipfile_.read(filename)
-            except KeyError:
-                pass
-            zipfile_.close()
-            bytestream.close()
-        return filecontent
+        zipfile_ = self._get_zipfile()
+        if zipfile_ is not None and filename in self._members:
+            return zipfile_.read(filename)
+        return None
 
     def get_text(self, filename, default=None):
         """ Retuns a str or 'default'. """
@@ -133,57 +182,177 @@ class FileManager(object):
     def get_xml_element(self, filename):
         filecontent = self.get_bytes(filename)
         if filecontent:
-            return etree.XML(filecontent)
+            return parse_xml(filecontent)
         else:
             return None
 
-    def _tozip(self, zippo):
+    def _tozip(self, zippo, compresslevel=None, workers=None):
+        """ Write all registered files and copy all unchanged files into the
+        zip-file `zippo`.
+
+        :param compresslevel: zlib compression level `0` - `9`, `0` stores all
+          files uncompressed, `None` for the zipfile default
+        :param workers: count of threads to compress the registered files
+        """
         # mimetype file should be the first & uncompressed file in zipfile
         mimetype = self.directory.pop('mimetype')
         mimetype.zipinfo.compress_type = zipfile.ZIP_STORED
         zippo.writestr(mimetype.zipinfo, mimetype.tobytes())
         processed = [mimetype.filename]
 
-        for file in self.directory.values():
-            zippo.writestr(file.zipinfo, file.tobytes())
-            processed.append(file.filename)
+        files = list(self.directory.values())
+        if compresslevel is None and workers is None:
+            for file in files:
+                zippo.writestr(file.zipinfo, file.tobytes())
+        else:
+            self._write_compressed(zippo, files, compresslevel, workers)
+        processed.extend(file.filename for file in files)
 
         # push mimetype back to directory
         self.directory['mimetype'] = mimetype
-        self._copy_zip_to(zippo, processed)
+        self._copy_zip_to(zippo, processed, store=(compresslevel == 0))
 
-    def _copy_zip_to(self, newzip, ignore=[]):
+    def _copy_zip_to(self, newzip, ignore=[], store=False):
         """ Copy all files like pictures and settings except the files in 'ignore'.
         """
-        if not self.has_zip():
-            return # nothing to copy
         try:
-            bytestream = self._open_bytestream()
+            origzip = self._get_zipfile()
         except IOError:
             return # nothing to copy
-
-        origzip = zipfile.ZipFile(bytestream)
-        try:
-            self._copy_from_zip_to_zip(origzip, newzip, ignore)
-        finally:
-            origzip.close()
-            bytestream.close()
+        if origzip is not None:
+            self._copy_from_zip_to_zip(origzip, newzip, ignore, store)
 
     @staticmethod
-    def _copy_from_zip_to_zip(fromzip, tozip, ignore):
+    def _copy_from_zip_to_zip(fromzip, tozip, ignore, store=False):
+        """ Copy all members except the members in `ignore`, compressed
+        members are decompressed and stored uncompressed if `store` is True,
+        else all members are copied as they are.
+        """
         for zipinfo in fromzip.filelist:
-            if zipinfo.filename not in ignore:
+            if zipinfo.filename in ignore:
+                continue
+            if store and zipinfo.compress_type != zipfile.ZIP_STORED:
+                stored = copy.copy(zipinfo)
+                stored.compress_type = zipfile.ZIP_STORED
+                tozip.writestr(stored, fromzip.read(zipinfo.filename))
+            elif raw_copy_supported(fromzip, tozip, zipinfo):
+                copy_raw_member(fromzip, tozip, zipinfo)
+            else:
                 tozip.writestr(zipinfo, fromzip.read(zipinfo.filename))
 
-    def tobytes(self):
+    @staticmethod
+    def _write_compressed(zippo, files, compresslevel, workers):
+        if compresslevel is None:
+            compresslevel = zlib.Z_DEFAULT_COMPRESSION
+        elif not 0 <= compresslevel <= 9:
+            raise ValueError("compresslevel has to be in range 0 to 9.")
+
+        # XML serialization stays in the main thread, zlib releases the GIL
+        members = [(copy.copy(file.zipinfo), file.tobytes()) for file in files]
+        if not raw_write_supported(zippo, max([len(data) for _, data in members] or [0])):
+            for zipinfo, data in members:
+                if compresslevel == 0:
+                    zipinfo.compress_type = zipfile.ZIP_STORED
+                zippo.writestr(zipinfo, data)
+            return
+
+        def compress(member):
+            return compress_member(member[0], member[1], compresslevel)
+
+        if workers is not None and workers > 1 and ThreadPoolExecutor is not None:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for (zipinfo, _), data in zip(members, executor.map(compress, members)):
+                    write_raw_member(zippo, zipinfo, [data])
+        else:
+            for member in members:
+                write_raw_member(zippo, member[0], [compress(member)])
+
+    def tobytes(self, compresslevel=None, workers=None):
         iobuffer = StringIO()
         zippo = zipfile.ZipFile(iobuffer, 'w', zipfile.ZIP_DEFLATED)
-        self._tozip(zippo)
+        self._tozip(zippo, compresslevel, workers)
         zippo.close()
         buffer = iobuffer.getvalue()
         del iobuffer
         return buffer
 
+def raw_write_supported(tozip, size=0):
+    """ True if compressed data of `size` bytes can be written into `tozip`
+    by :func:`write_raw_member`.
+    """
+    if size >= zipfile.ZIP64_LIMIT:
+        return False
+    if getattr(tozip, '_writing', False):
+        return False
+    return all(hasattr(tozip, name) for name in ZIPFILE_INTERNALS)
+
+def raw_copy_supported(fromzip, tozip, zipinfo):
+    """ True if the compressed data of member `zipinfo` can be copied from
+    `fromzip` to `tozip` as it is, without decompressing and recompressing.
+    """
+    if zipinfo.flag_bits & ENCRYPTED_FLAG:
+        return False
+    size = max(zipinfo.file_size, zipinfo.compress_size)
+    return hasattr(fromzip, 'fp') and raw_write_supported(tozip, size)
+
+def compress_member(zipinfo, data, compresslevel):
+    """ Returns the compressed `data` and sets CRC, sizes and compress_type of
+    `zipinfo`, compresslevel `0` stores the data uncompressed.
+    """
+    zipinfo.file_size = len(data)
+    zipinfo.CRC = zlib.crc32(data) & 0xffffffff
+    if compresslevel == 0:
+        zipinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zipinfo.compress_type = zipfile.ZIP_DEFLATED
+        # raw deflate stream without zlib header, as required by zip-files
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zipinfo.compress_size = len(data)
+    return data
+
+def copy_raw_member(fromzip, tozip, zipinfo):
+    """ Copy the compressed data of member `zipinfo` from `fromzip` to `tozip`,
+    check requirements by :func:`raw_copy_supported` in advance.
+    """
+    def read_compressed_data():
+        remaining = zipinfo.compress_size
+        while remaining > 0:
+            chunk = source.read(min(remaining, RAW_COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipfile("Truncated file: %s" % zipinfo.filename)
+            remaining -= len(chunk)
+            yield chunk
+
+    # the local file header can differ from the central directory entry
+    source = fromzip.fp
+    source.seek(zipinfo.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, source.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipfile("Bad magic number for file header: %s" % zipinfo.filename)
+    source.seek(header[FH_FILENAME_LENGTH] + header[FH_EXTRA_FIELD_LENGTH], 1)
+    write_raw_member(tozip, copy.copy(zipinfo), read_compressed_data())
+
+def write_raw_member(tozip, zipinfo, chunks):
+    """ Write already compressed data into the zip-file `tozip`, the attributes
+    CRC, file_size, compress_size and compress_type of `zipinfo` have to
+    describe the data, which is passed as iterable of byte strings `chunks`.
+    """
+    # sizes and CRC are known, therefore no data descriptor is required
+    zipinfo.flag_bits &= ~DATA_DESCRIPTOR_FLAG
+    if hasattr(zipinfo, '_end_offset'):
+        zipinfo._end_offset = None
+    tozip._writecheck(zipinfo)
+    tozip._didModify = True
+    target = tozip.fp
+    zipinfo.header_offset = target.tell()
+    target.write(zipinfo.FileHeader())
+    for chunk in chunks:
+        target.write(chunk)
+    tozip.filelist.append(zipinfo)
+    tozip.NameToInfo[zipinfo.filename] = zipinfo
+    tozip.start_dir = target.tell()
+
 def check_zipfile_for_oasis_validity(filename, mimetype):
     """ Checks the zipfile structure and least necessary content, but not the
     XML validity of the document.
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: OpenFormula tokenizer and reference rewriting
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import re
+from collections import defaultdict
+
+from .xmlns import etree
+from .const import ALL_NSMAP
+from .clarknames import (TABLE_COVERED_TABLE_CELL, TABLE_FORMULA, TABLE_NAME,
+    TABLE_TABLE, TABLE_TABLE_CELL)
+from .compatibility import tostr
+from .tableutils import column_index_to_name, column_name_to_index
+from .tableutils import parse_endpoint, _sheet_name
+
+STRING = 'string'
+REFERENCE = 'reference'
+OTHER = 'other'
+
+TOKENS = re.compile(r"""
+    (?P<string>"(?:[^"]|"")*")
+  | (?P<reference>\[(?:'(?:[^']|'')*'|[^\]'])*\])
+  | (?P<other>[^"\[]+|["\[])
+""", re.VERBOSE)
+
+REF_ERROR = '#REF!'
+ROW = 'row'
+COLUMN = 'column'
+
+# selecting the attributes is much faster than selecting the cells by a
+# predicate like './/table:table-cell[@table:formula]'
+FORMULA_ATTRIBUTES = etree.XPath('.//@table:formula', namespaces={'table': ALL_NSMAP['table']})
+CELL_TAGS = frozenset( (TABLE_TABLE_CELL, TABLE_COVERED_TABLE_CELL) )
+
+
+def tokenize(formula):
+    """ Split the OpenFormula string `formula` like ``'of:=SUM([.A1:.B2])'``
+    into a list of (kind, text) tuples, `kind` is 'string' for string
+    literals, 'reference' for references in brackets and 'other' for all
+    other parts. Joining all texts returns the original formula.
+    """
+    return [(match.lastgroup, match.group()) for match in TOKENS.finditer(formula)]
+
+
+class CellAddress(object):
+    """ One endpoint of a reference, `sheet` is `None` if the reference has
+    no sheet name, `column` or `row` is `None` for whole rows or columns.
+    """
+    __slots__ = ('sheet', 'sheet_text', 'column', 'abs_column', 'row', 'abs_row')
+
+    def __init__(self, sheet, sheet_text, column, abs_column, row, abs_row):
+        self.sheet = sheet
+        self.sheet_text = sheet_text
+        self.column = column
+        self.abs_column = abs_column
+        self.row = row
+        self.abs_row = abs_row
+
+    @staticmethod
+    def parse(text):
+        """ Parse one endpoint of a reference like '$Sheet1.$A$1', '.A1',
+        '.A' or '.1', returns `None` for invalid endpoints.
+        """
+        parts = parse_endpoint(text)
+        # the sheet part is required, also if empty like '.A1'
+        if parts is None or parts[0] is None:
+            return None
+        sheet_text, column, row = parts
+        abs_column = abs_row = False
+        if column is not None:
+            abs_column = column.startswith('$')
+            column = column_name_to_index(column.lstrip('$'))
+        if row is not None:
+            abs_row = row.startswith('$')
+            row = int(row.lstrip('$')) - 1
+        return CellAddress(_sheet_name(sheet_text), sheet_text, column, abs_column, row, abs_row)
+
+    def get(self, axis):
+        return self.row if axis == ROW else self.column
+
+    def replace(self, axis, value):
+        """ Returns a new address with the coordinate `axis` set to `value`. """
+        address = CellAddress(self.sheet, self.sheet_text, self.column,
+                              self.abs_column, self.row, self.abs_row)
+        if axis == ROW:
+            address.row = value
+        else:
+            address.column = value
+        return address
+
+    def __str__(self):
+        result = [self.sheet_text, '.']
+        if self.column is not None:
+            result.append('$' if self.abs_column else '')
+            result.append(column_index_to_name(self.column))
+        if self.row is not None:
+            result.append('$' if self.abs_row else '')
+            result.append(str(self.row + 1))
+        return ''.join(result)
+
+
+def _shift(value, index, count):
+    # new position of `value` after inserting (count > 0) or deleting
+    # (count < 0) rows or columns at `index`, None for deleted positions
+    if value < index:
+        return value
+    if count > 0 or value >= index - count:
+        return value + count
+    return None
+
+
+class Reference(object):
+    """ A cell or cell range reference of a formula like ``[.A1:.B5]``. """
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start, end=None):
+        self.start = start
+        self.end = end
+
+    @staticmethod
+    def parse(text):
+        """ Parse the reference token `text` including the brackets, returns
+        `None` for unsupported references like external references.
+        """
+        parts = text[1:-1].split(':')
+        if len(parts) > 2:
+            return None
+        addresses = [CellAddress.parse(part) for part in parts]
+        if None in addresses:
+            return None
+        return Reference(*addresses)
+
+    def sheets(self, owner):
+        """ Get the names of the sheets of both endpoints, `owner` is the sheet
+        name of the formula cell.
+        """
+        start = self.start.sheet or owner
+        end = start if self.end is None else (self.end.sheet or start)
+        return start, end
+
+    def shifted(self, owner, sheet, axis, index, count):
+        """ Get the reference text after inserting (count > 0) or deleting
+        (count < 0) `count` rows or columns at `index` in the sheet `sheet`;
+        returns `None` if the reference is not affected and ``'#REF!'`` if
+        the referenced cells were deleted.
+        """
+        start_sheet, end_sheet = self.sheets(owner)
+        start = self.start.get(axis)
+        new_start, start_deleted = _shift_address(start, start_sheet == sheet, index, count)
+        if self.end is None:
+            if start_deleted:
+                return REF_ERROR
+            if new_start == start:
+                return None
+            return '[%s]' % self.start.replace(axis, new_start)
+
+        end = self.end.get(axis)
+        new_end, end_deleted = _shift_address(end, end_sheet == sheet, index, count)
+        if start_deleted and end_deleted:
+            return REF_ERROR
+        # shrink ranges overlapping the deleted rows or columns
+        if start_deleted:
+            new_start = index
+        if end_deleted:
+            new_end = index - 1
+        if new_start == start and new_end == end:
+            return None
+        return '[%s:%s]' % (self.start.replace(axis, new_start),
+                            self.end.replace(axis, new_end))
+
+
+def _shift_address(value, affected, index, count):
+    # returns the tuple (new value, deleted)
+    if value is None or not affected:
+        return value, False
+    value = _shift(value, index, count)
+    return value, value is None
+
+
+class Formula(object):
+    """ Tokenized formula, immutable; use :func:`parse_formula` to get cached
+    instances.
+    """
+    __slots__ = ('text', 'tokens', 'references')
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        # (token index, Reference) tuples
+        self.references = []
+        for position, (kind, token) in enumerate(self.tokens):
+            if kind == REFERENCE:
+                reference = Reference.parse(token)
+                if reference is not None:
+                    self.references.append((position, reference))
+
+    def sheets(self, owner):
+        """ Get the set of all referenced sheet names, `owner` is the sheet
+        name of the formula cell.
+        """
+        names = set()
+        for position, reference in self.references:
+            names.update(reference.sheets(owner))
+        return names
+
+    def shifted(self, owner, sheet, axis, index, count):
+        """ Get the formula text after inserting or deleting rows or columns,
+        see :meth:`Reference.shifted`, returns `None` if no reference is
+        affected.
+        """
+        changes = {}
+        for position, reference in self.references:
+            text = reference.shifted(owner, sheet, axis, index, count)
+            if text is not None:
+                changes[position] = text
+        if not changes:
+            return None
+        return ''.join(changes.get(position, token)
+                       for position, (kind, token) in enumerate(self.tokens))
+
+
+_FORMULA_CACHE = {}
+MAX_CACHE_SIZE = 10000
+
+def parse_formula(text):
+    """ Get the :class:`Formula` of the formula string `text`, parsed formulas
+    are cached by their text.
+    """
+    try:
+        return _FORMULA_CACHE[text]
+    except KeyError:
+        if len(_FORMULA_CACHE) >= MAX_CACHE_SIZE:
+            _FORMULA_CACHE.clear()
+        formula = Formula(text)
+        _FORMULA_CACHE[text] = formula
+        return formula
+
+
+class FormulaIndex(object):
+    """ Index of all formula cells of a spreadsheet by the referenced sheets,
+    built by one scan of the XML tree; the formulas are tokenized just once
+    per distinct formula text.
+
+    :param xmlnode: <office:spreadsheet> element or a single <table:table>
+    """
+    def __init__(self, xmlnode):
+        self.xmlnode = xmlnode
+        # referenced sheet name -> list of (xmlcell, owner sheet name, Formula)
+        self._references = defaultdict(list)
+        self._build()
+
+    def _tables(self):
+        if self.xmlnode.tag == TABLE_TABLE:
+            return [self.xmlnode]
+        return self.xmlnode.iterchildren(TABLE_TABLE)
+
+    def _build(self):
+        for xmltable in self._tables():
+            owner = xmltable.get(TABLE_NAME)
+            for text in FORMULA_ATTRIBUTES(xmltable):
+                xmlcell = text.getparent()
+                if xmlcell.tag not in CELL_TAGS:
+                    continue
+                formula = parse_formula(tostr(text))
+                for sheet in formula.sheets(owner):
+                    self._references[sheet].append((xmlcell, owner, formula))
+
+    def cells(self, sheet):
+        """ Get all formula cells referencing cells of the sheet `sheet`. """
+        return [xmlcell for xmlcell, owner, formula in self._references.get(sheet, [])]
+
+    def shift_references(self, sheet, axis, index, count):
+        """ Rewrite all references to the sheet `sheet` after inserting
+        (count > 0) or deleting (count < 0) `count` rows or columns at
+        `index`, `axis` is 'row' or 'column'. References to deleted cells are
+        replaced by ``'#REF!'``. Returns the count of modified formulas.
+        """
+        modified = 0
+        done = set()
+        for xmlcell, owner, formula in self._references.get(sheet, []):
+            if xmlcell in done: # cells referencing two sheets, like 3D ranges
+                continue
+            done.add(xmlcell)
+            text = formula.shifted(owner, sheet, axis, index, count)
+            if text is not None:
+                xmlcell.set(TABLE_FORMULA, text)
+                modified += 1
+        return modified
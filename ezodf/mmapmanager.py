@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# coding:utf-8
+# Purpose: memory mapped file manager
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import mmap
+
+from .filemanager import FileManager
+
+
+class MappedFile(object):
+    """ Read-only file-like object of a memory mapped file, the file content
+    is paged in by the OS on demand and shared by all processes mapping the
+    same file.
+    """
+    def __init__(self, filename):
+        with open(filename, 'rb') as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = filename
+
+    def __len__(self):
+        return len(self._map)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self._map) - self._map.tell()
+        return self._map.read(size)
+
+    def seek(self, offset, whence=0):
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self):
+        return self._map.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._map.close()
+
+    @property
+    def closed(self):
+        return self._map.closed
+
+
+class MMapFileManager(FileManager):
+    """ Reads the zip-package from a memory mapped file, the package members
+    are read directly from the mapped file without loading the whole
+    zip-package into memory.
+    """
+    def _open_bytestream(self):
+        return MappedFile(self.zipname)
@@ -8,22 +8,61 @@ from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
 from .compatibility import tostr, is_string
-from . import wrapcache
+from .wrapcache import WrapCache
 
 class AbstractPageContainer(object):
+    """ Container of the pages or sheets of a document body.
+
+    The container keeps an index of the child elements by position and by
+    name, updated by all container methods. Direct modifications of the XML
+    tree, which change the count of body children, invalidate the index, and
+    renamed children are detected at the next lookup by name.
+
+    Every access checks the count of body children, lxml counts the children
+    for this check, so len(), lookups by index and by name are O(n) for n
+    body children, but without creating Python objects for the children.
+    """
     def __init__(self, xmlbody, childtag, nametag):
         self._childtag = childtag
         self._nametag = nametag
         self.xmlnode = xmlbody
+        # cache of the wrapped children, per container and document; never
+        # evicts, a second wrapper of a loaded table would have its own
+        # controllers and index, which are not updated by the first wrapper
+        self.cache = WrapCache(maxsize=None)
+        self._invalidate_index()
+
+    def _invalidate_index(self):
+        self._children = None # child elements in document order
+        self._names = None # name -> child element
+        self._body_size = -1 # count of body children at indexing time
+
+    def _index(self):
+        """ Get the list of all child elements, rebuilds the index if the
+        count of body children changed; counting the children is O(n) in lxml.
+        """
+        if self._children is None or self._body_size != len(self.xmlnode):
+            self._children = self.xmlnode.findall(self._childtag)
+            self._names = None
+            self._body_size = len(self.xmlnode)
+        return self._children
+
+    def _build_names(self):
+        names = {}
+        for child in self._index():
+            # first child wins for duplicate names
+            names.setdefault(child.get(self._nametag), child)
+        self._names = names
+        return names
 
     def __len__(self):
-        return len(self._xmlchildren())
+        return len(self._index())
 
     def __iter__(self):
-        return (wrapcache.wrap(child) for child in self._xmlchildren())
+        return (self.cache.wrap(child) for child in list(self._index()))
 
     def _xmlchildren(self):
-        return self.xmlnode.findall(self._childtag)
+        return list(self._index())
 
     def __getitem__(self, key):
         if isinstance(key, int):
@@ -42,7 +81,17 @@ class AbstractPageContainer(object):
             oldchild = self._child_by_name(key)
         else:
             raise TypeError('key has invalid type.')
+        moved = child.xmlnode.getparent() is self.xmlnode
         self.xmlnode.replace(oldchild.xmlnode, child.xmlnode)
+        self.cache.discard(oldchild)
+        self.cache.add(child)
+        if moved:
+            self._invalidate_index()
+        else:
+            children = self._index()
+            children[children.index(oldchild.xmlnode)] = child.xmlnode
+            self._remove_name(oldchild.xmlnode)
+            self._add_name(child.xmlnode)
 
     def __delitem__(self, key):
         if isinstance(key, int):
@@ -51,7 +100,12 @@ class AbstractPageContainer(object):
             oldchild = self._child_by_name(key)
         else:
             raise TypeError('key has invalid type.')
+        children = self._index()
         self.xmlnode.remove(oldchild.xmlnode)
+        self.cache.discard(oldchild)
+        children.remove(oldchild.xmlnode)
+        self._remove_name(oldchild.xmlnode)
+        self._body_size -= 1
 
     def __iadd__(self, other):
         self.append(other)
@@ -63,29 +117,68 @@ class AbstractPageContainer(object):
         except AttributeError:
             return False
 
+    def _add_name(self, element):
+        if self._names is not None:
+            self._names.setdefault(element.get(self._nametag), element)
+
+    def _remove_name(self, element):
+        # children with the same name are found by rebuilding the name index
+        names = self._names
+        if names is not None:
+            name = element.get(self._nametag)
+            if names.get(name) is element:
+                del names[name]
+
     def _child_by_name(self, name):
-        for child in self._xmlchildren():
-            if name == child.get(self._nametag):
-                return wrapcache.wrap(child)
-        raise KeyError("child '%s' not found." % name)
+        self._index()
+        names = self._names
+        if names is None:
+            names = self._build_names()
+        child = names.get(name)
+        if child is None or child.get(self._nametag) != name:
+            # unknown or renamed child
+            child = self._build_names().get(name)
+            if child is None:
+                raise KeyError("child '%s' not found." % name)
+        return self.cache.wrap(child)
 
     def _child_by_index(self, index):
-        sheets = list(self._xmlchildren())
-        return wrapcache.wrap(sheets[index])
+        return self.cache.wrap(self._index()[index])
 
     def append(self, child):
         if self._is_valid_child(child):
+            moved = child.xmlnode.getparent() is self.xmlnode
+            children = self._index()
             self.xmlnode.append(child.xmlnode)
+            self.cache.add(child)
+            if moved:
+                self._invalidate_index()
+            else:
+                children.append(child.xmlnode)
+                self._add_name(child.xmlnode)
+                self._body_size += 1
             return child
         else:
             raise TypeError('Unable to append: %s' % tostr(child))
 
     def names(self):
-        return (child.get(self._nametag) for child in self._xmlchildren())
+        return (child.get(self._nametag) for child in list(self._index()))
 
     def index(self, child):
         return self.xmlnode.index(child.xmlnode)
 
     def insert(self, index, child):
+        moved = child.xmlnode.getparent() is self.xmlnode
+        children = self._index()
         self.xmlnode.insert(int(index), child.xmlnode)
+        self.cache.add(child)
+        if moved:
+            self._invalidate_index()
+        else:
+            # position of the new child is the position of the next child
+            nextchild = next(child.xmlnode.itersiblings(self._childtag), None)
+            position = len(children) if nextchild is None else children.index(nextchild)
+            children.insert(position, child.xmlnode)
+            self._add_name(child.xmlnode)
+            self._body_size += 1
         return child
@@ -71,6 +71,8 @@ def IntegerWithLowerLimitProperty(name, lower_limit=0, doc=None):
     return property(getter, setter, deleter, doc)
 
 class TextNumberingMixin(object):
+    __slots__ = ()
+
     @property
     def start_value(self):
         value = self.get_attr(CN('text:start-value'))
@@ -90,6 +92,7 @@ class TextNumberingMixin(object):
         formatted_number.text = tostr(value)
 
 class TableVisibilityMixin(object):
+    __slots__ = ()
     VALID_VISIBILITY_STATES = frozenset( ('visible', 'collapse', 'filter') )
     @property
     def visibility(self):
@@ -15,3 +15,33 @@ class Sheets(AbstractPageContainer):
         super(Sheets, self).__init__(xmlbody, childtag=CN('table:table'),
                                      nametag=CN('table:name'))
 
+    def from_dataframe(self, dataframe, name=None, header=True, index=False, currency=None):
+        """ Append a new sheet with the content of the :class:`pandas.DataFrame`
+        `dataframe` and returns the new :class:`Table`.
+
+        :param str name: sheet name, default is 'Sheet' + sheet number
+        :param bool header: write the column names as first row
+        :param bool index: write the DataFrame index as first column
+        :param dict currency: maps column names to currency codes like 'EUR',
+          numerical cells of these columns become 'currency' cells
+        """
+        from .dataframe import dataframe_to_table
+        if name is None:
+            name = 'Sheet%d' % (len(self) + 1)
+        table = dataframe_to_table(dataframe, name, header=header, index=index,
+                                   currency=currency)
+        return self.append(table)
+
+    def import_csv(self, fileobj, name=None, dialect='excel', infer_types=True,
+                   encoding='utf-8', **fmtparams):
+        """ Append a new sheet with the content of the CSV file `fileobj` and
+        returns the new :class:`Table`, see :meth:`Table.from_csv`.
+
+        :param str name: sheet name, default is 'Sheet' + sheet number
+        """
+        from .csvimport import csv_to_table
+        if name is None:
+            name = 'Sheet%d' % (len(self) + 1)
+        table = csv_to_table(fileobj, name, dialect=dialect, infer_types=infer_types,
+                             encoding=encoding, **fmtparams)
+        return self.append(table)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: streaming read-only access to spreadsheet content
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import zipfile
+
+from .xmlns import etree
+from .clarknames import (OFFICE_MIMETYPE, TABLE_COVERED_TABLE_CELL, TABLE_NAME,
+    TABLE_NUMBER_COLUMNS_REPEATED, TABLE_NUMBER_ROWS_REPEATED, TABLE_TABLE,
+    TABLE_TABLE_CELL, TABLE_TABLE_ROW)
+from .compatibility import bytes2unicode, is_stream, is_string, is_zipfile
+from .cells import get_cell_value
+
+CELL_TAGS = frozenset( (TABLE_TABLE_CELL, TABLE_COVERED_TABLE_CELL) )
+
+
+def _open_content(filename):
+    """ Returns a tuple (stream, closeables), where `stream` is the 'content.xml'
+    file of zip-packaged documents or the document itself for flat XML
+    documents.
+    """
+    if is_zipfile(filename):
+        package = zipfile.ZipFile(filename)
+        stream = package.open('content.xml')
+        return stream, [stream, package]
+    if is_stream(filename):
+        filename.seek(0)
+        return filename, [] # do not close streams of the caller
+    stream = open(filename, 'rb')
+    return stream, [stream]
+
+
+def _clear_processed(element):
+    # release all processed nodes, else the tree grows with every parsed row
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _repetition(element, key):
+    count = element.get(key)
+    return 1 if count is None else int(count)
+
+
+def _decode_row(xmlrow):
+    values = []
+    empty_cells = 0
+    for xmlcell in xmlrow:
+        if xmlcell.tag not in CELL_TAGS:
+            continue
+        count = _repetition(xmlcell, TABLE_NUMBER_COLUMNS_REPEATED)
+        value = get_cell_value(xmlcell)
+        if value is None:
+            # trailing empty cells are not stored in the result
+            empty_cells += count
+        else:
+            if empty_cells:
+                values.extend([None] * empty_cells)
+                empty_cells = 0
+            values.extend([value] * count)
+    return tuple(values)
+
+
+def _iter_tables(filename):
+    """ Yields (index, name, rows) for every top level table, `rows` is an
+    iterator over (xmlrow, repetition) tuples, which has to be exhausted
+    before the next table is reached.
+    """
+    stream, closeables = _open_content(filename)
+    try:
+        index = -1
+        context = etree.iterparse(stream, events=('start', 'end'), huge_tree=True)
+
+        def iter_rows():
+            nesting = 1
+            for event, element in context:
+                tag = element.tag
+                if tag == TABLE_TABLE:
+                    nesting += 1 if event == 'start' else -1
+                    if nesting == 0:
+                        _clear_processed(element)
+                        return
+                elif event == 'end' and tag == TABLE_TABLE_ROW and nesting == 1:
+                    yield element, _repetition(element, TABLE_NUMBER_ROWS_REPEATED)
+                    _clear_processed(element)
+
+        for event, element in context:
+            if event == 'start' and element.tag == TABLE_TABLE:
+                index += 1
+                rows = iter_rows()
+                yield index, element.get(TABLE_NAME), rows
+                for _ in rows: # skip unprocessed rows
+                    pass
+    finally:
+        for closeable in closeables:
+            closeable.close()
+
+
+def get_mimetype(filename):
+    """ Get the mimetype of the document `filename` without loading the whole
+    document, returns `None` if the mimetype is unknown.
+
+    :param filename: a filename or the file-content as file-like object (`BytesIO`)
+    """
+    if is_zipfile(filename):
+        package = zipfile.ZipFile(filename)
+        try:
+            return bytes2unicode(package.read('mimetype')).strip()
+        except KeyError:
+            return None
+        finally:
+            package.close()
+    # flat XML document, the mimetype is an attribute of the root element
+    stream, closeables = _open_content(filename)
+    try:
+        for event, element in etree.iterparse(stream, events=('start', )):
+            return element.get(OFFICE_MIMETYPE)
+    finally:
+        for closeable in closeables:
+            closeable.close()
+
+
+def sheet_names(filename):
+    """ Get the names of all sheets of the spreadsheet document `filename`
+    as list, without loading the whole document.
+
+    :param filename: a filename or the file-content as file-like object (`BytesIO`)
+    """
+    return [name for index, name, rows in _iter_tables(filename)]
+
+
+def _iter_values(rows):
+    empty_rows = 0
+    for xmlrow, count in rows:
+        values = _decode_row(xmlrow)
+        if values:
+            for _ in range(empty_rows):
+                yield ()
+            empty_rows = 0
+            for _ in range(count):
+                yield values
+        else:
+            empty_rows += count
+
+
+def iter_sheets(filename):
+    """ Iterate over all sheets of the spreadsheet document `filename` in one
+    pass, without loading the whole document into memory.
+
+    Yields (name, rows) tuples, `rows` is an iterator over the rows of the
+    sheet like the result of :func:`iter_rows`, which has to be consumed
+    before the next sheet is requested, unconsumed rows are skipped.
+
+    :param filename: a filename or the file-content as file-like object (`BytesIO`)
+    """
+    for index, name, rows in _iter_tables(filename):
+        yield name, _iter_values(rows)
+
+
+def iter_rows(filename, sheet=0):
+    """ Iterate over the rows of the sheet `sheet` of the spreadsheet document
+    `filename`, without loading the whole document into memory.
+
+    Yields every row as tuple of cell values, decoded like :attr:`Cell.value`.
+    Repeated rows and cells are expanded on the fly, but trailing empty cells
+    of a row are not part of the row tuple and trailing empty rows of the
+    sheet are not yielded at all, like the tons of empty rows/columns
+    appended by desktop applications.
+
+    :param filename: a filename or the file-content as file-like object (`BytesIO`)
+    :param sheet: numerical index or name of the sheet
+    """
+    sheet_found = False
+    for index, name, rows in _iter_tables(filename):
+        if (is_string(sheet) and sheet == name) or (sheet == index):
+            sheet_found = True
+            for values in _iter_values(rows):
+                yield values
+            break
+    if not sheet_found:
+        if is_string(sheet):
+            raise KeyError("sheet '%s' not found." % sheet)
+        else:
+            raise IndexError("sheet index out of range: %d" % sheet)
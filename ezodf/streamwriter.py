@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: streaming write-only spreadsheet documents
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+import copy
+import os
+import tempfile
+import zipfile
+
+from .xmlns import CN, etree
+from .clarknames import (TABLE_NAME, TABLE_NUMBER_COLUMNS_REPEATED,
+    TABLE_TABLE, TABLE_TABLE_CELL, TABLE_TABLE_COLUMN, TABLE_TABLE_ROW)
+from .const import MIMETYPES, MIMETYPE_BODYTAG_MAP
+from .compatibility import tostr
+from .filemanager import FileObject
+from .manifest import Manifest
+from .meta import OfficeDocumentMeta
+from .styles import OfficeDocumentStyles
+from .content import OfficeDocumentContent
+from .cells import Cell, set_cell_value
+from .table import Table
+
+MARKER = 'ezodf-stream-marker'
+
+
+class FragmentSerializer(object):
+    """ Serializes elements as fragments of a document, without the namespace
+    declarations of the document root element `nsmap`.
+    """
+    def __init__(self, nsmap):
+        # the children of the container inherit its namespace declarations
+        self._container = etree.Element(TABLE_TABLE, nsmap=nsmap)
+
+    def tobytes(self, element):
+        container = self._container
+        container.append(element)
+        try:
+            data = etree.tostring(container, encoding='UTF-8', xml_declaration=False)
+        finally:
+            container.remove(element)
+        # strip the start tag and the end tag of the container
+        return data[data.index(b'>') + 1:data.rindex(b'</')]
+
+
+def split_at_end(element, parent, tobytes):
+    """ Serialize `element` by function `tobytes` and split the result at the
+    end of the content of `parent`, a (sub)element of `element`.
+    """
+    marker = etree.Comment(MARKER)
+    parent.append(marker)
+    try:
+        head, tail = tobytes(element).split(etree.tostring(marker))
+    finally:
+        parent.remove(marker)
+    return head, tail
+
+
+class SpooledContentFile(object):
+    """ Write-only temporary file, which is added to the zip-file at closing,
+    replaces ZipFile.open(mode='w') of Python 3.6 and newer.
+    """
+    def __init__(self, zippo, arcname):
+        self._zippo = zippo
+        self._arcname = arcname
+        self._file = tempfile.NamedTemporaryFile(delete=False)
+        self.write = self._file.write
+
+    def close(self):
+        self._file.close()
+        try:
+            self._zippo.write(self._file.name, self._arcname)
+        finally:
+            os.remove(self._file.name)
+
+
+def _document_bytes(xmlroot):
+    return etree.tostring(xmlroot, xml_declaration=True, encoding='UTF-8')
+
+
+class StreamingSpreadsheetWriter(object):
+    """ Write-only spreadsheet document, the rows are written immediately to
+    the 'content.xml' file of the zip-package, so the memory usage depends on
+    the size of one row and not on the size of the sheets.
+
+    The package has the same structure as the result of
+    :meth:`PackagedDocument.save` for a new spreadsheet document.
+
+    usage::
+
+        with StreamingSpreadsheetWriter('export.ods') as writer:
+            writer.add_sheet('Sheet1')
+            for row in rows:
+                writer.append_row(row)
+
+    """
+    mimetype = MIMETYPES['ods']
+
+    def __init__(self, filename):
+        """
+        :param filename: a filename or a file-like object (`BytesIO`),
+          existing files will be overwritten
+        """
+        self._zippo = zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+        self._sheet = None
+        self._closed = False
+        self._write_package_files()
+        self._content = self._write_content(self._open_content_file())
+        next(self._content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write_package_files(self):
+        meta = OfficeDocumentMeta()
+        meta.inc_editing_cycles()
+        files = [
+            FileObject('mimetype', self.mimetype),
+            FileObject('META-INF/manifest.xml', self._create_manifest(), 'text/xml'),
+            FileObject('meta.xml', meta, 'text/xml'),
+            FileObject('styles.xml', OfficeDocumentStyles(), 'text/xml'),
+        ]
+        # mimetype file should be the first & uncompressed file in zipfile
+        files[0].zipinfo.compress_type = zipfile.ZIP_STORED
+        for file in files:
+            self._zippo.writestr(file.zipinfo, file.tobytes())
+
+    def _create_manifest(self):
+        manifest = Manifest()
+        manifest.add('/', self.mimetype)
+        manifest.add('mimetype')
+        for name in ('meta.xml', 'styles.xml', 'content.xml'):
+            manifest.add(name, 'text/xml')
+        return manifest
+
+    def _open_content_file(self):
+        zipinfo = FileObject('content.xml', None).zipinfo
+        try:
+            return self._zippo.open(zipinfo, mode='w', force_zip64=True)
+        except TypeError: # Python < 3.6 can not write into zip-files
+            return SpooledContentFile(self._zippo, zipinfo.filename)
+
+    def _write_content(self, stream):
+        """ Coroutine to write the 'content.xml' file, receives `(name, ncols)`
+        tuples to start a new sheet, <table:table-row> elements to write rows
+        and `None` to close the current sheet or the document.
+        """
+        content = OfficeDocumentContent(self.mimetype)
+        body = content.get_application_body(CN(MIMETYPE_BODYTAG_MAP[self.mimetype]))
+        root = content.xmlnode
+        head, tail = split_at_end(root, body.xmlnode, _document_bytes)
+        # rows and sheets are written without the namespace declarations of
+        # the root element, xmlfile.write() would repeat them for every row
+        fragments = FragmentSerializer(root.nsmap)
+        stream.write(head)
+        while True:
+            sheet = (yield)
+            if sheet is None:
+                break
+            name, ncols = sheet
+            xmltable = etree.Element(TABLE_TABLE, {TABLE_NAME: name})
+            xmltable.append(self._build_columns(ncols))
+            table_head, table_tail = split_at_end(xmltable, xmltable, fragments.tobytes)
+            stream.write(table_head)
+            while True:
+                xmlrow = (yield)
+                if xmlrow is None:
+                    break
+                stream.write(fragments.tobytes(xmlrow))
+            stream.write(table_tail)
+        stream.write(tail)
+        stream.close()
+        yield
+
+    @staticmethod
+    def _build_columns(ncols):
+        column = etree.Element(TABLE_TABLE_COLUMN)
+        if ncols > 1:
+            column.set(TABLE_NUMBER_COLUMNS_REPEATED, tostr(ncols))
+        return column
+
+    @staticmethod
+    def _build_row(values):
+        xmlrow = etree.Element(TABLE_TABLE_ROW)
+        for value in values:
+            if isinstance(value, Cell):
+                # a copy, appending would move the cell out of its table
+                xmlrow.append(copy.deepcopy(value.xmlnode))
+            else:
+                set_cell_value(etree.SubElement(xmlrow, TABLE_TABLE_CELL), value)
+        return xmlrow
+
+    def add_sheet(self, name, ncols=None):
+        """ Start a new sheet, all following rows are written into this sheet.
+
+        :param str name: sheet name
+        :param int ncols: count of columns, if `None` the count of values of
+          the first row is used
+        """
+        self._check_closed()
+        self._close_sheet()
+        self._sheet = [Table._normalize_sheet_name(name), ncols, False]
+
+    def append_row(self, values):
+        """ Append a new row to the current sheet.
+
+        :param values: iterable of cell values, see :func:`cells.set_cell_value`,
+          `None` creates an empty cell; :class:`Cell` objects are accepted too
+        """
+        self._check_closed()
+        if self._sheet is None:
+            raise ValueError("no sheet started, call add_sheet() first.")
+        xmlrow = self._build_row(values)
+        self._start_sheet(len(xmlrow))
+        self._content.send(xmlrow)
+
+    def append_rows(self, rows):
+        """ Append all rows of the iterable `rows`. """
+        for values in rows:
+            self.append_row(values)
+
+    def import_csv(self, fileobj, name, dialect='excel', infer_types=True,
+                   encoding='utf-8', **fmtparams):
+        """ Add a new sheet `name` with the content of the CSV file `fileobj`,
+        the rows are read and written as stream, see :meth:`Table.from_csv`.
+        """
+        from .csvimport import iter_csv_rows
+        self.add_sheet(name)
+        self.append_rows(iter_csv_rows(fileobj, dialect=dialect, infer_types=infer_types,
+                                       encoding=encoding, **fmtparams))
+
+    def _start_sheet(self, ncols):
+        sheet = self._sheet
+        if sheet[2]:
+            return
+        name, count, started = sheet
+        self._content.send((name, max(1, ncols if count is None else count)))
+        sheet[2] = True
+
+    def _close_sheet(self):
+        if self._sheet is None:
+            return
+        if not self._sheet[2]: # a sheet requires at least one row
+            self.append_row([None])
+        self._content.send(None)
+        self._sheet = None
+
+    def _check_closed(self):
+        if self._closed:
+            raise ValueError("writer is closed.")
+
+    def close(self):
+        """ Finish the document and close the zip-file. """
+        if self._closed:
+            return
+        self._close_sheet()
+        self._content.send(None)
+        self._zippo.close()
+        self._closed = True
@@ -8,45 +8,81 @@ from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
 import copy
+import array
+from itertools import repeat
 
 from .compatibility import is_string
-from .xmlns import register_class, CN, wrap, etree
-from . import wrapcache
+from .xmlns import register_class, wrap, etree
+from .clarknames import (TABLE_DEFAULT_CELL_STYLE_NAME, TABLE_NAME,
+    TABLE_PRINT, TABLE_PROTECTED, TABLE_PROTECTION_KEY, TABLE_STYLE_NAME,
+    TABLE_TABLE, TABLE_TABLE_CELL, TABLE_TABLE_COLUMN, TABLE_TABLE_ROW)
 from .base import GenericWrapper
 from .protection import random_protection_key
 from .propertymixins import TableVisibilityMixin
 from .propertymixins import StringProperty, BooleanProperty
-from .tableutils import address_to_index, get_cell_index
-from .tablerowcontroller import TableRowController
-from .tablecolumncontroller import TableColumnController
+from .tableutils import (address_to_index, get_cell_index, get_cell_range,
+    parse_reference, index_to_address)
+from .cells import get_cell_value, get_cell_number, set_cell_value, get_cell_view
+from .tablerowcontroller import TableRowController, RunLengthRowController
+from .tablecolumncontroller import TableColumnController, RunLengthColumnController
 from .cellspancontroller import CellSpanController
+from .formula import FormulaIndex, ROW, COLUMN
+from .aggregation import (AGGREGATES, aggregate_runs, check_funcs, hidden_columns,
+    number_decoder)
+from .conf import config
+
+# array typecodes of numerical types
+ARRAY_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+def _is_typecode(dtype):
+    return is_string(dtype) and dtype in ARRAY_TYPECODES
+
+def _is_int_typecode(dtype):
+    return _is_typecode(dtype) and dtype not in 'fd'
 
 @register_class
 class Table(GenericWrapper):
-    TAG = CN('table:table')
-    style_name = StringProperty(CN('table:style-name'))
-    print_ = BooleanProperty(CN('table:print'))
+    TAG = TABLE_TABLE
+    style_name = StringProperty(TABLE_STYLE_NAME)
+    print_ = BooleanProperty(TABLE_PRINT)
 
     def __init__(self, name='NEWTABLE', size=(10, 10), xmlnode=None):
-        def init_attributes_by_xmlnode():
-            self._cellmatrix = TableRowController(self.xmlnode)
-            self._columns_info = TableColumnController(self.xmlnode)
-            self._cell_span_controller = CellSpanController(self._cellmatrix)
-
-        def set_new_table_metrics():
+        super(Table, self).__init__(xmlnode=xmlnode)
+        if xmlnode is None:
             self.name = name
             self._cellmatrix.reset(size)
             self._columns_info.reset(size[1])
 
-        super(Table, self).__init__(xmlnode=xmlnode)
-        init_attributes_by_xmlnode()
-        if xmlnode is None:
-            set_new_table_metrics()
-        wrapcache.add(self)
+    def __getattr__(self, name):
+        # The table content will be normalized and indexed at the first access
+        # of the cell or column controllers, this is an expensive operation
+        # and not necessary for getting just the name of the table.
+        if name in ('_cellmatrix', '_columns_info', '_cell_span_controller'):
+            self._init_controllers()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    @staticmethod
+    def _controller_classes():
+        if config.table_expand_strategy.get_strategy() == 'runlength':
+            return RunLengthRowController, RunLengthColumnController
+        return TableRowController, TableColumnController
+
+    def _init_controllers(self):
+        row_controller, column_controller = self._controller_classes()
+        self._cellmatrix = row_controller(self.xmlnode)
+        self._columns_info = column_controller(self.xmlnode)
+        self._cell_span_controller = CellSpanController(self._cellmatrix)
+
+    def is_loaded(self):
+        """ True if the table content is already normalized and indexed. """
+        return '_cellmatrix' in self.__dict__
 
     def __getitem__(self, key):
         if isinstance(key, int):
             return self.get_child(key)
+        elif is_string(key) and ':' in key:
+            return self.cell_range(key)
         else:
             return self.get_cell(get_cell_index(key))
 
@@ -58,10 +94,10 @@ class Table(GenericWrapper):
 
     @property
     def name(self):
-        return self.get_attr(CN('table:name'))
+        return self.get_attr(TABLE_NAME)
     @name.setter
     def name(self, value):
-        return self.set_attr(CN('table:name'), self._normalize_sheet_name(value))
+        return self.set_attr(TABLE_NAME, self._normalize_sheet_name(value))
 
     @staticmethod
     def _normalize_sheet_name(name):
@@ -71,12 +107,12 @@ class Table(GenericWrapper):
 
     @property
     def protected(self):
-        return self.get_bool_attr(CN('table:protected'))
+        return self.get_bool_attr(TABLE_PROTECTED)
     @protected.setter
     def protected(self, value):
-        self.set_bool_attr(CN('table:protected'), value)
+        self.set_bool_attr(TABLE_PROTECTED, value)
         if self.protected:
-            self.set_attr(CN('table:protection-key'), random_protection_key())
+            self.set_attr(TABLE_PROTECTION_KEY, random_protection_key())
 
     def nrows(self):
         """ Count of table rows. """
@@ -99,15 +135,48 @@ class Table(GenericWrapper):
         self.reset(size)
 
     def copy(self, newname=None):
+        """ Get a copy of the table named `newname`, default is 'CopyOf' + name.
+        The copy of a loaded table reuses the normalized structure and gets
+        its controllers without normalizing the table again.
+        """
         newtable = Table(xmlnode=copy.deepcopy(self.xmlnode))
+        if self.is_loaded():
+            newtable._copy_controllers(self)
         if newname is None:
             newname = 'CopyOf' + self.name
         newtable.name = newname
         return newtable
 
+    def _copy_controllers(self, source):
+        # the copy uses the same controller classes as the source, independent
+        # of the current expand strategy
+        self._init_normalized_controllers(type(source._cellmatrix), type(source._columns_info))
+
+    def _init_normalized_controllers(self, row_controller, column_controller):
+        # for tables with expanded rows, cells and columns, skips the normalization
+        self._cellmatrix = row_controller.from_normalized(self.xmlnode)
+        self._columns_info = column_controller.from_normalized(self.xmlnode)
+        self._cell_span_controller = CellSpanController(self._cellmatrix)
+
     def get_cell(self, pos):
         """ Get cell at position 'pos', where 'pos' is a tuple (row, column). """
-        return wrap(self._cellmatrix.get_cell(pos))
+        return self._cellmatrix.cell_wrapper(pos)
+
+    def get_cell_view(self, pos):
+        """ Get a read-only :class:`CellView` of the cell at position 'pos',
+        where 'pos' is a tuple (row, column) or a reference like ``'A1'``.
+        """
+        return get_cell_view(self._cellmatrix.locate_cell(get_cell_index(pos)))
+
+    def iter_cell_views(self, range=None):
+        """ Iterate over the rows of the cell range `range` (like ``'A1:C10'``,
+        `None` for the whole table), every row is a list of :class:`CellView`
+        objects. Repeated rows of run-length tables are decoded only once and
+        yielded as the same list object.
+        """
+        for views, count in self._cellmatrix.itervalues(self._get_rect(range), get_cell_view):
+            for row in repeat(views, count):
+                yield row
 
     def set_cell(self, pos, cell):
         """ Set cell at position 'pos', where 'pos' is a tuple (row, column). """
@@ -121,10 +190,194 @@ class Table(GenericWrapper):
             for icol, cell in enumerate(row):
                 yield ((irow, icol), cell)
 
+    def values(self, range=None, dtype=None, default=None):
+        """ Get the cell values of the cell range `range` as list of columns,
+        reads the XML elements directly without creating :class:`Cell` objects.
+
+        :param range: cell range like ``'A1:C10'`` or ``((0, 0), (9, 2))``,
+          `None` for the whole table
+        :param dtype: `None` returns every column as list of decoded values
+          like :attr:`Cell.value`, an :mod:`array` typecode like ``'d'``
+          returns :class:`array.array` objects and all other types are passed
+          as `dtype` to :func:`numpy.array`; both harvest only numerical cells
+          (float, percentage, currency)
+        :param default: replaces empty cells or, with `dtype`, non-numerical
+          cells; with `dtype` the default is NaN, or 0 for integer typecodes
+        """
+        rect = self._get_rect(range)
+        decode = self._value_decoder(dtype, default)
+        top, left, bottom, right = rect
+        if right - left == 1: # single column, use the column index
+            return [self._read_column(left, top, bottom, decode, dtype)]
+
+        rows = []
+        for values, count in self._cellmatrix.itervalues(rect, decode):
+            if count == 1:
+                rows.append(values)
+            else:
+                rows.extend([values] * count)
+        return [self._build_column(column, dtype) for column in zip(*rows)]
+
+    def column_values(self, index, dtype=None, default=None):
+        """ Get the cell values of column `index` (int or reference like
+        ``'B1'``) as one list, see :meth:`values` for `dtype` and `default`.
+        Uses the cached column index of the table and does not create
+        :class:`Cell` objects.
+        """
+        if is_string(index):
+            row, index = address_to_index(index)
+        if index < 0:
+            index += self.ncols()
+        if not (0 <= index < self.ncols()):
+            raise IndexError("column index out of range: %d" % index)
+        decode = self._value_decoder(dtype, default)
+        return self._read_column(index, 0, self.nrows(), decode, dtype)
+
+    def _read_column(self, index, top, bottom, decode, dtype):
+        values = []
+        for value, count in self._cellmatrix.itercolumnvalues(index, top, bottom, decode):
+            if count == 1:
+                values.append(value)
+            else:
+                values.extend([value] * count)
+        return self._build_column(values, dtype)
+
+    def aggregate(self, range=None, funcs=AGGREGATES, skip_hidden=False, skip_covered=True):
+        """ Calculate aggregates of the numerical cells (float, percentage,
+        currency) of the cell range `range` by one pass over the XML elements,
+        runs of repeated rows and cells are decoded just once. Uses numpy for
+        large ranges if installed.
+
+        :param range: cell range like ``'A1:C10'``, `None` for the whole table
+        :param funcs: sequence of aggregate names: ``'sum'``, ``'count'``,
+          ``'min'``, ``'max'`` and ``'mean'``
+        :param bool skip_hidden: ignore cells of collapsed or filtered rows
+          and columns
+        :param bool skip_covered: ignore covered cells of merged cells
+        :returns: dict of aggregate name and result, ``'min'``, ``'max'`` and
+          ``'mean'`` are `None` if there are no numerical cells
+        """
+        funcs = check_funcs(funcs)
+        rect = self._get_rect(range)
+        top, left, bottom, right = rect
+        skip_columns = ()
+        if skip_hidden:
+            skip_columns = set(index - left for index in hidden_columns(self._columns_info.iterruns(), left, right))
+        decode = number_decoder(skip_hidden, skip_covered)
+        return aggregate_runs(self._cellmatrix.itervalues(rect, decode), funcs, skip_columns)
+
+    def set_values(self, pos, rows):
+        """ Set the values of a block of cells, writes the values directly into
+        the XML elements without creating :class:`Cell` objects.
+
+        :param pos: top left cell of the block as (row, column) tuple or
+          reference like ``'A1'``
+        :param rows: iterable of rows, every row is an iterable of values, see
+          :func:`cells.set_cell_value`; raises IndexError if the block exceeds
+          the table, no cell is changed in this case
+        """
+        top, left = get_cell_index(pos)
+        if top < 0 or left < 0:
+            raise IndexError("invalid position: %s" % str(pos))
+        # check the size of the block before changing any cell
+        rows = [list(values) for values in rows]
+        if top + len(rows) > self.nrows() or \
+                any(left + len(values) > self.ncols() for values in rows):
+            raise IndexError("values at position %s exceed the table size" % str(pos))
+        get_row_cells = self._cellmatrix.get_row_cells
+        for index, values in enumerate(rows, top):
+            for xmlcell, value in zip(get_row_cells(index, left, len(values)), values):
+                set_cell_value(xmlcell, value)
+
+    def to_dataframe(self, header=True, usecols=None, dtypes=None):
+        """ Get the table content as :class:`pandas.DataFrame`, requires pandas.
+
+        :param bool header: use the first row as column names
+        :param usecols: list of column names or column indices to export,
+          raises ValueError for unknown columns
+        :param dtypes: dict of column name and dtype, see
+          :meth:`pandas.DataFrame.astype`
+        """
+        from .dataframe import table_to_dataframe
+        return table_to_dataframe(self, header=header, usecols=usecols, dtypes=dtypes)
+
+    @classmethod
+    def from_csv(cls, fileobj, name='Sheet1', dialect='excel', infer_types=True,
+                 encoding='utf-8', **fmtparams):
+        """ Create a new table with the content of a CSV file, the file is read
+        as stream and the cells are written directly into the XML elements.
+
+        :param fileobj: a filename or a file object opened in text mode with
+          ``newline=''``
+        :param str name: table name
+        :param dialect: CSV dialect, see :func:`csv.reader`
+        :param bool infer_types: convert numbers, booleans and ISO dates, else
+          all values are strings
+        :param str encoding: encoding of the file `fileobj`, if it is a filename
+        :param fmtparams: formatting parameters of :func:`csv.reader`
+        """
+        from .csvimport import csv_to_table
+        return csv_to_table(fileobj, name, dialect=dialect, infer_types=infer_types,
+                            encoding=encoding, **fmtparams)
+
+    def cell_range(self, reference):
+        """ Get a :class:`CellRange` view of the cell range `reference` like
+        ``'A1:C10'``, ``'Sheet1.$A$1:$C$10'``, ``'A:C'`` (whole columns) or
+        ``'1:3'`` (whole rows).
+        """
+        return CellRange(self, self._get_rect(reference))
+
+    def _get_rect(self, reference):
+        nrows, ncols = self.nrows(), self.ncols()
+        if reference is None:
+            return (0, 0, nrows, ncols)
+        if is_string(reference):
+            sheet, top, left, bottom, right = parse_reference(reference)
+            if sheet is not None and sheet != self.name:
+                raise ValueError("reference to another sheet: %s" % reference)
+            if top is None: # whole columns
+                top, bottom = 0, nrows - 1
+            if left is None: # whole rows
+                left, right = 0, ncols - 1
+        else:
+            (top, left), (bottom, right) = get_cell_range(reference)
+        if not (0 <= top <= bottom < nrows and 0 <= left <= right < ncols):
+            raise IndexError("invalid cell range: %s" % str(reference))
+        return (top, left, bottom + 1, right + 1)
+
+    @classmethod
+    def _value_decoder(cls, dtype, default):
+        if dtype is not None:
+            return cls._number_decoder(dtype, default)
+        if default is None:
+            return get_cell_value
+        def decode(xmlcell):
+            value = get_cell_value(xmlcell)
+            return default if value is None else value
+        return decode
+
+    @staticmethod
+    def _number_decoder(dtype, default):
+        if _is_int_typecode(dtype):
+            default = 0 if default is None else default
+            return lambda xmlcell: int(get_cell_number(xmlcell, default))
+        default = float('nan') if default is None else default
+        return lambda xmlcell: get_cell_number(xmlcell, default)
+
+    @staticmethod
+    def _build_column(values, dtype):
+        if dtype is None:
+            return list(values)
+        elif _is_typecode(dtype):
+            return array.array(str(dtype), values)
+        else:
+            import numpy
+            return numpy.array(values, dtype=dtype)
+
     def row(self, index):
         if is_string(index):
             index, column = address_to_index(index)
-        return [wrap(e) for e in self._cellmatrix.row(index)]
+        return self._cellmatrix.row_wrappers(index)
 
     def rows(self):
         for index in range(self.nrows()):
@@ -133,7 +386,7 @@ class Table(GenericWrapper):
     def column(self, index):
         if is_string(index):
             row, index = address_to_index(index)
-        return [wrap(e) for e in self._cellmatrix.column(index)]
+        return self._cellmatrix.column_wrappers(index)
 
     def columns(self):
         for index in range(self.ncols()):
@@ -153,26 +406,41 @@ class Table(GenericWrapper):
         self._cellmatrix.append_rows(count)
 
     def insert_rows(self, index, count=1):
-        # CAUTION: this will break refernces in formulas!
+        if index < 0:
+            index += self.nrows()
         self._cellmatrix.insert_rows(index, count)
+        self._shift_formula_references(ROW, index, count)
 
     def delete_rows(self, index, count=1):
-        # CAUTION: this will break refernces in formulas!
+        if index < 0:
+            index += self.nrows()
         self._cellmatrix.delete_rows(index, count)
+        self._shift_formula_references(ROW, index, -count)
 
     def append_columns(self, count=1):
         self._cellmatrix.append_columns(count)
         self._columns_info.append(count)
 
     def insert_columns(self, index, count=1):
-        # CAUTION: this will break refernces in formulas!
+        if index < 0:
+            index += self.ncols()
         self._cellmatrix.insert_columns(index, count)
         self._columns_info.insert(index, count)
+        self._shift_formula_references(COLUMN, index, count)
 
     def delete_columns(self, index, count=1):
-        # CAUTION: this will break refernces in formulas!
+        if index < 0:
+            index += self.ncols()
         self._cellmatrix.delete_columns(index, count)
         self._columns_info.delete(index, count)
+        self._shift_formula_references(COLUMN, index, -count)
+
+    def _shift_formula_references(self, axis, index, count):
+        # rewrite the formulas of all sheets, which refer to shifted or
+        # deleted cells of this table
+        parent = self.xmlnode.getparent()
+        FormulaIndex(self.xmlnode if parent is None else parent).shift_references(
+            self.name, axis, index, count)
 
     def set_cell_span(self, pos, size):
         self._cell_span_controller.set_span(get_cell_index(pos), size)
@@ -180,15 +448,102 @@ class Table(GenericWrapper):
     def remove_cell_span(self, pos):
         self._cell_span_controller.remove_span(get_cell_index(pos))
 
+class CellRange(object):
+    """ View of a rectangular block of table cells, see
+    :meth:`Table.cell_range`; all positions are relative to the top left
+    cell of the block.
+    """
+    __slots__ = ('table', 'top', 'left', 'bottom', 'right')
+
+    def __init__(self, table, rect):
+        self.table = table
+        # exclusive bottom and right
+        self.top, self.left, self.bottom, self.right = rect
+
+    def __repr__(self):
+        return "<CellRange %s>" % self.reference
+
+    @property
+    def reference(self):
+        """ Reference of the block like 'A1:C3'. """
+        return "%s:%s" % (index_to_address((self.top, self.left)),
+                          index_to_address((self.bottom - 1, self.right - 1)))
+
+    def nrows(self):
+        return self.bottom - self.top
+
+    def ncols(self):
+        return self.right - self.left
+
+    def _rect_reference(self):
+        return ((self.top, self.left), (self.bottom - 1, self.right - 1))
+
+    def _table_pos(self, pos):
+        row, col = get_cell_index(pos)
+        nrows, ncols = self.nrows(), self.ncols()
+        if row < 0:
+            row += nrows
+        if col < 0:
+            col += ncols
+        if not (0 <= row < nrows and 0 <= col < ncols):
+            raise IndexError("invalid position: %s" % str(pos))
+        return (self.top + row, self.left + col)
+
+    def __getitem__(self, pos):
+        """ Get the cell at the relative position `pos` as (row, column)
+        tuple or reference like 'A1'.
+        """
+        return self.table.get_cell(self._table_pos(pos))
+
+    def __setitem__(self, pos, cell):
+        self.table.set_cell(self._table_pos(pos), cell)
+
+    def rows(self):
+        """ Iterate over the rows of the block, every row is a list of
+        :class:`Cell` objects.
+        """
+        row_wrappers = self.table._cellmatrix.row_wrappers
+        for index in range(self.top, self.bottom):
+            yield row_wrappers(index, self.left, self.right)
+
+    __iter__ = rows
+
+    def values(self, dtype=None, default=None):
+        """ Get the cell values as list of columns, see :meth:`Table.values`. """
+        return self.table.values(self._rect_reference(), dtype=dtype, default=default)
+
+    def set_values(self, rows):
+        """ Set the cell values starting at the top left cell of the block,
+        see :meth:`Table.set_values`.
+        """
+        rows = [list(values) for values in rows]
+        if len(rows) > self.nrows() or any(len(values) > self.ncols() for values in rows):
+            raise IndexError("values exceed the cell range %s" % self.reference)
+        self.table.set_values((self.top, self.left), rows)
+
+    def iter_cell_views(self):
+        """ Iterate over the rows of the block as lists of :class:`CellView`
+        objects, see :meth:`Table.iter_cell_views`.
+        """
+        return self.table.iter_cell_views(self._rect_reference())
+
+    def aggregate(self, funcs=AGGREGATES, skip_hidden=False, skip_covered=True):
+        """ Aggregate the numerical cells of the block, see :meth:`Table.aggregate`. """
+        return self.table.aggregate(self._rect_reference(), funcs=funcs,
+                                    skip_hidden=skip_hidden, skip_covered=skip_covered)
+
+
 @register_class
 class TableColumn(GenericWrapper, TableVisibilityMixin):
-    TAG = CN('table:table-column')
-    style_name = StringProperty(CN('table:style-name'))
-    default_cell_style_name = StringProperty(CN('table:default-cell-style-name'))
+    __slots__ = ()
+    TAG = TABLE_TABLE_COLUMN
+    style_name = StringProperty(TABLE_STYLE_NAME)
+    default_cell_style_name = StringProperty(TABLE_DEFAULT_CELL_STYLE_NAME)
 
 @register_class
 class TableRow(TableColumn):
-    TAG = CN('table:table-row')
+    __slots__ = ()
+    TAG = TABLE_TABLE_ROW
 
     def __init__(self, ncols=10, xmlnode=None):
         super(TableRow, self).__init__(xmlnode=xmlnode)
@@ -197,5 +552,5 @@ class TableRow(TableColumn):
 
     def _setup(self, ncols):
         for col in range(ncols):
-            self.xmlnode.append(etree.Element(CN('table:table-cell')))
+            self.xmlnode.append(etree.Element(TABLE_TABLE_CELL))
 
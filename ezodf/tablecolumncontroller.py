@@ -9,14 +9,17 @@ __author__ = "mozman <mozman@gmx.at>"
 
 import copy
 
-from .xmlns import CN, etree
+from .xmlns import etree
+from .clarknames import TABLE_NUMBER_COLUMNS_REPEATED, TABLE_TABLE_COLUMN
 from .nodestructuretags import TABLE_COLUMNS, TABLE_PRELUDE
 from .nodeorganizer import PreludeTagBlock
-from .tableutils import is_table, RepetitionAttribute
+from .tableutils import is_table, RepetitionAttribute, RunLengthIndex, get_repetition
+from .tableutils import get_table_columns
+from .tableutils import is_empty_column, insert_before, insert_after, remove_elements
 from .conf import config
 
 def new_empty_column():
-    return etree.Element(CN('table:table-column'))
+    return etree.Element(TABLE_TABLE_COLUMN)
 
 class _ExpandAll(object):
     def expand_element(self, count, xmlnode):
@@ -72,8 +75,18 @@ class TableColumnController(object):
         self._expand_repeated_content()
         self.update()
 
+    @classmethod
+    def from_normalized(cls, xmlnode):
+        """ Create a controller for the table `xmlnode` with already expanded
+        columns, like a copy of a loaded table.
+        """
+        controller = cls.__new__(cls)
+        controller.xmlnode = xmlnode
+        controller.update()
+        return controller
+
     def update(self):
-        self._columns = self.xmlnode.findall('.//'+CN('table:table-column'))
+        self._columns = get_table_columns(self.xmlnode)
 
     def reset(self, ncols):
         if ncols < 1:
@@ -96,7 +109,7 @@ class TableColumnController(object):
             strategy = expand_strategies[expand]
         except KeyError:
             raise TypeError("Unknown expand strategy: %s" % expand)
-        strategy.expand_columns(self.xmlnode.findall('.//'+CN('table:table-column')), maxcols)
+        strategy.expand_columns(get_table_columns(self.xmlnode), maxcols)
 
     def __len__(self):
         return len(self._columns)
@@ -112,15 +125,22 @@ class TableColumnController(object):
         self._columns[pos] = newcolumn
 
     def _check_column_type(self, column):
-        if column.tag != CN('table:table-column'):
+        if column.tag != TABLE_TABLE_COLUMN:
             raise TypeError('element-tag is not <table:table-column>')
 
     def get_table_column(self, index):
         return self._columns[index]
 
+    def iterruns(self):
+        """ Iterate over the column definitions of the table as (xmlcolumn,
+        count) tuples, do not modify these columns.
+        """
+        for xmlcolumn in self._columns:
+            yield xmlcolumn, get_repetition(xmlcolumn, TABLE_NUMBER_COLUMNS_REPEATED)
+
     def is_consistent(self):
         # just for testing
-        xmlcols = self.xmlnode.findall('.//'+CN('table:table-column'))
+        xmlcols = get_table_columns(self.xmlnode)
         if len(xmlcols) != len(self):
             return False
         for col1, col2 in zip(self._columns, xmlcols):
@@ -131,28 +151,113 @@ class TableColumnController(object):
     def append(self, count=1):
         if count < 1:
             raise ValueError('count < 1')
-        for _ in range(count):
-            column = new_empty_column()
-            self._columns[-1].addnext(column)
-            self._columns.append(column)
+        columns = [new_empty_column() for _ in range(count)]
+        insert_after(self._columns[-1], columns)
+        self._columns.extend(columns)
 
     def insert(self, index, count=1):
         if count < 1:
             raise ValueError('count < 1')
         if index < 0:
             index += len(self)
-        for _ in range(count):
-            column = new_empty_column()
-            insertpos = self._columns[index]
-            insertpos.addprevious(column)
-            self._columns.insert(index, column)
+        columns = [new_empty_column() for _ in range(count)]
+        insert_before(self._columns[index], columns)
+        self._columns[index:index] = columns
+
+    def delete(self, index, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        if index < 0:
+            index += len(self)
+        if not (0 <= index and index + count <= len(self)):
+            raise IndexError('column index out of range')
+        remove_elements(self._columns[index:index+count])
+        del self._columns[index:index+count]
+
+class RunLengthColumnController(object):
+    """ Repeat aware table-column controller, see RunLengthRowController. """
+    def __init__(self, xmlnode):
+        if not is_table(xmlnode):
+            raise ValueError('invalid xmlnode')
+        self.xmlnode = xmlnode
+        self.update()
+
+    @classmethod
+    def from_normalized(cls, xmlnode):
+        # repeated columns are never expanded
+        return cls(xmlnode)
+
+    def update(self):
+        self._columns = RunLengthIndex(get_table_columns(self.xmlnode),
+                                       TABLE_NUMBER_COLUMNS_REPEATED)
+
+    def reset(self, ncols):
+        if ncols < 1:
+            raise ValueError('ncols has to be >= 1.')
+        self._remove_existing_columns()
+        insert_position = PreludeTagBlock(self.xmlnode, TABLE_PRELUDE).insert_position_after()
+        column = new_empty_column()
+        RepetitionAttribute(column).cols = ncols
+        self.xmlnode.insert(insert_position, column)
+        self.update()
+
+    def _remove_existing_columns(self):
+        for child in self.xmlnode.getchildren():
+            if child.tag in TABLE_COLUMNS:
+                self.xmlnode.remove(child)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __getitem__(self, pos):
+        return self.get_table_column(pos)
+
+    def __setitem__(self, pos, element):
+        self._check_column_type(element)
+        if pos < 0:
+            pos += len(self)
+        self._columns.replace(pos, copy.deepcopy(element))
+
+    def _check_column_type(self, column):
+        if column.tag != TABLE_TABLE_COLUMN:
+            raise TypeError('element-tag is not <table:table-column>')
+
+    def get_table_column(self, index):
+        if index < 0:
+            index += len(self)
+        return self._columns.isolate(index)
+
+    def iterruns(self):
+        """ Iterate over all column runs as (xmlcolumn, count) tuples, do not
+        modify these columns.
+        """
+        return self._columns.iterruns()
+
+    def is_consistent(self):
+        # just for testing
+        xmlcols = get_table_columns(self.xmlnode)
+        return xmlcols == self._columns.elements()
+
+    def append(self, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        self._insert(len(self), count)
+
+    def insert(self, index, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        if index < 0:
+            index += len(self)
+        self._insert(index, count)
+
+    def _insert(self, index, count):
+        # new columns next to a run of default columns increase its repetition
+        if not self._columns.grow(index, count, is_empty_column):
+            self._columns.insert(index, new_empty_column(), count)
 
     def delete(self, index, count=1):
         if count < 1:
             raise ValueError('count < 1')
         if index < 0:
             index += len(self)
-        for _ in range(count):
-            column = self._columns[index]
-            column.getparent().remove(column)
-            del self._columns[index]
+        self._columns.delete(index, count)
@@ -7,12 +7,25 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
-from .xmlns import CN, etree
+import copy
+from collections import OrderedDict
+from functools import partial
+
+from .xmlns import etree, wrap
+from .clarknames import (TABLE_COVERED_TABLE_CELL,
+    TABLE_NUMBER_COLUMNS_REPEATED, TABLE_NUMBER_ROWS_REPEATED,
+    TABLE_TABLE_CELL, TABLE_TABLE_ROW)
 from .nodestructuretags import TABLE_ROWS
 from .tablenormalizer import normalize_table
 from .tableutils import get_table_rows, new_empty_cell, is_table
+from .tableutils import RunLengthIndex, get_repetition, is_empty_cell, is_empty_row
+from .tableutils import insert_before, insert_after, remove_elements, EmptyCellBlock
+from .cells import RepeatedCell
 from .conf import config
 
+# every cached column index holds a list of all cells of the column
+MAX_CACHED_COLUMNS = 16
+
 class TableCellAccessor(object):
     def __init__(self, xmlnode):
         if not is_table(xmlnode):
@@ -23,8 +36,38 @@ class TableCellAccessor(object):
         normalize_table(xmlnode, expand, maxcount)
         self.update()
 
+    @classmethod
+    def from_normalized(cls, xmlnode):
+        """ Create a controller for the already normalized table `xmlnode`,
+        like a copy of a loaded table, without normalizing it again.
+        """
+        controller = cls.__new__(cls)
+        controller.xmlnode = xmlnode
+        controller.update()
+        return controller
+
     def update(self):
         self._rows = get_table_rows(self.xmlnode)
+        self._columns = OrderedDict()
+
+    def _get_column(self, index, cache=True):
+        # Column scans index the column at the first access, the index is
+        # invalidated by all structural changes of the table. The least
+        # recently used index is dropped, if more than MAX_CACHED_COLUMNS
+        # columns are indexed.
+        if index < 0:
+            index += self.ncols()
+        columns = self._columns
+        try:
+            column = columns.pop(index)
+        except KeyError:
+            column = [row[index] for row in self._rows]
+            if not cache:
+                return column
+        columns[index] = column
+        while len(columns) > MAX_CACHED_COLUMNS:
+            columns.popitem(last=False)
+        return column
 
     def nrows(self):
         return len(self._rows)
@@ -42,6 +85,8 @@ class TableCellAccessor(object):
     def set_cell(self, pos, element):
         row, col = self._adjust_negative_indices(pos)
         self._rows[row][col] = element
+        if col in self._columns:
+            self._columns[col][row] = element
 
     def _adjust_negative_indices(self, pos):
         row, col = pos
@@ -55,11 +100,49 @@ class TableCellAccessor(object):
         return self._rows[index]
 
     def column(self, index):
-        return [row[index] for row in self._rows]
+        # the cells are wrapped anyway, do not cache the index
+        return list(self._get_column(index, cache=False))
 
     def rows(self):
         return self._rows
 
+    def locate_cell(self, pos):
+        """ Get the cell element at `pos` for read access. """
+        return self.get_cell(pos)
+
+    def cell_wrapper(self, pos):
+        return wrap(self.get_cell(pos))
+
+    def row_wrappers(self, index, start=0, stop=None):
+        return [wrap(e) for e in self._rows[index][start:stop]]
+
+    def column_wrappers(self, index):
+        return [wrap(e) for e in self._get_column(index, cache=False)]
+
+    def get_row_cells(self, index, start, count):
+        """ Get `count` cells of row `index` beginning at column `start`. """
+        cells = self._rows[index][start:start+count]
+        if len(cells) < count:
+            raise IndexError('column index out of range')
+        return cells
+
+    def itervalues(self, rect, decode):
+        """ Iterate over the rows of the cell range `rect` as (values, count)
+        tuples, `values` is the list of the decoded cells by function `decode`,
+        `rect` is a tuple (top, left, bottom, right) with exclusive bottom/right.
+        """
+        top, left, bottom, right = rect
+        for xmlrow in self._rows[top:bottom]:
+            yield [decode(xmlcell) for xmlcell in xmlrow[left:right]], 1
+
+    def itercolumnvalues(self, index, top, bottom, decode):
+        """ Iterate over the cells of column `index` from row `top` to row
+        `bottom` (exclusive) as (value, count) tuples, `value` is the decoded
+        cell by function `decode`.
+        """
+        for xmlcell in self._get_column(index)[top:bottom]:
+            yield decode(xmlcell), 1
+
 class TableRowController(TableCellAccessor):
     def __init__(self, xmlnode):
         super(TableRowController, self).__init__(xmlnode)
@@ -74,12 +157,12 @@ class TableRowController(TableCellAccessor):
         self._remove_existing_rows()
         nrows, ncols = size
         validate_parameter(nrows, ncols)
-        self.xmlnode.extend( (self._build_new_row(ncols) for _ in range(nrows)) )
+        self.xmlnode.extend(self._build_new_rows(nrows, ncols))
         self.update()
 
     @staticmethod
     def _build_new_row(ncols):
-        row = etree.Element(CN('table:table-row'))
+        row = etree.Element(TABLE_TABLE_ROW)
         row.extend( (new_empty_cell() for _ in range(ncols)) )
         return row
 
@@ -98,57 +181,408 @@ class TableRowController(TableCellAccessor):
                 return False
         return True
 
+    @classmethod
+    def _build_new_rows(cls, count, ncols):
+        newrow = cls._build_new_row(ncols)
+        return [newrow] + [copy.deepcopy(newrow) for _ in range(count - 1)]
+
+    # All structural changes are batched: the new rows are inserted into the
+    # XML tree and into the row index by one slice assignment, and the cells
+    # of a row are inserted or deleted by one slice operation.
+
     def append_rows(self, count=1):
         if count < 1:
             raise ValueError('count < 1')
-        for _ in range(count):
-            newrow = self._build_new_row(self.ncols())
-            last_row = self._rows[-1]
-            last_row.addnext(newrow)
-            self._rows.append(newrow)
+        newrows = self._build_new_rows(count, self.ncols())
+        insert_after(self._rows[-1], newrows)
+        self._rows.extend(newrows)
+        self._columns.clear()
 
     def insert_rows(self, index, count=1):
         if count < 1:
             raise ValueError('count < 1')
-        for _ in range(count):
-            newrow = self._build_new_row(self.ncols())
-            insert_row = self._rows[index]
-            insert_row.addprevious(newrow)
-            self._rows.insert(index, newrow)
+        if index < 0:
+            index += self.nrows()
+        newrows = self._build_new_rows(count, self.ncols())
+        insert_before(self._rows[index], newrows)
+        self._rows[index:index] = newrows
+        self._columns.clear()
 
     def delete_rows(self, index, count=1):
         if count < 1 or count >= self.nrows():
             raise ValueError('invalid count')
         if index < 0:
             index += self.nrows()
-
-        for _ in range(count):
-            delete_row = self._rows.pop(index)
-            delete_row.getparent().remove(delete_row)
+        if not (0 <= index and index + count <= self.nrows()):
+            raise IndexError('row index out of range')
+        remove_elements(self._rows[index:index+count])
+        del self._rows[index:index+count]
+        self._columns.clear()
 
     def append_columns(self, count=1):
         if count < 1:
             raise ValueError('count < 1')
+        cells = EmptyCellBlock(count)
         for row in self._rows:
-            for _ in range(count):
-                row.append(new_empty_cell())
+            row.extend(cells.new())
+        self._columns.clear()
 
     def insert_columns(self, index, count=1):
         if count < 1:
             raise ValueError('count < 1')
         if index < 0:
             index += self.ncols()
-
+        cells = EmptyCellBlock(count)
         for row in self._rows:
-            for _ in range(count):
-                row.insert(index, new_empty_cell())
+            row[index:index] = cells.new()
+        self._columns.clear()
 
     def delete_columns(self, index, count=1):
         if count < 1 or count >= self.ncols():
             raise ValueError('invalid count')
         if index < 0:
             index += self.ncols()
-
+        if not (0 <= index and index + count <= self.ncols()):
+            raise IndexError('column index out of range')
         for row in self._rows:
-            for _ in range(count):
-                del row[index]
+            del row[index:index+count]
+        self._columns.clear()
+
+CELL_TAGS = frozenset( (TABLE_TABLE_CELL, TABLE_COVERED_TABLE_CELL) )
+
+class RunLengthRowController(object):
+    """ Repeat aware table-row controller, repeated rows and cells are not
+    expanded, a run of repeated rows or cells is split only, if a single cell
+    inside the run is requested. The memory usage depends on the count of
+    distinct runs and not on the table size, and nrows()/ncols() returns the
+    real table size, also for tables with 1048576 rows.
+    """
+    def __init__(self, xmlnode):
+        if not is_table(xmlnode):
+            raise ValueError('invalid xmlnode')
+        self.xmlnode = xmlnode
+        self.update()
+        self._align_table_columns()
+
+    @classmethod
+    def from_normalized(cls, xmlnode):
+        """ Create a controller for the table `xmlnode` with aligned columns,
+        like a copy of a loaded table, without aligning it again.
+        """
+        controller = cls.__new__(cls)
+        controller.xmlnode = xmlnode
+        controller.update()
+        return controller
+
+    def update(self):
+        self._rows = RunLengthIndex(get_table_rows(self.xmlnode), TABLE_NUMBER_ROWS_REPEATED,
+                                    self.xmlnode)
+        try:
+            self._ncols = len(self._cells(self._rows.elements()[0]))
+        except IndexError:
+            self._ncols = 0
+
+    def _align_table_columns(self):
+        counts = [len(self._cells(xmlrow)) for xmlrow in self._rows.elements()]
+        if len(counts) and min(counts) != max(counts):
+            self._ncols = max(counts)
+            for xmlrow, count in zip(self._rows.elements(), counts):
+                if count < self._ncols:
+                    self._cells(xmlrow).insert(count, new_empty_cell(), self._ncols - count)
+
+    @staticmethod
+    def _cells(xmlrow):
+        return RunLengthIndex((e for e in xmlrow if e.tag in CELL_TAGS),
+                              TABLE_NUMBER_COLUMNS_REPEATED, xmlrow)
+
+    def nrows(self):
+        return len(self._rows)
+
+    def ncols(self):
+        return self._ncols
+
+    def _adjust_negative_indices(self, pos):
+        row, col = pos
+        if row < 0:
+            row += self.nrows()
+        if col < 0:
+            col += self.ncols()
+        return (row, col)
+
+    def get_cell(self, pos):
+        """ Get the isolated cell element at `pos` for modification, splits
+        the runs of the row and the cell.
+        """
+        row, col = self._adjust_negative_indices(pos)
+        return self._cells(self._rows.isolate(row)).isolate(col)
+
+    def locate_cell(self, pos):
+        """ Get the (shared) cell element at `pos` without splitting runs, do
+        not modify this element.
+        """
+        row, col = self._adjust_negative_indices(pos)
+        return self._cells(self._rows.locate(row)).locate(col)
+
+    def isolate_cell(self, xmlrow, row_offset, xmlcell, col_offset):
+        """ Get the isolated cell element at `row_offset` of the row run
+        `xmlrow` and at `col_offset` of the cell run `xmlcell`, used by the
+        copy-on-write cell wrappers at their first modification.
+        """
+        try:
+            row = self._rows.start_of(xmlrow) + row_offset
+            col = self._cells(xmlrow).start_of(xmlcell) + col_offset
+        except ValueError:
+            raise ValueError('cell has been removed from table')
+        return self.get_cell((row, col))
+
+    def _wrap_cell(self, xmlrow, row_offset, nrows, xmlcell, col_offset, ncols):
+        if nrows == 1 and ncols == 1:
+            return wrap(xmlcell)
+        return RepeatedCell(xmlcell, partial(self.isolate_cell, xmlrow, row_offset,
+                                             xmlcell, col_offset))
+
+    def cell_wrapper(self, pos):
+        """ Get the cell wrapper at `pos`, cells inside of runs are wrapped as
+        :class:`RepeatedCell`, which splits the runs at the first modification.
+        """
+        row, col = self._adjust_negative_indices(pos)
+        xmlrow, row_start, nrows = self._rows.locate_run(row)
+        xmlcell, col_start, ncols = self._cells(xmlrow).locate_run(col)
+        return self._wrap_cell(xmlrow, row - row_start, nrows, xmlcell, col - col_start, ncols)
+
+    def row_wrappers(self, index, start=0, stop=None):
+        """ Get the cell wrappers of row `index` from column `start` to column
+        `stop` (exclusive) without splitting runs, see :meth:`cell_wrapper`.
+        """
+        if index < 0:
+            index += self.nrows()
+        if stop is None:
+            stop = self._ncols
+        xmlrow, row_start, nrows = self._rows.locate_run(index)
+        row_offset = index - row_start
+        wrappers = []
+        col = 0
+        for xmlcell, ncols in self._cells(xmlrow).iterruns():
+            for col_offset in range(max(start - col, 0), min(stop - col, ncols)):
+                wrappers.append(self._wrap_cell(xmlrow, row_offset, nrows,
+                                                xmlcell, col_offset, ncols))
+            col += ncols
+            if col >= stop:
+                break
+        return wrappers
+
+    def column_wrappers(self, index):
+        """ Get the cell wrappers of column `index` without splitting runs, see
+        :meth:`cell_wrapper`.
+        """
+        if index < 0:
+            index += self._ncols
+        wrappers = []
+        for xmlrow, nrows in self._rows.iterruns():
+            xmlcell, col_start, ncols = self._cells(xmlrow).locate_run(index)
+            col_offset = index - col_start
+            for row_offset in range(nrows):
+                wrappers.append(self._wrap_cell(xmlrow, row_offset, nrows,
+                                                xmlcell, col_offset, ncols))
+        return wrappers
+
+    def set_cell(self, pos, element):
+        row, col = self._adjust_negative_indices(pos)
+        self._cells(self._rows.isolate(row)).replace(col, element)
+
+    def row(self, index):
+        """ Get the isolated table-row `index` with expanded cells for
+        modification.
+        """
+        if index < 0:
+            index += self.nrows()
+        xmlrow = self._rows.isolate(index)
+        self._cells(xmlrow).expand()
+        return xmlrow
+
+    def column(self, index):
+        """ Get the (shared) cell elements of column `index` without splitting
+        runs, do not modify these elements.
+        """
+        if index < 0:
+            index += self._ncols
+        column = []
+        for xmlrow, count in self._rows.iterruns():
+            column.extend([self._cells(xmlrow).locate(index)] * count)
+        return column
+
+    def itercolumnvalues(self, index, top, bottom, decode):
+        """ Iterate over the cells of column `index` from row `top` to row
+        `bottom` (exclusive) as (value, count) tuples, without splitting row
+        or cell runs; every row run is decoded just once.
+        """
+        if index < 0:
+            index += self._ncols
+        start = 0
+        for xmlrow, count in self._rows.iterruns():
+            stop = start + count
+            nrows = min(stop, bottom) - max(start, top)
+            if nrows > 0:
+                yield decode(self._cells(xmlrow).locate(index)), nrows
+            if stop >= bottom:
+                break
+            start = stop
+
+    def rows(self):
+        """ Get all rows as lists of (shared) cell elements without splitting
+        runs, the rows of a row run are the same list object, do not modify
+        these lists or elements.
+        """
+        rows = []
+        for xmlrow, count in self._rows.iterruns():
+            cells = []
+            for xmlcell, ncols in self.itercellruns(xmlrow):
+                cells.extend([xmlcell] * ncols)
+            rows.extend([cells] * count)
+        return rows
+
+    def iterruns(self):
+        """ Iterate over all row runs as (xmlrow, count) tuples, do not modify
+        these rows.
+        """
+        return self._rows.iterruns()
+
+    def itercellruns(self, xmlrow):
+        """ Iterate over all cell runs of `xmlrow` as (xmlcell, count) tuples,
+        do not modify these cells.
+        """
+        return self._cells(xmlrow).iterruns()
+
+    def get_row_cells(self, index, start, count):
+        """ Get `count` cells of row `index` beginning at column `start`, just
+        the row `index` and the requested cells are isolated.
+        """
+        if start + count > self._ncols:
+            raise IndexError('column index out of range')
+        cells = self._cells(self._rows.isolate(index))
+        return [cells.isolate(col) for col in range(start, start+count)]
+
+    def itervalues(self, rect, decode):
+        """ Iterate over the rows of the cell range `rect` as (values, count)
+        tuples, without splitting row or cell runs; every run is decoded just
+        once, see also :meth:`TableCellAccessor.itervalues`.
+        """
+        top, left, bottom, right = rect
+        start = 0
+        for xmlrow, count in self._rows.iterruns():
+            stop = start + count
+            nrows = min(stop, bottom) - max(start, top)
+            if nrows > 0:
+                yield self._decode_cells(xmlrow, left, right, decode), nrows
+            if stop >= bottom:
+                break
+            start = stop
+
+    def _decode_cells(self, xmlrow, left, right, decode):
+        values = []
+        start = 0
+        for xmlcell, count in self.itercellruns(xmlrow):
+            stop = start + count
+            ncols = min(stop, right) - max(start, left)
+            if ncols == 1:
+                values.append(decode(xmlcell))
+            elif ncols > 1:
+                values.extend([decode(xmlcell)] * ncols)
+            if stop >= right:
+                break
+            start = stop
+        return values
+
+    def reset(self, size):
+        nrows, ncols = size
+        if nrows < 1:
+            raise ValueError('nrows has to be >= 1.')
+        if ncols < 1:
+            raise ValueError('ncols has to be >= 1.')
+        for child in self.xmlnode.getchildren():
+            if child.tag in TABLE_ROWS:
+                self.xmlnode.remove(child)
+        self.update()
+        self._ncols = ncols
+        self._rows.insert(0, self._build_new_row(), nrows)
+
+    def _build_new_row(self):
+        row = etree.Element(TABLE_TABLE_ROW)
+        self._cells(row).insert(0, new_empty_cell(), self._ncols)
+        return row
+
+    def is_consistent(self):
+        # just for testing
+        xmlrows = get_table_rows(self.xmlnode)
+        elements = self._rows.elements()
+        if len(xmlrows) != len(elements):
+            return False
+        for row1, row2 in zip(elements, xmlrows):
+            if row1 != row2:
+                return False
+        return len(self._rows) == sum(get_repetition(e, TABLE_NUMBER_ROWS_REPEATED)
+                                      for e in xmlrows)
+
+    # New rows and cells next to a run of empty rows or cells just increase
+    # the repetition count of this run.
+
+    def _insert_rows(self, index, count):
+        if not self._rows.grow(index, count, is_empty_row):
+            self._rows.insert(index, self._build_new_row(), count)
+
+    def _insert_cells(self, xmlrow, index, count):
+        cells = self._cells(xmlrow)
+        if not cells.grow(index, count, is_empty_cell):
+            cells.insert(index, new_empty_cell(), count)
+
+    def append_rows(self, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        self._insert_rows(self.nrows(), count)
+
+    def insert_rows(self, index, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        if index < 0:
+            index += self.nrows()
+        if not (0 <= index < self.nrows()):
+            raise IndexError(index)
+        self._insert_rows(index, count)
+
+    def delete_rows(self, index, count=1):
+        if count < 1 or count >= self.nrows():
+            raise ValueError('invalid count')
+        if index < 0:
+            index += self.nrows()
+        if not (0 <= index and index + count <= self.nrows()):
+            raise IndexError('row index out of range')
+        self._rows.delete(index, count)
+
+    def append_columns(self, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        for xmlrow in self._rows.elements():
+            self._insert_cells(xmlrow, self._ncols, count)
+        self._ncols += count
+
+    def insert_columns(self, index, count=1):
+        if count < 1:
+            raise ValueError('count < 1')
+        if index < 0:
+            index += self.ncols()
+        if not (0 <= index < self.ncols()):
+            raise IndexError(index)
+        for xmlrow in self._rows.elements():
+            self._insert_cells(xmlrow, index, count)
+        self._ncols += count
+
+    def delete_columns(self, index, count=1):
+        if count < 1 or count >= self.ncols():
+            raise ValueError('invalid count')
+        if index < 0:
+            index += self.ncols()
+        if not (0 <= index and index + count <= self.ncols()):
+            raise IndexError('column index out of range')
+        for xmlrow in self._rows.elements():
+            self._cells(xmlrow).delete(index, count)
+        self._ncols -= count
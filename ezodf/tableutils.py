@@ -8,8 +8,27 @@ from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
 import re
-from .compatibility import tostr, is_string
-from .xmlns import CN, etree
+import copy
+from bisect import bisect_right
+from collections import namedtuple
+
+from .compatibility import tostr, is_string, lru_cache
+from .xmlns import etree
+from .clarknames import (TABLE_NUMBER_COLUMNS_REPEATED,
+    TABLE_NUMBER_ROWS_REPEATED, TABLE_TABLE, TABLE_TABLE_CELL,
+    TABLE_TABLE_COLUMN, TABLE_TABLE_ROW)
+from .nodestructuretags import TABLE_COLUMNS
+
+def column_index_to_name(index):
+    """ Get the column name of the column `index`, 0 -> 'A', 26 -> 'AA'. """
+    if index < 0:
+        raise ValueError("invalid column index: %d" % index)
+    name = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
 
 def iter_cell_range(pos, size):
     start_row, start_column = pos
@@ -28,24 +47,110 @@ def iter_cell_range_without_start_pos(pos, size):
     next(generator)
     return generator
 
-CELL_ADDRESS = re.compile('^([A-Z]+)(\d+)$')
+CELL_ADDRESS = re.compile(r'^\$?([A-Za-z]+)\$?([0-9]+)$')
+
+# cell and range references like 'A1', '$A$1', 'A1:C3', 'Sheet2.A1:C3',
+# "'My Sheet'.A1", '.A1:.C3', 'A:C' (whole columns) or '1:3' (whole rows),
+# also the references of formulas like '[$Sheet2.$A$1:.C3]' without brackets
+ENDPOINT = r"""
+    (?:(?P<sheet%(n)s>\$?(?:'(?:[^']|'')*'|[^'.:$\[\]]*?))\.)?
+    (?P<column%(n)s>\$?[A-Za-z]+)?
+    (?P<row%(n)s>\$?[0-9]+)?
+"""
+REFERENCE = re.compile(r"^%s(?P<range>:%s)?$" % (ENDPOINT % {'n': 1}, ENDPOINT % {'n': 2}), re.VERBOSE)
+SINGLE_ENDPOINT = re.compile(r"^%s$" % (ENDPOINT % {'n': ''}), re.VERBOSE)
+ADDRESS_CACHE_SIZE = 4096
 
+CellReference = namedtuple('CellReference', 'sheet top left bottom right')
+
+def column_name_to_index(name):
+    """ Get the column index of the column name `name`, 'A' -> 0, 'AA' -> 26. """
+    index = 0
+    for char in name.upper():
+        index = index * 26 + (ord(char) - 64)
+    return index - 1
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
 def address_to_index(address):
-    def column_name_to_index(colname):
-        index = 0
-        power = 1
-        base = ord('A') - 1
-        for char in reversed(colname):
-            index += (ord(char) - base) * power
-            power *= 26
-        return index - 1
-
-    res = CELL_ADDRESS.match(address.upper())
+    """ Get the (row, column) tuple of the cell address `address` like 'B12'
+    or '$B$12', results are cached.
+    """
+    res = CELL_ADDRESS.match(address)
     if res:
         column_name, row_name = res.groups()
-        return (int(row_name)-1, column_name_to_index(column_name))
+        row = int(row_name) - 1
+        if row >= 0:
+            return (row, column_name_to_index(column_name))
+    raise ValueError('Invalid cell address: %s' % address)
+
+def index_to_address(pos, absolute=False):
+    """ Get the cell address of the (row, column) tuple `pos`, (11, 1) -> 'B12'
+    or '$B$12' for `absolute` addresses.
+    """
+    row, column = pos
+    if row < 0:
+        raise ValueError("invalid row index: %d" % row)
+    prefix = '$' if absolute else ''
+    return '%s%s%s%d' % (prefix, column_index_to_name(column), prefix, row + 1)
+
+def parse_endpoint(text):
+    """ Split one endpoint of a reference like '$Sheet2.$A$1', '.A1', 'A1',
+    'A' or '1' into the tuple (sheet, column, row) of the unconverted texts,
+    missing parts are `None`; returns `None` for invalid endpoints.
+    """
+    match = SINGLE_ENDPOINT.match(text)
+    if match is None:
+        return None
+    return match.group('sheet', 'column', 'row')
+
+def _sheet_name(text):
+    if text is None:
+        return None
+    text = text.lstrip('$')
+    if text.startswith("'"):
+        text = text[1:-1].replace("''", "'")
+    return text or None
+
+def _endpoint(column, row):
+    if column is not None:
+        column = column_name_to_index(column.lstrip('$'))
+    if row is not None:
+        row = int(row.lstrip('$')) - 1
+        if row < 0:
+            return None
+    return row, column
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def parse_reference(reference):
+    """ Parse the cell or cell range reference `reference` like 'A1', 'A1:C3',
+    '$Sheet2.$A$1:$C$3', "'My Sheet'.A1", 'A:C' (whole columns) or '1:3'
+    (whole rows), the '$' signs of absolute references are ignored.
+
+    Returns a :class:`CellReference` (sheet, top, left, bottom, right),
+    `sheet` is `None` if the reference has no sheet name, `top` and `bottom`
+    are `None` for whole columns, `left` and `right` are `None` for whole
+    rows; the bottom right cell is part of the range. Results are cached.
+    """
+    match = REFERENCE.match(reference)
+    if match is None:
+        raise ValueError('Invalid cell reference: %s' % reference)
+    start = _endpoint(match.group('column1'), match.group('row1'))
+    if match.group('range') is None: # single cell
+        end = start
+        valid = start is not None and None not in start
     else:
-        raise ValueError('Invalid cell address: %s' % address)
+        end = _endpoint(match.group('column2'), match.group('row2'))
+        # both endpoints are cells, whole columns or whole rows
+        valid = start is not None and end is not None and start != (None, None) \
+            and (start[0] is None) == (end[0] is None) \
+            and (start[1] is None) == (end[1] is None)
+    if not valid:
+        raise ValueError('Invalid cell reference: %s' % reference)
+    sheet = _sheet_name(match.group('sheet1'))
+    end_sheet = _sheet_name(match.group('sheet2'))
+    if end_sheet is not None and end_sheet != sheet:
+        raise ValueError('Invalid cell reference, 3D ranges are not supported: %s' % reference)
+    return CellReference(sheet, start[0], start[1], end[0], end[1])
 
 def get_cell_index(reference):
     if isinstance(reference, tuple): # key => (row, column)
@@ -53,7 +158,22 @@ def get_cell_index(reference):
     elif is_string(reference): # key => 'A1'
         return address_to_index(reference)
     else:
-        raise TypeError(tostr(type(key)))
+        raise TypeError(tostr(type(reference)))
+
+def get_cell_range(reference):
+    """ Returns the cell range `reference` as tuple ((top, left), (bottom, right)),
+    `reference` is a string like 'A1:C3' or a tuple of two cell references,
+    the bottom right cell is part of the range.
+    """
+    if is_string(reference):
+        sheet, top, left, bottom, right = parse_reference(reference)
+        if None in (top, left) or REFERENCE.match(reference).group('range') is None:
+            raise ValueError('Invalid cell range: %s' % reference)
+        return ((top, left), (bottom, right))
+    elif isinstance(reference, tuple) and len(reference) == 2:
+        return (get_cell_index(reference[0]), get_cell_index(reference[1]))
+    else:
+        raise TypeError(tostr(type(reference)))
 
 def get_min_max_cell_count(xmltable):
     count = [count_cells_in_row(xmlrow) for xmlrow in get_table_rows(xmltable)]
@@ -63,16 +183,101 @@ def get_min_max_cell_count(xmltable):
         return (0, 0)
 
 def get_table_rows(xmltable):
-    return xmltable.findall('.//'+CN('table:table-row'))
+    return xmltable.findall('.//'+TABLE_TABLE_ROW)
+
+def get_table_columns(xmltable):
+    """ Get the column definitions of `xmltable`, also inside of column groups
+    and header columns, but not the columns of subtables in table cells.
+    """
+    columns = []
+    def collect(parent):
+        for child in parent.iterchildren(*TABLE_COLUMNS):
+            if child.tag == TABLE_TABLE_COLUMN:
+                columns.append(child)
+            else:
+                collect(child)
+    collect(xmltable)
+    return columns
 
 def count_cells_in_row(xmlrow):
     return sum( (RepetitionAttribute(xmlcell).cols for xmlcell in xmlrow) )
 
 def new_empty_cell():
-    return etree.Element(CN('table:table-cell'))
+    return etree.Element(TABLE_TABLE_CELL)
+
+class EmptyCellBlock(object):
+    """ Factory for blocks of `count` new empty cells; copying a prepared
+    block is much faster than creating every cell by etree.Element().
+    """
+    def __init__(self, count):
+        self._template = etree.Element(TABLE_TABLE_ROW)
+        self._template.extend([new_empty_cell() for _ in range(count)])
+
+    def new(self):
+        return list(copy.deepcopy(self._template))
+
+def _has_only_attribute(element, key):
+    attrib = element.attrib
+    count = len(attrib)
+    return count == 0 or (count == 1 and key in attrib)
+
+def is_empty_cell(xmlcell):
+    """ True if `xmlcell` is a <table:table-cell> without content and without
+    attributes except the repetition count.
+    """
+    return xmlcell.tag == TABLE_TABLE_CELL and len(xmlcell) == 0 and \
+        not xmlcell.text and _has_only_attribute(xmlcell, TABLE_NUMBER_COLUMNS_REPEATED)
+
+def is_empty_row(xmlrow):
+    """ True if `xmlrow` has no attributes except the repetition count and
+    contains just empty cells.
+    """
+    if not _has_only_attribute(xmlrow, TABLE_NUMBER_ROWS_REPEATED):
+        return False
+    for xmlcell in xmlrow:
+        if not is_empty_cell(xmlcell):
+            return False
+    return True
+
+def is_empty_column(xmlcolumn):
+    """ True if `xmlcolumn` has no attributes except the repetition count. """
+    return _has_only_attribute(xmlcolumn, TABLE_NUMBER_COLUMNS_REPEATED)
+
+def insert_before(target, elements):
+    """ Insert `elements` in front of `target` by one slice assignment. """
+    parent = target.getparent()
+    position = parent.index(target)
+    parent[position:position] = elements
+
+def insert_after(target, elements):
+    """ Insert `elements` after `target` by one slice assignment. """
+    parent = target.getparent()
+    position = parent.index(target) + 1
+    parent[position:position] = elements
+
+def remove_elements(elements):
+    """ Remove `elements` from their parents, blocks of adjacent siblings are
+    removed by one slice deletion.
+    """
+    def remove_block(first, count):
+        if first is not None:
+            parent = first.getparent()
+            start = parent.index(first)
+            del parent[start:start+count]
+
+    first = previous = None
+    count = 0
+    for element in elements:
+        if previous is not None and previous.getnext() is element:
+            count += 1
+        else:
+            remove_block(first, count)
+            first, count = element, 1
+        previous = element
+    remove_block(first, count)
 
 def is_table(xmlnode):
-    if (xmlnode is None) or (xmlnode.tag != CN('table:table')):
+    if (xmlnode is None) or (xmlnode.tag != TABLE_TABLE):
         return False
     else:
         return True
@@ -83,18 +288,195 @@ class RepetitionAttribute(object):
 
     @property
     def cols(self):
-        count = self.xmlnode.get(CN('table:number-columns-repeated'))
+        count = self.xmlnode.get(TABLE_NUMBER_COLUMNS_REPEATED)
         return 1 if count is None else int(count)
 
     @property
     def rows(self):
-        count = self.xmlnode.get(CN('table:number-rows-repeated'))
+        count = self.xmlnode.get(TABLE_NUMBER_ROWS_REPEATED)
         return 1 if count is None else int(count)
 
+    @cols.setter
+    def cols(self, count):
+        set_repetition(self.xmlnode, TABLE_NUMBER_COLUMNS_REPEATED, count)
+
+    @rows.setter
+    def rows(self, count):
+        set_repetition(self.xmlnode, TABLE_NUMBER_ROWS_REPEATED, count)
+
     @cols.deleter
     def cols(self):
-        del self.xmlnode.attrib[CN('table:number-columns-repeated')]
+        del self.xmlnode.attrib[TABLE_NUMBER_COLUMNS_REPEATED]
 
     @rows.deleter
     def rows(self):
-        del self.xmlnode.attrib[CN('table:number-rows-repeated')]
+        del self.xmlnode.attrib[TABLE_NUMBER_ROWS_REPEATED]
+
+def get_repetition(xmlnode, key):
+    count = xmlnode.get(key)
+    return 1 if count is None else int(count)
+
+def set_repetition(xmlnode, key, count):
+    if count > 1:
+        xmlnode.set(key, tostr(count))
+    elif key in xmlnode.attrib:
+        del xmlnode.attrib[key]
+
+class RunLengthIndex(object):
+    """ Index of repeated (run-length encoded) elements like table-rows,
+    table-cells or table-columns.
+
+    The elements are not expanded, a run of repeated elements is only split,
+    if a single element inside of the run is requested for modification.
+    All indices are logical indices (as if all repetitions would be expanded).
+    """
+    def __init__(self, elements, key, parent=None):
+        self.key = key # repetition attribute in clark notation
+        self.parent = parent # append elements to parent, if index is empty
+        self._elements = list(elements)
+        self._update_starts()
+
+    def _update_starts(self):
+        starts = []
+        total = 0
+        key = self.key
+        for element in self._elements:
+            starts.append(total)
+            total += get_repetition(element, key)
+        self._starts = starts
+        self._total = total
+
+    def __len__(self):
+        return self._total
+
+    def elements(self):
+        return self._elements
+
+    def iterruns(self):
+        """ Iterate over all runs as (element, count) tuples. """
+        key = self.key
+        for element in self._elements:
+            yield element, get_repetition(element, key)
+
+    def locate(self, index):
+        """ Get the (shared) element at logical position `index`, do not modify
+        this element, it could represent many repeated elements.
+        """
+        if not (0 <= index < self._total):
+            raise IndexError(index)
+        return self._elements[bisect_right(self._starts, index) - 1]
+
+    def locate_run(self, index):
+        """ Get the run at logical position `index` as (element, start, count)
+        tuple, `start` is the logical position of the first element of the run.
+        """
+        if not (0 <= index < self._total):
+            raise IndexError(index)
+        position = bisect_right(self._starts, index) - 1
+        element = self._elements[position]
+        return element, self._starts[position], get_repetition(element, self.key)
+
+    def start_of(self, element):
+        """ Get the logical position of the run `element`, raises ValueError if
+        `element` is not a run of this index.
+        """
+        for position, run in enumerate(self._elements):
+            if run is element:
+                return self._starts[position]
+        raise ValueError('element is not in index')
+
+    def split(self, index):
+        """ Split the run at logical position `index`, so that a run starts at
+        `index`. Returns the position of this run in the element list.
+        """
+        if index >= self._total:
+            return len(self._elements)
+        position = bisect_right(self._starts, index) - 1
+        start = self._starts[position]
+        if start == index:
+            return position
+        element = self._elements[position]
+        count = get_repetition(element, self.key)
+        clone = copy.deepcopy(element)
+        set_repetition(element, self.key, index - start)
+        set_repetition(clone, self.key, start + count - index)
+        element.addnext(clone)
+        self._elements.insert(position + 1, clone)
+        self._starts.insert(position + 1, index)
+        return position + 1
+
+    def isolate(self, index):
+        """ Get the element at logical position `index` as single (not repeated)
+        element, which can be modified without side effects.
+        """
+        if not (0 <= index < self._total):
+            raise IndexError(index)
+        position = self.split(index)
+        self.split(index + 1)
+        return self._elements[position]
+
+    def replace(self, index, element):
+        """ Replace the element at logical position `index` by `element`. """
+        oldelement = self.isolate(index)
+        position = self.split(index)
+        set_repetition(element, self.key, 1)
+        oldelement.getparent().replace(oldelement, element)
+        self._elements[position] = element
+
+    def insert(self, index, element, count=1):
+        """ Insert `element` as run of `count` elements at logical position
+        `index`, `index` == len(self) appends the element.
+        """
+        position = self.split(index)
+        set_repetition(element, self.key, count)
+        if position < len(self._elements):
+            self._elements[position].addprevious(element)
+        elif len(self._elements):
+            self._elements[-1].addnext(element)
+        else:
+            self.parent.append(element)
+        self._elements.insert(position, element)
+        self._update_starts()
+
+    def grow(self, index, count, match):
+        """ Insert `count` elements at logical position `index` by increasing
+        the repetition count of the run at `index` or of the run in front of
+        `index`, if `match(element)` is True for this run. Returns False if no
+        matching run exists and nothing was inserted.
+        """
+        for pos in (index, index - 1):
+            if 0 <= pos < self._total:
+                position = bisect_right(self._starts, pos) - 1
+                element = self._elements[position]
+                if match(element):
+                    set_repetition(element, self.key, get_repetition(element, self.key) + count)
+                    starts = self._starts
+                    for i in range(position + 1, len(starts)):
+                        starts[i] += count
+                    self._total += count
+                    return True
+        return False
+
+    def delete(self, index, count=1):
+        """ Delete `count` elements starting at logical position `index`. """
+        first = self.split(index)
+        last = self.split(index + count)
+        remove_elements(self._elements[first:last])
+        del self._elements[first:last]
+        self._update_starts()
+
+    def expand(self):
+        """ Expand all repeated elements. """
+        key = self.key
+        elements = []
+        for element in self._elements:
+            elements.append(element)
+            count = get_repetition(element, key)
+            if count > 1:
+                set_repetition(element, key, 1)
+                for _ in range(count - 1):
+                    clone = copy.deepcopy(element)
+                    elements[-1].addnext(clone)
+                    elements.append(clone)
+        self._elements = elements
+        self._update_starts()
@@ -18,6 +18,7 @@ from .propertymixins import IntegerWithLowerLimitProperty
 
 @register_class
 class Span(GenericWrapper):
+    __slots__ = ()
     TAG = CN('text:span')
     style_name = StringProperty(CN('text:style-name'))
 
@@ -64,12 +65,14 @@ class Span(GenericWrapper):
 
 @register_class
 class Paragraph(Span):
+    __slots__ = ()
     TAG = CN('text:p')
     cond_style_name = StringProperty(CN('text:cond-style-name'))
     ID = StringProperty(CN('text:id'))
 
 @register_class
 class NumberedParagraph(GenericWrapper, TextNumberingMixin):
+    __slots__ = ()
     TAG = CN('text:numbered-paragraph')
     level = IntegerWithLowerLimitProperty(CN('text:level'), 1)
 
@@ -91,6 +94,7 @@ class NumberedParagraph(GenericWrapper, TextNumberingMixin):
 
 @register_class
 class Heading(Span, TextNumberingMixin):
+    __slots__ = ()
     TAG = CN('text:h')
     outline_level = IntegerWithLowerLimitProperty(CN('text:outline-level'), 1)
     restart_numbering = BooleanProperty(CN('text:restart-numbering'))
@@ -103,6 +107,7 @@ class Heading(Span, TextNumberingMixin):
 
 @register_class
 class Hyperlink(Span):
+    __slots__ = ()
     TAG = CN('text:a')
     name = StringProperty(CN('office:name'))
     href = StringProperty(CN('xlink:href'))
@@ -125,6 +130,7 @@ class Hyperlink(Span):
 
 @register_class
 class ListHeader(GenericWrapper):
+    __slots__ = ()
     TAG = CN('text:list-header')
 
     def __init__(self, text="", xmlnode=None):
@@ -139,11 +145,13 @@ class ListHeader(GenericWrapper):
 
 @register_class
 class ListItem(ListHeader, TextNumberingMixin):
+    __slots__ = ()
     TAG = CN('text:list-item')
 
 
 @register_class
 class List(GenericWrapper):
+    __slots__ = ()
     TAG = CN('text:list')
     style_name = StringProperty(CN('text:style-name'))
     continue_numbering = BooleanProperty(CN('text:continue-numbering'))
@@ -173,6 +181,7 @@ class List(GenericWrapper):
 
 @register_class
 class Section(GenericWrapper):
+    __slots__ = ()
     TAG = CN('text:section')
     style_name = StringProperty(CN('text:style-name'))
     name = StringProperty(CN('text:name'))
@@ -13,6 +13,7 @@ from .base import GenericWrapper
 
 @register_class
 class Tabulator(GenericWrapper):
+    __slots__ = ()
     TAG = CN('text:tab')
 
     def __str__(self):
@@ -27,6 +28,7 @@ class Tabulator(GenericWrapper):
 
 @register_class
 class LineBreak(Tabulator):
+    __slots__ = ()
     TAG = CN('text:line-break')
 
     def plaintext(self):
@@ -34,6 +36,7 @@ class LineBreak(Tabulator):
 
 @register_class
 class Spaces(Tabulator):
+    __slots__ = ()
     TAG = CN('text:s')
     def __init__(self, count=1, xmlnode=None):
         super(Spaces, self).__init__(xmlnode)
@@ -58,6 +61,7 @@ class Spaces(Tabulator):
 
 @register_class
 class SoftPageBreak(Tabulator):
+    __slots__ = ()
     TAG = CN('text:soft-page-break')
     @property
     def textlen(self):
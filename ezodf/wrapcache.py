@@ -7,32 +7,65 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
+from collections import OrderedDict
+
 from .xmlns import wrap as uncached_wrap
 
-class _WrapCache(object):
-    # Should only used for big expensive objects like tables.
-    _cache = {}
+DEFAULT_MAXSIZE = 256
+
+class WrapCache(object):
+    """ LRU cache of wrapper objects, keyed by the wrapped XML element.
+
+    Should only used for big expensive objects like tables. lxml elements
+    support no weak references, but as cache key the element keeps its
+    identity, and `maxsize` limits the count of cached objects, `None` for
+    an unlimited cache.
+    """
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._cache)
 
     def wrap(self, element):
-        key = id(element)
         try:
-            return self._cache[key]
+            wrapped_object = self._cache.pop(element)
+            self.hits += 1
         except KeyError:
             wrapped_object = uncached_wrap(element)
+            self.misses += 1
         self.add(wrapped_object)
         return wrapped_object
 
     def add(self, wrapped_object):
-        self._cache[id(wrapped_object.xmlnode)] = wrapped_object
+        element = wrapped_object.xmlnode
+        # re-insert as most recently used object
+        self._cache.pop(element, None)
+        self._cache[element] = wrapped_object
+        if self.maxsize is not None:
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
 
     def remove(self, wrapped_object):
-        del self._cache[id(wrapped_object.xmlnode)]
+        del self._cache[wrapped_object.xmlnode]
+
+    def discard(self, wrapped_object):
+        self._cache.pop(wrapped_object.xmlnode, None)
 
     def clear(self):
         self._cache.clear()
 
-_wrapcache = _WrapCache()
-wrap = _wrapcache.wrap
-clear = _wrapcache.clear
-add = _wrapcache.add
-remove = _wrapcache.remove
+    def stats(self):
+        """ Returns a dict of the cache statistics. """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._cache),
+            'maxsize': self.maxsize,
+        }
@@ -7,9 +7,11 @@
 from __future__ import unicode_literals, print_function, division
 __author__ = "mozman <mozman@gmx.at>"
 
+import threading
+
 from lxml import etree
 
-from .const import ALL_NSMAP
+from .const import ALL_NSMAP, DEFAULT_ELEMENT_BINDING
 
 def subelement(parent, tag, new=True):
     """ Find/create SubElement `tag` in parent node.
@@ -75,28 +77,126 @@ class XMLMixin(object):
                               xml_declaration=xml_declaration,
                               pretty_print=pretty_print)
 
+class BoundElement(etree.ElementBase):
+    """ Base class of the element classes of the native element binding, see
+    :meth:`_ClassRegistry.set_binding`. Elements parsed or created by the
+    binding parser are instances of a subclass with the registered wrapper
+    class as `WRAPPER` attribute; the element creates its wrapper object at
+    the first :func:`wrap` call and keeps it as long as the element proxy
+    lives.
+    """
+    __slots__ = ('_wrapper', )
+    WRAPPER = None
+
+
 class _ClassRegistry(object):
     """ Class Registry """
     _classmap = {}
 
+    def __init__(self):
+        self.binding = DEFAULT_ELEMENT_BINDING
+        self._native = False
+        self._lookup = None
+        # lxml parsers must not be used by several threads at the same time
+        self._local = threading.local()
+
+    @property
+    def parser(self):
+        """ Parser of the current element binding for the calling thread,
+        `None` is the lxml default parser.
+        """
+        if not self._native:
+            return None
+        try:
+            return self._local.parser
+        except AttributeError:
+            parser = self._local.parser = self._native_parser()
+            return parser
+
     def register(self, cls):
         """ Class registration. """
         self._classmap[cls.TAG] = cls
+        if self._lookup is not None:
+            self._add_element_class(cls)
         return cls
 
     def wrap(self, element):
         """ Wrap element into a wrapper object. """
+        if self._native:
+            try:
+                return element._wrapper
+            except AttributeError:
+                if isinstance(element, BoundElement):
+                    wrapper = element.WRAPPER(xmlnode=element)
+                    element._wrapper = wrapper
+                    return wrapper
         try:
             cls = self._classmap[element.tag]
         except KeyError: # wrap it into the GenericWrapper
             cls = self._classmap['GenericWrapper']
         return cls(xmlnode=element)
 
+    def set_binding(self, binding):
+        """ Set the element binding, ``'wrapper'`` creates a new wrapper object
+        at every :func:`wrap` call, ``'native'`` parses XML documents into
+        :class:`BoundElement` objects, which keep their wrapper objects.
+        Affects only documents opened or elements created afterwards.
+        """
+        if binding == 'native':
+            self._native = True
+        elif binding == 'wrapper':
+            self._native = False
+        else:
+            raise ValueError("invalid element binding: '%s'" % binding)
+        self.binding = binding
+
+    def _native_parser(self):
+        if self._lookup is None:
+            fallback = type(str('GenericWrapperElement'), (BoundElement, ),
+                            {'__slots__': (), 'WRAPPER': self._classmap['GenericWrapper']})
+            self._lookup = etree.ElementNamespaceClassLookup(
+                etree.ElementDefaultClassLookup(element=fallback))
+            for cls in self._classmap.values():
+                self._add_element_class(cls)
+        parser = etree.XMLParser()
+        parser.set_element_class_lookup(self._lookup)
+        return parser
+
+    def _add_element_class(self, cls):
+        if not cls.TAG.startswith('{'):
+            return
+        uri, localname = cls.TAG[1:].split('}')
+        element_class = type(str(cls.__name__ + 'Element'), (BoundElement, ),
+                             {'__slots__': (), 'WRAPPER': cls})
+        self._lookup.get_namespace(uri)[localname] = element_class
+
+    def new_element(self, wrapper):
+        """ Create a new element for the wrapper object `wrapper` by the parser
+        of the current binding.
+        """
+        if not self._native:
+            return etree.Element(wrapper.TAG)
+        element = self.parser.makeelement(wrapper.TAG)
+        element._wrapper = wrapper
+        return element
+
 
 _class_registry = _ClassRegistry()
 register_class = _class_registry.register
 wrap = _class_registry.wrap
 
+def parse_xml(content):
+    """ Parse the XML string `content` by the parser of the current element
+    binding, returns the root element.
+    """
+    return etree.XML(content, parser=_class_registry.parser)
+
+def parse_xml_file(filename):
+    """ Parse the XML file `filename` by the parser of the current element
+    binding, returns the :class:`lxml.etree.ElementTree`.
+    """
+    return etree.parse(filename, parser=_class_registry.parser)
+
 WRAPNS = """<root
 {0}
 >
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: generate the module ezodf/clarknames.py
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Collects all CN('prefix:local') names and all constants imported from
+# clarknames by the ezodf package, and writes them as precomputed constants
+# in Clark notation.
+# usage: python gen_clarknames.py
+
+import os
+import re
+import io
+
+from ezodf.const import ALL_NSMAP
+
+PACKAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ezodf')
+OUTPUT = os.path.join(PACKAGE, 'clarknames.py')
+CN_CALL = re.compile(r"""CN\(\s*['"]([\w.-]+:[\w.-]+)['"]\s*\)""")
+CLARKNAMES_IMPORT = re.compile(r"from\s+(?:ezodf)?\.clarknames\s+import\s+(\([^)]*\)|[^\n]*)")
+CLARKNAMES_ATTRIBUTE = re.compile(r"\bclarknames\.([A-Z][A-Z0-9_]*)")
+CONSTANT = re.compile(r"\b[A-Z][A-Z0-9_]*\b")
+
+HEADER = '''#!/usr/bin/env python
+#coding:utf-8
+# Purpose: precomputed Clark notation names of ODF tags and attributes
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Generated by gen_clarknames.py - do not edit!
+# Constant names: 'table:table-cell' -> TABLE_TABLE_CELL
+'''
+
+def constant_name(name):
+    return re.sub(r'[^A-Z0-9]', '_', name.upper())
+
+def name_of_constant(constant):
+    # the reverse of constant_name(), ODF names use '-' as word separator
+    prefix, local = constant.lower().split('_', 1)
+    if prefix not in ALL_NSMAP:
+        raise ValueError("unknown namespace prefix of constant '%s'." % constant)
+    return "%s:%s" % (prefix, local.replace('_', '-'))
+
+def imported_constants(source):
+    constants = set(CLARKNAMES_ATTRIBUTE.findall(source))
+    for names in CLARKNAMES_IMPORT.findall(source):
+        constants.update(CONSTANT.findall(names))
+    return constants
+
+def collect_names(folder):
+    names = set()
+    for filename in sorted(os.listdir(folder)):
+        if filename.endswith('.py') and filename != 'clarknames.py':
+            with io.open(os.path.join(folder, filename), encoding='utf-8') as fp:
+                source = fp.read()
+            names.update(CN_CALL.findall(source))
+            names.update(name_of_constant(constant) for constant in imported_constants(source))
+    return names
+
+def clark_name(name):
+    prefix, local = name.split(':')
+    return "{%s}%s" % (ALL_NSMAP[prefix], local)
+
+def generate(names):
+    lines = [HEADER]
+    for name in sorted(names, key=constant_name):
+        lines.append("%s = '%s'\n" % (constant_name(name), clark_name(name)))
+    return ''.join(lines)
+
+def main():
+    names = collect_names(PACKAGE)
+    with io.open(OUTPUT, 'w', encoding='utf-8') as fp:
+        fp.write(generate(names))
+    print("%d names written to '%s'." % (len(names), OUTPUT))
+
+if __name__ == '__main__':
+    main()
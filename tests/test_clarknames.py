@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test precomputed clark names
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+# trusted or separately tested modules
+from ezodf.xmlns import CN, XML
+
+# objects to test
+from ezodf import clarknames
+
+def constants():
+    return [(name, getattr(clarknames, name)) for name in dir(clarknames) if name.isupper()]
+
+class TestClarkNames(unittest.TestCase):
+    def test_matches_cn(self):
+        self.assertEqual(CN('table:table-cell'), clarknames.TABLE_TABLE_CELL)
+        self.assertEqual(CN('office:value-type'), clarknames.OFFICE_VALUE_TYPE)
+        self.assertEqual(CN('table:number-columns-repeated'), clarknames.TABLE_NUMBER_COLUMNS_REPEATED)
+
+    def test_all_names_in_known_namespaces(self):
+        for name, clark in constants():
+            uri, local = clark[1:].split('}')
+            prefix = XML.uri2prefix[uri]
+            expected = ("%s_%s" % (prefix, local)).upper().replace('-', '_').replace('.', '_')
+            self.assertEqual(expected, name)
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test command line interface
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# trusted or separately tested modules
+import ezodf
+
+# objects to test
+from ezodf.cli import main, find_files
+
+
+def read(filename):
+    with io.open(filename, encoding='utf-8', newline='') as stream:
+        return stream.read()
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.folder, 'out')
+        self.ods = self.filename('data.ods')
+        doc = ezodf.newdoc('ods', self.ods)
+        sheet = ezodf.Table('First Sheet', size=(3, 3))
+        sheet.set_values('A1', [(1, 'a,b', True), (2.5, None, 'c')])
+        doc.sheets += sheet
+        doc.sheets += ezodf.Table('Sheet2', size=(2, 2))
+        doc.sheets['Sheet2']['B2'].set_value('second')
+        doc.save()
+        self.odt = self.filename('text.odt')
+        doc = ezodf.newdoc('odt', self.odt)
+        doc.body += ezodf.Heading('Title')
+        doc.body += ezodf.Paragraph('Hello')
+        doc.save()
+        self.stdout, self.stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = io.StringIO(), io.StringIO()
+
+    def tearDown(self):
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+        shutil.rmtree(self.folder)
+
+    def filename(self, name):
+        return os.path.join(self.folder, name)
+
+    def output(self, name):
+        return os.path.join(self.output_dir, name)
+
+    def run_main(self, *args):
+        return main(list(args) + ['-j', '1'])
+
+    def test_find_files(self):
+        with open(self.filename('readme.txt'), 'w') as stream:
+            stream.write('ignore me')
+        self.assertEqual([(self.ods, 'data.ods'), (self.odt, 'text.odt')],
+                         find_files([self.folder]))
+        self.assertEqual([(self.ods, 'data.ods')], find_files([self.ods]))
+
+    def test_to_csv(self):
+        self.assertEqual(0, self.run_main('to-csv', '-o', self.output_dir, self.ods))
+        self.assertEqual('1,"a,b",TRUE\r\n2.5,,c\r\n', read(self.output('data-First_Sheet.csv')))
+        self.assertEqual('\r\n,second\r\n', read(self.output('data-Sheet2.csv')))
+
+    def test_to_csv_of_sheets_with_the_same_safe_name(self):
+        doc = ezodf.opendoc(self.ods)
+        doc.sheets += ezodf.Table('a/b', size=(1, 1))
+        doc.sheets += ezodf.Table('a_b', size=(1, 1))
+        doc.sheets['a/b']['A1'].set_value('first')
+        doc.sheets['a_b']['A1'].set_value('second')
+        doc.save()
+        self.assertEqual(0, self.run_main('to-csv', '-o', self.output_dir, self.ods))
+        self.assertEqual('first\r\n', read(self.output('data-a_b.csv')))
+        self.assertEqual('second\r\n', read(self.output('data-a_b-2.csv')))
+
+    def test_to_csv_of_one_sheet(self):
+        self.assertEqual(0, self.run_main('to-csv', '--sheet', '1', self.ods))
+        self.assertEqual('\r\n,second\r\n', read(self.filename('data.csv')))
+
+    def test_to_text(self):
+        self.assertEqual(0, self.run_main('to-text', '-o', self.output_dir, self.ods, self.odt))
+        self.assertEqual('1\ta,b\tTRUE\n2.5\t\tc\n\n\n\tsecond\n', read(self.output('data.txt')))
+        self.assertEqual('Title\nHello\n', read(self.output('text.txt')))
+
+    def test_to_jsonl(self):
+        self.assertEqual(0, self.run_main('to-jsonl', '-o', self.output_dir, self.ods, self.odt))
+        records = [json.loads(line) for line in read(self.output('data.jsonl')).splitlines()]
+        self.assertEqual({'sheet': 'First Sheet', 'values': [1., 'a,b', True]}, records[0])
+        self.assertEqual(4, len(records))
+        records = [json.loads(line) for line in read(self.output('text.jsonl')).splitlines()]
+        self.assertEqual([{'kind': 'Heading', 'text': 'Title'},
+                          {'kind': 'Paragraph', 'text': 'Hello'}], records)
+
+    def test_info(self):
+        self.assertEqual(0, self.run_main('info', self.ods, self.odt))
+        result = sys.stdout.getvalue()
+        self.assertTrue("sheet 'First Sheet': 2 rows x 3 columns" in result)
+        self.assertTrue("1 paragraphs, 1 headings" in result)
+
+    def test_failures(self):
+        broken = self.filename('broken.ods')
+        with open(broken, 'w') as stream:
+            stream.write('no ODF file')
+        self.assertEqual(1, self.run_main('to-csv', '-o', self.output_dir, self.odt, broken))
+        report = sys.stderr.getvalue()
+        self.assertTrue('text.odt FAILED: TypeError' in report)
+        self.assertTrue('broken.ods FAILED' in report)
+        self.assertTrue('2 files, 2 failed' in report)
+
+    def test_incomplete_output_is_removed(self):
+        self.assertEqual(1, self.run_main('to-text', '-o', self.output_dir,
+                                          '--sheet', 'unknown', self.ods))
+        self.assertFalse(os.path.exists(self.output('data.txt')))
+
+    def make_subfolder_copy(self):
+        subfolder = self.filename('sub')
+        os.mkdir(subfolder)
+        copy = os.path.join(subfolder, 'data.ods')
+        shutil.copy(self.ods, copy)
+        return copy
+
+    def test_relative_output_paths_of_directories(self):
+        self.make_subfolder_copy()
+        self.assertEqual(0, self.run_main('to-jsonl', '-o', self.output_dir, self.folder))
+        self.assertTrue(os.path.exists(self.output('data.jsonl')))
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'sub', 'data.jsonl')))
+
+    def test_output_collisions(self):
+        copy = self.make_subfolder_copy()
+        self.assertEqual(1, self.run_main('to-jsonl', '-o', self.output_dir, self.ods, copy))
+        report = sys.stderr.getvalue()
+        self.assertTrue('sub%sdata.ods FAILED: output' % os.sep in report)
+        self.assertTrue('2 files, 1 failed' in report)
+        self.assertTrue(os.path.exists(self.output('data.jsonl')))
+
+    def test_process_pool(self):
+        self.assertEqual(0, main(['to-jsonl', '-j', '2', '-o', self.output_dir, self.folder]))
+        self.assertTrue(os.path.exists(self.output('data.jsonl')))
+        self.assertTrue(os.path.exists(self.output('text.jsonl')))
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test CSV import
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import io
+import os
+import tempfile
+from datetime import date, datetime
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.conf import config
+from ezodf.streamreader import iter_rows
+
+# objects to test
+from ezodf.csvimport import infer_value, iter_csv_rows
+from ezodf.table import Table
+
+CSV = 'name,qty,price,ok,day\r\n' \
+      'apple,3,1.5,TRUE,2026-10-18\r\n' \
+      '007,-2,1e3,false,2026-10-18T12:30:00\r\n' \
+      'short\r\n'
+
+
+def stream(content=CSV):
+    return io.StringIO(content, newline='')
+
+
+class TestInferValue(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(3, infer_value('3'))
+        self.assertTrue(isinstance(infer_value('3'), int))
+        self.assertEqual(-2.5, infer_value('-2.5'))
+        self.assertEqual(1000., infer_value('1e3'))
+        self.assertEqual(0, infer_value('0'))
+
+    def test_no_numbers(self):
+        for text in ('007', '1.', '1,5', '+', '1-2', '12 cats'):
+            self.assertEqual(text, infer_value(text))
+
+    def test_booleans(self):
+        self.assertTrue(infer_value('TRUE') is True)
+        self.assertTrue(infer_value('false') is False)
+        self.assertEqual('truely', infer_value('truely'))
+
+    def test_dates(self):
+        self.assertEqual(date(2026, 10, 18), infer_value('2026-10-18'))
+        self.assertEqual(datetime(2026, 10, 18, 12, 30, 0, 500000),
+                         infer_value('2026-10-18T12:30:00.5'))
+        self.assertEqual('2026-02-30', infer_value('2026-02-30'))
+
+    def test_empty_field(self):
+        self.assertIsNone(infer_value(''))
+
+    def test_strings(self):
+        self.assertEqual('apple', infer_value('apple'))
+
+
+class TestTableFromCSV(unittest.TestCase):
+    def test_from_csv(self):
+        table = Table.from_csv(stream(), name='Data')
+        self.assertEqual('Data', table.name)
+        self.assertEqual((4, 5), (table.nrows(), table.ncols()))
+        self.assertEqual('apple', table['A2'].value)
+        self.assertEqual('007', table['A3'].value)
+        self.assertEqual(3., table['B2'].value)
+        self.assertEqual(1000., table['C3'].value)
+        self.assertTrue(table['D2'].value)
+        self.assertEqual('date', table['E2'].value_type)
+        self.assertEqual('2026-10-18T12:30:00', table['E3'].value)
+
+    def test_short_rows_are_filled(self):
+        table = Table.from_csv(stream())
+        self.assertEqual(['short', None, None, None, None],
+                         [cell.value for cell in table.row(3)])
+        self.assertEqual(5, len(table.xmlnode.findall('.//' + ezodf.xmlns.CN('table:table-column'))))
+
+    def test_table_is_loaded_without_normalization(self):
+        table = Table.from_csv(stream())
+        self.assertTrue(table.is_loaded())
+        table.append_rows(2)
+        self.assertEqual(6, table.nrows())
+
+    def test_without_type_inference(self):
+        table = Table.from_csv(stream(), infer_types=False)
+        self.assertEqual('string', table['B2'].value_type)
+        self.assertEqual('3', table['B2'].value)
+        self.assertIsNone(table['B4'].value)
+
+    def test_format_parameters(self):
+        table = Table.from_csv(stream('a;1\r\nb;2\r\n'), delimiter=';')
+        self.assertEqual((2, 2), (table.nrows(), table.ncols()))
+        self.assertEqual(2., table['B2'].value)
+
+    def test_whitespace_encoding(self):
+        table = Table.from_csv(stream('"a  b\tc"\r\n'))
+        self.assertEqual('a  b\tc', table['A1'].value)
+
+    def test_empty_file(self):
+        table = Table.from_csv(stream(''))
+        self.assertEqual((1, 1), (table.nrows(), table.ncols()))
+
+    def test_from_filename(self):
+        fd, filename = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+        try:
+            with io.open(filename, 'w', encoding='utf-8', newline='') as fp:
+                fp.write('äpfel,1\r\n')
+            table = Table.from_csv(filename)
+            self.assertEqual('äpfel', table['A1'].value)
+        finally:
+            os.remove(filename)
+
+    def test_runlength_strategy(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table.from_csv(stream())
+            self.assertEqual((4, 5), (table.nrows(), table.ncols()))
+            self.assertEqual('apple', table['A2'].value)
+        finally:
+            config.reset_table_expand_strategy()
+
+
+class TestImportCSV(unittest.TestCase):
+    def test_import_csv(self):
+        doc = ezodf.newdoc('ods')
+        table = doc.sheets.import_csv(stream())
+        self.assertEqual('Sheet1', table.name)
+        self.assertTrue(doc.sheets['Sheet1'] is table)
+        self.assertEqual('Data', doc.sheets.import_csv(stream(), name='Data').name)
+        self.assertEqual(2, len(doc.sheets))
+
+    def test_streaming_writer(self):
+        result = io.BytesIO()
+        with ezodf.StreamingSpreadsheetWriter(result) as writer:
+            writer.import_csv(stream(), 'Data')
+        rows = list(iter_rows(result, 'Data'))
+        self.assertEqual(list(iter_csv_rows(stream()))[1], ['apple', 3, 1.5, True, date(2026, 10, 18)])
+        self.assertEqual(('apple', 3., 1.5, True, '2026-10-18'), rows[1])
+        self.assertEqual(('short', ), rows[3])
+
+if __name__=='__main__':
+    unittest.main()
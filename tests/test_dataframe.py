@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test pandas DataFrame import and export
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from datetime import datetime, timedelta
+from io import BytesIO
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.xmlns import etree
+from ezodf.conf import config
+
+# objects to test
+from ezodf.table import Table
+
+TABLE_WITH_REPEATS = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+  xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+  xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" table:name="Repeats">
+<table:table-column table:number-columns-repeated="1024"/>
+<table:table-row>
+  <table:table-cell office:value-type="string"><text:p>a</text:p></table:table-cell>
+  <table:table-cell office:value-type="string"><text:p>b</text:p></table:table-cell>
+  <table:table-cell table:number-columns-repeated="1022"/>
+</table:table-row>
+<table:table-row table:number-rows-repeated="3">
+  <table:table-cell office:value-type="float" office:value="1"/>
+  <table:table-cell office:value-type="date" office:date-value="2026-10-18"/>
+  <table:table-cell table:number-columns-repeated="1022"/>
+</table:table-row>
+<table:table-row table:number-rows-repeated="1048572">
+  <table:table-cell table:number-columns-repeated="1024"/>
+</table:table-row>
+</table:table>
+"""
+
+@unittest.skipUnless(pandas, "pandas not installed.")
+class TestDataFrameExport(unittest.TestCase):
+    def setUp(self):
+        self.doc = ezodf.newdoc('ods')
+        self.dataframe = pandas.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['a', 'b', None],
+            'price': [1.5, float('nan'), 3.0],
+            'flag': [True, False, True],
+            'when': [datetime(2026, 1, 1), datetime(2026, 2, 3, 12, 30), None],
+        })
+
+    def test_from_dataframe(self):
+        table = self.doc.sheets.from_dataframe(self.dataframe, name='Data')
+        self.assertTrue(table is self.doc.sheets['Data'])
+        self.assertEqual((4, 5), (table.nrows(), table.ncols()))
+        self.assertEqual('id', table['A1'].value)
+        self.assertEqual(2., table['A3'].value)
+        self.assertIsNone(table['B4'].value)
+        self.assertIsNone(table['C3'].value)
+        self.assertEqual('boolean', table['D2'].value_type)
+        self.assertEqual('date', table['E3'].value_type)
+
+    def test_default_name(self):
+        table = self.doc.sheets.from_dataframe(self.dataframe)
+        self.assertEqual('Sheet1', table.name)
+
+    def test_without_header_with_index(self):
+        table = self.doc.sheets.from_dataframe(self.dataframe, header=False, index=True)
+        self.assertEqual((3, 6), (table.nrows(), table.ncols()))
+        self.assertEqual(0., table['A1'].value)
+
+    def test_currency(self):
+        table = self.doc.sheets.from_dataframe(self.dataframe, currency={'price': 'EUR'})
+        self.assertEqual('currency', table['C2'].value_type)
+        self.assertEqual('EUR', table['C2'].currency)
+        self.assertIsNone(table['C3'].value_type)
+
+    def test_round_trip(self):
+        self.doc.sheets.from_dataframe(self.dataframe, name='Data')
+        doc = ezodf.opendoc(BytesIO(self.doc.tobytes()))
+        result = doc.sheets['Data'].to_dataframe(dtypes={'id': 'int64'})
+        self.assertEqual(list(self.dataframe.columns), list(result.columns))
+        self.assertEqual([1, 2, 3], result['id'].tolist())
+        self.assertTrue(pandas.isna(result['price'][1]))
+        self.assertEqual([True, False, True], result['flag'].tolist())
+        self.assertEqual(datetime(2026, 2, 3, 12, 30), result['when'][1])
+        self.assertTrue(pandas.isna(result['when'][2]))
+
+@unittest.skipUnless(pandas, "pandas not installed.")
+class TestDataFrameImport(unittest.TestCase):
+    def test_without_header(self):
+        table = Table(size=(3, 3))
+        table.set_values('A1', [(1, 'x'), (2, 'y')])
+        dataframe = table.to_dataframe(header=False)
+        # trailing empty rows and columns are removed
+        self.assertEqual((2, 2), dataframe.shape)
+        self.assertEqual([0, 1], list(dataframe.columns))
+
+    def test_usecols(self):
+        table = Table(size=(3, 3))
+        table.set_values('A1', [('a', 'b', 'c'), (1, 2, 3)])
+        dataframe = table.to_dataframe(usecols=['c', 0])
+        self.assertEqual(['c', 'a'], list(dataframe.columns))
+        self.assertEqual([3.], dataframe['c'].tolist())
+
+    def test_unknown_usecols(self):
+        table = Table(size=(3, 3))
+        table.set_values('A1', [('a', 'b', 'c'), (1, 2, 3)])
+        for usecols in (['a', 'foo'], [3], [True]):
+            with self.assertRaises(ValueError):
+                table.to_dataframe(usecols=usecols)
+        self.assertEqual(['c'], list(table.to_dataframe(usecols=[-1]).columns))
+
+    def test_unnamed_columns(self):
+        table = Table(size=(2, 2))
+        table.set_values('A1', [('a', None), (1, 2)])
+        self.assertEqual(['a', 'Unnamed: 1'], list(table.to_dataframe().columns))
+
+    def test_repeated_header_names(self):
+        table = Table(size=(3, 3))
+        table.set_values('A1', [('a', 'a', 'b'), (1, 2, 3), (4, 5, 6)])
+        dataframe = table.to_dataframe()
+        self.assertEqual(['a', 'a', 'b'], list(dataframe.columns))
+        self.assertEqual([1., 4.], dataframe.iloc[:, 0].tolist())
+        self.assertEqual([2., 5.], dataframe.iloc[:, 1].tolist())
+        self.assertEqual([3., 6.], dataframe['b'].tolist())
+
+    def test_time_values(self):
+        table = Table(size=(2, 1))
+        table.set_values('A1', [('duration',)])
+        table['A2'].set_value('PT1H30M00S', value_type='time')
+        self.assertEqual(timedelta(hours=1, minutes=30), table.to_dataframe()['duration'][0])
+
+    def test_repeated_rows_are_not_expanded(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(TABLE_WITH_REPEATS))
+            dataframe = table.to_dataframe()
+            self.assertEqual((3, 2), dataframe.shape)
+            self.assertEqual([1., 1., 1.], dataframe['a'].tolist())
+            self.assertEqual(datetime(2026, 10, 18), dataframe['b'][0])
+            self.assertEqual(3, len(table.xmlnode.findall(etree.QName(table.xmlnode[1]).text)))
+        finally:
+            config.reset_table_expand_strategy()
+
+if __name__=='__main__':
+    unittest.main()
@@ -51,6 +51,49 @@ class TestDocumentCopy(unittest.TestCase):
         for filename in ['empty.odt', 'empty.ods', 'empty.odg', 'empty.odp']:
             self.open_and_saveas(filename, "open and saveas faild on '%s'" % filename)
 
+class TestDocumentClose(unittest.TestCase):
+    def test_context_manager(self):
+        with document.opendoc(getdatafile('empty.ods')) as doc:
+            self.assertEqual('ods', doc.doctype)
+        self.assertIsNone(doc.filemanager._zipfile)
+
+    def test_close_clears_wrapper_cache(self):
+        doc = document.opendoc(getdatafile('empty.ods'))
+        table = doc.sheets[0]
+        self.assertTrue(table is doc.sheets[0])
+        doc.close()
+        self.assertEqual(0, len(doc.sheets.cache))
+        self.assertFalse(table is doc.sheets[0])
+
+    def test_usable_after_close(self):
+        infile = getdatafile('empty.ods')
+        outfile = getdatafile('closed.empty.ods')
+        doc = document.opendoc(infile)
+        doc.close()
+        doc.saveas(outfile)
+        doc.close()
+        names = get_zip_names(outfile)
+        remove(outfile)
+        self.assertSequenceEqual(sorted(get_zip_names(infile)), sorted(names))
+
+class TestDocumentCompression(unittest.TestCase):
+    def test_saveas_stored(self):
+        infile = getdatafile('empty.odt')
+        outfile = getdatafile('stored.empty.odt')
+        with document.opendoc(infile) as doc:
+            doc.saveas(outfile, compresslevel=0, workers=2)
+        self.assertTrue(check_zipfile_for_oasis_validity(outfile, b"application/vnd.oasis.opendocument.text"))
+        with zipfile.ZipFile(outfile) as zf:
+            self.assertEqual(zipfile.ZIP_STORED, zf.getinfo('content.xml').compress_type)
+        remove(outfile)
+
+    def test_flat_xml_document_is_not_compressed(self):
+        doc = document.FlatXMLDocument('odt', getdatafile('flat.fodt'))
+        with self.assertRaises(TypeError):
+            doc.save(compresslevel=0)
+        with self.assertRaises(TypeError):
+            doc.saveas(getdatafile('flat.fodt'), workers=2)
+
 FAKESTYLE = """<style:style style:name="Standard" style:family="paragraph"
 style:class="text"/>"""
 
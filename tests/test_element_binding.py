@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test native element binding
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import io
+import threading
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.table import Table
+from ezodf.cells import Cell
+from ezodf.text import Paragraph
+
+# objects to test
+from ezodf.conf import config
+from ezodf.xmlns import BoundElement, parse_xml, wrap, CN, _class_registry
+
+def create_spreadsheet():
+    doc = ezodf.newdoc('ods')
+    table = doc.sheets.append(Table('Sheet1', size=(3, 3)))
+    table.set_values('A1', [(1, 'a'), (2, 'b')])
+    stream = io.BytesIO()
+    doc.saveas(stream)
+    return stream.getvalue()
+
+XMLCONTENT = '<text:p xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">' \
+             '<text:span>span</text:span><unknown/></text:p>'
+
+class TestNativeBinding(unittest.TestCase):
+    def setUp(self):
+        config.set_element_binding('native')
+
+    def tearDown(self):
+        config.reset_element_binding()
+
+    def test_binding(self):
+        self.assertEqual('native', config.get_element_binding())
+
+    def test_invalid_binding(self):
+        with self.assertRaises(ValueError):
+            config.set_element_binding('unknown')
+
+    def test_parsed_element_classes(self):
+        xmlnode = parse_xml(XMLCONTENT)
+        self.assertTrue(isinstance(xmlnode, BoundElement))
+        self.assertTrue(xmlnode.WRAPPER is Paragraph)
+        self.assertEqual('GenericWrapper', xmlnode[1].WRAPPER.TAG)
+
+    def test_wrapper_is_reused(self):
+        xmlnode = parse_xml(XMLCONTENT)
+        paragraph = wrap(xmlnode)
+        self.assertTrue(isinstance(paragraph, Paragraph))
+        self.assertTrue(paragraph is wrap(xmlnode))
+        self.assertTrue(paragraph[0] is paragraph[0])
+        self.assertEqual('GenericWrapper', paragraph[1].kind)
+
+    def test_new_wrapper_objects(self):
+        cell = Cell(1)
+        self.assertTrue(isinstance(cell.xmlnode, BoundElement))
+        self.assertTrue(cell is wrap(cell.xmlnode))
+
+    def test_opened_spreadsheet(self):
+        doc = ezodf.opendoc(io.BytesIO(create_spreadsheet()))
+        table = doc.sheets[0]
+        self.assertTrue(isinstance(table.xmlnode, BoundElement))
+        cell = table['A2']
+        self.assertTrue(cell is table['A2'])
+        self.assertEqual(2., cell.value)
+        self.assertEqual(['a', 'b', None], table.column_values('B1'))
+
+    def test_parser_per_thread(self):
+        parsers = []
+        elements = []
+        def parse():
+            parsers.append(_class_registry.parser)
+            elements.append(parse_xml(XMLCONTENT))
+        threads = [threading.Thread(target=parse) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(4, len(set(id(parser) for parser in parsers)))
+        self.assertFalse(_class_registry.parser in parsers)
+        for xmlnode in elements:
+            self.assertTrue(isinstance(wrap(xmlnode), Paragraph))
+
+    def test_covered_cell(self):
+        doc = ezodf.opendoc(io.BytesIO(create_spreadsheet()))
+        table = doc.sheets[0]
+        table.set_cell_span('A1', (2, 2))
+        self.assertTrue(table['B2'].covered)
+        self.assertEqual(CN('table:covered-table-cell'), table['B2'].xmlnode.tag)
+
+
+class TestWrapperBinding(unittest.TestCase):
+    def test_default_binding(self):
+        self.assertEqual('wrapper', config.get_element_binding())
+
+    def test_new_wrapper_objects(self):
+        xmlnode = parse_xml(XMLCONTENT)
+        self.assertFalse(isinstance(xmlnode, BoundElement))
+        self.assertFalse(wrap(xmlnode) is wrap(xmlnode))
+
+if __name__=='__main__':
+    unittest.main()
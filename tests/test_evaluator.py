@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test formula evaluator
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.table import Table
+from ezodf.conf import config
+
+# objects to test
+from ezodf.evaluator import Evaluator, FormulaError, parse_expression, _IntervalIndex
+
+
+class TestParser(unittest.TestCase):
+    def test_precedence(self):
+        tree = parse_expression('of:=1+2*3')
+        self.assertEqual(('binary', '+', ('number', 1.), ('binary', '*', ('number', 2.), ('number', 3.))), tree)
+
+    def test_function_call(self):
+        tree = parse_expression('of:=SUM(1;2)')
+        self.assertEqual(('call', 'SUM', [('number', 1.), ('number', 2.)]), tree)
+
+    def test_invalid(self):
+        with self.assertRaises(FormulaError):
+            parse_expression('of:=1+')
+        with self.assertRaises(FormulaError):
+            parse_expression('of:=(1')
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_find(self):
+        intervals = [(start, start + length) for start in range(20) for length in (1, 2, 3, 7, 16)]
+        index = _IntervalIndex()
+        for start, stop in intervals:
+            index.add(start, stop, (start, stop))
+        index.sort()
+        for position in range(-1, 40):
+            expected = sorted(interval for interval in intervals
+                              if interval[0] <= position < interval[1])
+            self.assertEqual(expected, sorted(index.find(position)))
+
+
+class TestEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.doc = ezodf.newdoc('ods')
+        self.data = self.doc.sheets.append(Table('Data', size=(5, 3)))
+        self.calc = self.doc.sheets.append(Table('Calc', size=(5, 3)))
+        self.data.set_values('A1', [(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')])
+
+    def evaluate(self, formula, cell='C5'):
+        self.calc[cell].formula = formula
+        Evaluator(self.doc.sheets).recalculate()
+        return self.calc[cell].value
+
+    def test_arithmetic(self):
+        self.assertEqual(7., self.evaluate('of:=1+2*3'))
+        self.assertEqual(-7., self.evaluate('of:=-(1+2*3)'))
+        self.assertEqual(2., self.evaluate('of:=2^3/4'))
+        self.assertEqual(.5, self.evaluate('of:=50%'))
+
+    def test_strings(self):
+        self.assertEqual('ab', self.evaluate('of:="a"&[Data.B2]'))
+        self.assertEqual('string', self.calc['C5'].value_type)
+
+    def test_comparison(self):
+        self.assertTrue(self.evaluate('of:=[Data.A2]>=2'))
+
+    def test_aggregates(self):
+        self.assertEqual(10., self.evaluate('of:=SUM([Data.A1:.A4])'))
+        self.assertEqual(2.5, self.evaluate('of:=AVERAGE([Data.A1:.B4])'))
+        self.assertEqual(1., self.evaluate('of:=MIN([Data.A1:.A4])'))
+        self.assertEqual(4., self.evaluate('of:=MAX([Data.A:.A])'))
+        self.assertEqual(4., self.evaluate('of:=COUNT([Data.A1:.B5])'))
+
+    def test_if(self):
+        self.assertEqual('yes', self.evaluate('of:=IF([Data.A1]=1;"yes";1/0)'))
+        self.assertFalse(self.evaluate('of:=IF(FALSE())'))
+
+    def test_vlookup(self):
+        self.assertEqual('c', self.evaluate('of:=VLOOKUP(3;[Data.A1:.B4];2;0)'))
+        self.assertEqual('b', self.evaluate('of:=VLOOKUP(2.5;[Data.A1:.B4];2)'))
+        self.assertEqual('#N/A', self.evaluate('of:=VLOOKUP(9;[Data.A1:.B4];2;0)'))
+
+    def test_errors(self):
+        self.assertEqual('#DIV/0!', self.evaluate('of:=1/0'))
+        self.assertEqual('#VALUE!', self.evaluate('of:=1+[Data.B1]'))
+        self.assertEqual('#NAME?', self.evaluate('of:=UNKNOWN(1)'))
+        self.assertEqual('#REF!', self.evaluate('of:=[Unknown.A1]'))
+
+    def test_error_propagation(self):
+        self.calc['A1'].formula = 'of:=1/0'
+        self.assertEqual('#DIV/0!', self.evaluate('of:=SUM([.A1:.A2])'))
+
+    def test_circular_reference(self):
+        self.calc['A1'].formula = 'of:=[.A2]+1'
+        self.calc['A2'].formula = 'of:=[.A1]+1'
+        Evaluator(self.doc.sheets).recalculate()
+        self.assertEqual('Err:522', self.calc['A1'].value)
+        self.assertEqual('Err:522', self.calc['A2'].value)
+
+    def test_dependency_order(self):
+        # formulas referencing formulas below and in other sheets
+        self.calc['A1'].formula = 'of:=[.A2]*2'
+        self.calc['A2'].formula = 'of:=[Data.C1]+1'
+        self.data['C1'].formula = 'of:=SUM([Calc.B1:.B3])'
+        self.calc['B1'].set_value(5)
+        self.assertEqual(3, Evaluator(self.doc.sheets).recalculate())
+        self.assertEqual(12., self.calc['A1'].value)
+
+
+class TestIncrementalRecalculation(unittest.TestCase):
+    def setUp(self):
+        self.doc = ezodf.newdoc('ods')
+        self.table = self.doc.sheets.append(Table('Sheet1', size=(5, 3)))
+        self.table.set_values('A1', [[1], [2], [3]])
+        self.table['B1'].formula = 'of:=SUM([.A1:.A3])'
+        self.table['B2'].formula = 'of:=[.B1]*2'
+        self.table['C1'].formula = 'of:=[.A4]+1'
+        self.evaluator = Evaluator(self.doc.sheets)
+        self.assertEqual(3, self.evaluator.recalculate())
+
+    def test_nothing_dirty(self):
+        self.assertEqual(0, self.evaluator.recalculate())
+
+    def test_range_dependents(self):
+        self.evaluator.set_value('Sheet1', (1, 0), 10)
+        self.assertEqual(2, self.evaluator.recalculate())
+        self.assertEqual(14., self.table['B1'].value)
+        self.assertEqual(28., self.table['B2'].value)
+
+    def test_wide_range_dependents(self):
+        self.table['C5'].formula = 'of:=SUM([.A1:.C1])'
+        self.evaluator.update()
+        self.evaluator.recalculate()
+        self.evaluator.set_value('Sheet1', (0, 0), 5)
+        self.assertEqual(3, self.evaluator.recalculate())
+        self.assertEqual(10., self.table['B1'].value)
+        self.assertEqual(16., self.table['C5'].value)
+
+    def test_cell_dependents(self):
+        self.table['A4'].set_value(5)
+        self.evaluator.mark_dirty('Sheet1', (3, 0))
+        self.assertEqual(1, self.evaluator.recalculate())
+        self.assertEqual(6., self.table['C1'].value)
+
+    def test_update(self):
+        self.table['C2'].formula = 'of:=[.B2]+1'
+        self.evaluator.update()
+        self.assertEqual(4, self.evaluator.recalculate())
+        self.assertEqual(13., self.table['C2'].value)
+
+
+class TestRunLengthTable(unittest.TestCase):
+    def setUp(self):
+        config.set_table_expand_strategy('runlength')
+
+    def tearDown(self):
+        config.reset_table_expand_strategy()
+
+    def test_repeated_rows(self):
+        table = Table('Sheet1', size=(1000, 2))
+        table['A1'].set_value(1)
+        table['B1000'].formula = 'of:=SUM([.A1:.A999])+COUNT([.A2:.A999])'
+        Evaluator([table]).recalculate()
+        self.assertEqual(1., table['B1000'].value)
+
+if __name__=='__main__':
+    unittest.main()
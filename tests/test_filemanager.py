@@ -10,6 +10,7 @@ __author__ = "mozman <mozman@gmx.at>"
 # Standard Library
 import os
 import zipfile
+from io import BytesIO
 
 # Standard Library
 try:
@@ -125,5 +126,164 @@ class TestFileManager(unittest.TestCase):
         self.assertTrue(check_zipfile_for_oasis_validity(SAVENAME, mimetype))
         os.remove(SAVENAME)
 
+
+class CountingFileManager(filemanager.FileManager):
+    opened = 0
+
+    def _open_bytestream(self):
+        CountingFileManager.opened += 1
+        return super(CountingFileManager, self)._open_bytestream()
+
+
+class TestFileManagerArchiveHandle(unittest.TestCase):
+    def setUp(self):
+        CountingFileManager.opened = 0
+
+    def test_open_zipfile_once(self):
+        fm = CountingFileManager(getdatafile('empty.ods'))
+        for name in ('mimetype', 'meta.xml', 'styles.xml', 'content.xml'):
+            self.assertIsNotNone(fm.get_bytes(name))
+        self.assertEqual(1, CountingFileManager.opened)
+        fm.close()
+
+    def test_missing_member(self):
+        with CountingFileManager(getdatafile('empty.ods')) as fm:
+            self.assertIsNone(fm.get_bytes('does-not-exist.xml'))
+
+    def test_reopen_after_close(self):
+        fm = CountingFileManager(getdatafile('empty.ods'))
+        fm.close()
+        self.assertIsNotNone(fm.get_bytes('mimetype'))
+        self.assertEqual(2, CountingFileManager.opened)
+        fm.close()
+
+    def test_without_zipfile(self):
+        fm = filemanager.FileManager()
+        self.assertFalse(fm.has_zip())
+        self.assertIsNone(fm.get_bytes('mimetype'))
+        fm.close()
+
+    def test_save_inplace(self):
+        filename = getdatafile('archive.handle.ods')
+        with open(getdatafile('empty.ods'), 'rb') as fp:
+            content = fp.read()
+        with open(filename, 'wb') as fp:
+            fp.write(content)
+        with filemanager.FileManager(filename) as fm:
+            fm.register('mimetype', fm.get_bytes('mimetype'))
+            fm.save(filename, backup=False)
+            self.assertIsNotNone(fm.get_bytes('content.xml'))
+        os.remove(filename)
+
+class TestRawCopy(unittest.TestCase):
+    def setUp(self):
+        self.source = BytesIO()
+        with zipfile.ZipFile(self.source, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('Pictures/image.png', b'PNG' * 10000)
+            zf.writestr(zipfile.ZipInfo('stored.txt'), b'stored')
+            zf.writestr('settings.xml', b'<settings/>')
+
+    def copy(self, ignore=(), store=False):
+        target = BytesIO()
+        with zipfile.ZipFile(self.source) as fromzip:
+            if not store:
+                # decompressing is not allowed
+                fromzip.read = None
+            with zipfile.ZipFile(target, 'w') as tozip:
+                filemanager.FileManager._copy_from_zip_to_zip(fromzip, tozip, ignore, store)
+        return zipfile.ZipFile(target)
+
+    def test_copy_all_members(self):
+        result = self.copy()
+        self.assertIsNone(result.testzip())
+        self.assertEqual(b'PNG' * 10000, result.read('Pictures/image.png'))
+        self.assertEqual(b'stored', result.read('stored.txt'))
+        self.assertEqual(b'<settings/>', result.read('settings.xml'))
+
+    def test_keep_compression(self):
+        result = self.copy()
+        source = zipfile.ZipFile(self.source)
+        for name in ('Pictures/image.png', 'stored.txt'):
+            expected = source.getinfo(name)
+            info = result.getinfo(name)
+            self.assertEqual(expected.compress_type, info.compress_type)
+            self.assertEqual(expected.compress_size, info.compress_size)
+            self.assertEqual(expected.CRC, info.CRC)
+
+    def test_store_members(self):
+        result = self.copy(store=True)
+        self.assertIsNone(result.testzip())
+        for info in result.infolist():
+            self.assertEqual(zipfile.ZIP_STORED, info.compress_type)
+        self.assertEqual(b'PNG' * 10000, result.read('Pictures/image.png'))
+
+    def test_ignore_members(self):
+        result = self.copy(ignore=['settings.xml'])
+        self.assertEqual(['Pictures/image.png', 'stored.txt'], result.namelist())
+
+    def test_fallback_without_zipfile_internals(self):
+        internals = filemanager.ZIPFILE_INTERNALS
+        filemanager.ZIPFILE_INTERNALS = internals + ('_not_existing', )
+        target = BytesIO()
+        try:
+            with zipfile.ZipFile(self.source) as fromzip:
+                with zipfile.ZipFile(target, 'w') as tozip:
+                    self.assertFalse(filemanager.raw_write_supported(tozip))
+                    filemanager.FileManager._copy_from_zip_to_zip(fromzip, tozip, ())
+        finally:
+            filemanager.ZIPFILE_INTERNALS = internals
+        result = zipfile.ZipFile(target)
+        self.assertIsNone(result.testzip())
+        self.assertEqual(b'PNG' * 10000, result.read('Pictures/image.png'))
+
+    def test_encrypted_member_not_supported(self):
+        with zipfile.ZipFile(self.source) as fromzip:
+            zipinfo = fromzip.getinfo('settings.xml')
+            zipinfo.flag_bits |= filemanager.ENCRYPTED_FLAG
+            with zipfile.ZipFile(BytesIO(), 'w') as tozip:
+                self.assertFalse(filemanager.raw_copy_supported(fromzip, tozip, zipinfo))
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.fm = filemanager.FileManager()
+        self.fm.register('mimetype', 'application/vnd.oasis.opendocument.text')
+        self.fm.register('content.xml', 'content' * 1000, 'text/xml')
+        self.fm.register('styles.xml', 'styles' * 1000, 'text/xml')
+
+    def tozip(self, **options):
+        result = zipfile.ZipFile(BytesIO(self.fm.tobytes(**options)))
+        self.assertIsNone(result.testzip())
+        self.assertEqual('mimetype', result.namelist()[0])
+        self.assertEqual(zipfile.ZIP_STORED, result.getinfo('mimetype').compress_type)
+        self.assertEqual(b'content' * 1000, result.read('content.xml'))
+        return result
+
+    def test_store_mode(self):
+        result = self.tozip(compresslevel=0)
+        for info in result.infolist():
+            self.assertEqual(zipfile.ZIP_STORED, info.compress_type)
+
+    def test_store_mode_does_not_change_defaults(self):
+        self.tozip(compresslevel=0)
+        result = self.tozip()
+        self.assertEqual(zipfile.ZIP_DEFLATED, result.getinfo('content.xml').compress_type)
+
+    def test_compresslevel(self):
+        fast = self.tozip(compresslevel=1).getinfo('content.xml')
+        best = self.tozip(compresslevel=9).getinfo('content.xml')
+        self.assertEqual(zipfile.ZIP_DEFLATED, best.compress_type)
+        self.assertLessEqual(best.compress_size, fast.compress_size)
+
+    def test_workers(self):
+        result = self.tozip(compresslevel=6, workers=4)
+        self.assertEqual(b'styles' * 1000, result.read('styles.xml'))
+        self.assertEqual(['mimetype', 'META-INF/manifest.xml', 'content.xml', 'styles.xml'],
+                         result.namelist())
+
+    def test_invalid_compresslevel(self):
+        with self.assertRaises(ValueError):
+            self.fm.tobytes(compresslevel=10)
+
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test formula tokenizer and reference rewriting
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.table import Table
+from ezodf.conf import config
+
+# objects to test
+from ezodf.formula import tokenize, parse_formula, Reference, FormulaIndex
+
+
+class TestTokenizer(unittest.TestCase):
+    def test_tokens(self):
+        tokens = tokenize('of:=SUM([.A1:.B2])&"[.C3]"')
+        self.assertEqual([
+            ('other', 'of:=SUM('),
+            ('reference', '[.A1:.B2]'),
+            ('other', ')&'),
+            ('string', '"[.C3]"'),
+        ], tokens)
+
+    def test_quoted_sheet_name(self):
+        tokens = tokenize("of:=['Sheet ]1'.A1]+1")
+        self.assertEqual(('reference', "['Sheet ]1'.A1]"), tokens[1])
+
+    def test_escaped_quotes_in_string(self):
+        formula = 'of:="a""[.A1]"&[.B2]'
+        tokens = tokenize(formula)
+        self.assertEqual(('string', '"a""[.A1]"'), tokens[1])
+        self.assertEqual(formula, ''.join(text for kind, text in tokens))
+
+
+class TestReference(unittest.TestCase):
+    def test_parse(self):
+        reference = Reference.parse("[$'It''s'.$B$2:.C10]")
+        self.assertEqual("It's", reference.start.sheet)
+        self.assertEqual((1, 1), (reference.start.row, reference.start.column))
+        self.assertIsNone(reference.end.sheet)
+        self.assertEqual(("It's", "It's"), reference.sheets('Sheet1'))
+
+    def test_unsupported(self):
+        self.assertIsNone(Reference.parse("['file:///data.ods'#$Sheet1.A1]"))
+        self.assertIsNone(Reference.parse("[NamedRange]"))
+
+    def shift(self, text, axis, index, count):
+        return Reference.parse(text).shifted('Sheet1', 'Sheet1', axis, index, count)
+
+    def test_insert_rows(self):
+        self.assertEqual('[.A4]', self.shift('[.A2]', 'row', 1, 2))
+        self.assertIsNone(self.shift('[.A1]', 'row', 1, 2))
+        self.assertEqual('[.$A$1:.B7]', self.shift('[.$A$1:.B5]', 'row', 2, 2))
+
+    def test_delete_rows(self):
+        self.assertEqual('#REF!', self.shift('[.A2]', 'row', 1, -1))
+        self.assertEqual('[.A2]', self.shift('[.A4]', 'row', 1, -2))
+        self.assertEqual('[.A2:.A3]', self.shift('[.A2:.A5]', 'row', 1, -2))
+        self.assertEqual('#REF!', self.shift('[.A2:.A3]', 'row', 1, -2))
+
+    def test_columns(self):
+        self.assertEqual('[.AA1]', self.shift('[.Z1]', 'column', 0, 1))
+        self.assertEqual('[.A1:.A5]', self.shift('[.A1:.B5]', 'column', 0, -1))
+        self.assertIsNone(self.shift('[.1:.3]', 'column', 0, -1))
+
+    def test_other_sheet(self):
+        self.assertIsNone(self.shift('[Sheet2.A2]', 'row', 0, 1))
+
+
+class TestFormula(unittest.TestCase):
+    def test_cached(self):
+        self.assertTrue(parse_formula('of:=[.A1]') is parse_formula('of:=[.A1]'))
+
+    def test_sheets(self):
+        formula = parse_formula('of:=[.A1]+[Sheet2.B2]')
+        self.assertEqual(set(['Sheet1', 'Sheet2']), formula.sheets('Sheet1'))
+
+    def test_shifted(self):
+        formula = parse_formula('of:=[.A1]+[.A3]*[Sheet2.A3]')
+        self.assertEqual('of:=[.A1]+[.A4]*[Sheet2.A3]', formula.shifted('Sheet1', 'Sheet1', 'row', 1, 1))
+
+
+class TestFormulaIndex(unittest.TestCase):
+    def setUp(self):
+        self.doc = ezodf.newdoc('ods')
+        self.data = self.doc.sheets.append(Table('Data', size=(10, 5)))
+        self.calc = self.doc.sheets.append(Table('Calc', size=(5, 5)))
+        self.calc['A1'].formula = 'of:=SUM([Data.A2:.A5])'
+        self.calc['B1'].formula = 'of:=[.A1]*2'
+        self.data['E1'].formula = 'of:=[.A3]+[Calc.B1]'
+
+    def test_cells(self):
+        index = FormulaIndex(self.doc.body.xmlnode)
+        self.assertEqual(2, len(index.cells('Data')))
+        self.assertEqual(2, len(index.cells('Calc')))
+        self.assertEqual([], index.cells('Unknown'))
+
+    def test_insert_rows(self):
+        self.data.insert_rows(0, 2)
+        self.assertEqual('of:=SUM([Data.A4:.A7])', self.calc['A1'].formula)
+        self.assertEqual('of:=[.A5]+[Calc.B1]', self.data['E3'].formula)
+        self.assertEqual('of:=[.A1]*2', self.calc['B1'].formula)
+
+    def test_delete_rows(self):
+        self.data.delete_rows(2, 2)
+        self.assertEqual('of:=SUM([Data.A2:.A3])', self.calc['A1'].formula)
+        self.assertEqual('of:=#REF!+[Calc.B1]', self.data['E1'].formula)
+
+    def test_insert_columns(self):
+        self.calc.insert_columns(0, 1)
+        self.assertEqual('of:=[.B1]*2', self.calc['C1'].formula)
+        self.assertEqual('of:=[.A3]+[Calc.C1]', self.data['E1'].formula)
+
+    def test_delete_columns(self):
+        self.calc.delete_columns(0, 1)
+        self.assertEqual('of:=#REF!*2', self.calc['A1'].formula)
+
+    def test_standalone_table(self):
+        table = Table('Single', size=(5, 2))
+        table['B5'].formula = 'of:=SUM([.A1:.A4])'
+        table.insert_rows(-2, 1)
+        self.assertEqual('of:=SUM([.A1:.A5])', table['B6'].formula)
+
+    def test_runlength_table(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table('Single', size=(1000, 2))
+            table['B1000'].formula = 'of:=SUM([.A1:.A999])'
+            table.delete_rows(0, 10)
+            self.assertEqual('of:=SUM([.A1:.A989])', table['B990'].formula)
+        finally:
+            config.reset_table_expand_strategy()
+
+if __name__=='__main__':
+    unittest.main()
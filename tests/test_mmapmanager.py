@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test memory mapped file manager
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import os
+import zipfile
+
+# trusted or separately tested modules
+from mytesttools import getdatafile
+from ezodf.filemanager import check_zipfile_for_oasis_validity
+from ezodf import opendoc, newdoc
+
+# object to test
+from ezodf.mmapmanager import MappedFile, MMapFileManager
+
+class TestMappedFile(unittest.TestCase):
+    def test_read_like_a_file(self):
+        filename = getdatafile('empty.ods')
+        with open(filename, 'rb') as fp:
+            content = fp.read()
+        mapped = MappedFile(filename)
+        self.assertEqual(len(content), len(mapped))
+        self.assertEqual(content[:10], mapped.read(10))
+        self.assertEqual(20, mapped.seek(20))
+        self.assertEqual(content[20:], mapped.read())
+        self.assertEqual(len(content) - 5, mapped.seek(-5, os.SEEK_END))
+        mapped.close()
+        self.assertTrue(mapped.closed)
+
+    def test_zipfile(self):
+        mapped = MappedFile(getdatafile('empty.ods'))
+        with zipfile.ZipFile(mapped) as zf:
+            self.assertIsNone(zf.testzip())
+        mapped.close()
+
+class TestMMapFileManager(unittest.TestCase):
+    def test_get_bytes(self):
+        with MMapFileManager(getdatafile('empty.ods')) as fm:
+            self.assertTrue(fm.has_zip())
+            self.assertEqual(b'application/vnd.oasis.opendocument.spreadsheet',
+                             fm.get_bytes('mimetype'))
+
+    def test_opendoc_and_saveas(self):
+        outfile = getdatafile('mmap.empty.odt')
+        with opendoc(getdatafile('empty.odt'), use_mmap=True) as doc:
+            self.assertTrue(isinstance(doc.filemanager, MMapFileManager))
+            doc.saveas(outfile)
+        self.assertTrue(check_zipfile_for_oasis_validity(outfile, b"application/vnd.oasis.opendocument.text"))
+        os.remove(outfile)
+
+    def test_newdoc_from_template(self):
+        doc = newdoc(template=getdatafile('template.ots'), use_mmap=True)
+        self.assertTrue(isinstance(doc.filemanager, MMapFileManager))
+        self.assertEqual('ods', doc.doctype)
+        doc.close()
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test repeat aware table-row controller
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from ezodf.xmlns import CN, etree
+from ezodf.tableutils import get_table_rows
+
+# objects to test
+from ezodf.tablerowcontroller import RunLengthRowController
+from ezodf.tablecolumncontroller import RunLengthColumnController
+
+TABLE_REP_7x7 = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">
+<table:table-column table:number-columns-repeated="7"/>
+<table:table-header-rows>
+  <table:table-row>
+    <table:table-cell table:number-columns-repeated="6"/>
+    <table:table-cell />
+  </table:table-row>
+</table:table-header-rows>
+<table:table-rows>
+  <table:table-row table:number-rows-repeated="5">
+    <table:table-cell table:number-columns-repeated="6" />
+    <table:table-cell />
+  </table:table-row>
+  <table:table-row>
+    <table:table-cell table:number-columns-repeated="6"/>
+    <table:table-cell />
+  </table:table-row>
+</table:table-rows>
+</table:table>
+"""
+
+TABLE_FULLSIZE = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">
+  <table:table-row>
+    <table:table-cell data="a"/>
+    <table:table-cell table:number-columns-repeated="1023"/>
+  </table:table-row>
+  <table:table-row table:number-rows-repeated="1048575">
+    <table:table-cell table:number-columns-repeated="1024"/>
+  </table:table-row>
+</table:table>
+"""
+
+def setdata(data):
+    return etree.Element(CN('table:table-cell'), data=data)
+def getdata(element):
+    return element.get('data')
+def count_elements(xmlnode):
+    return len(xmlnode.findall('.//'+CN('table:table-cell')))
+
+class TestRunLengthRowController(unittest.TestCase):
+    def setUp(self):
+        self.container = RunLengthRowController(etree.XML(TABLE_REP_7x7))
+
+    def test_init_None_error(self):
+        with self.assertRaises(ValueError):
+            RunLengthRowController(xmlnode=None)
+
+    def test_size(self):
+        self.assertEqual(7, self.container.nrows())
+        self.assertEqual(7, self.container.ncols())
+        self.assertEqual(6, count_elements(self.container.xmlnode))
+
+    def test_fullsize_table(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        self.assertEqual(1048576, container.nrows())
+        self.assertEqual(1024, container.ncols())
+        self.assertEqual('a', getdata(container.get_cell((0, 0))))
+        self.assertEqual(3, count_elements(container.xmlnode))
+
+    def test_get_cell_splits_runs(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        cell = container.get_cell((1000, 500))
+        cell.set('data', 'x')
+        self.assertEqual('x', getdata(container.get_cell((1000, 500))))
+        self.assertIsNone(getdata(container.get_cell((999, 500))))
+        self.assertIsNone(getdata(container.get_cell((1000, 499))))
+        self.assertEqual(1048576, container.nrows())
+        self.assertTrue(container.is_consistent())
+        self.assertLess(count_elements(container.xmlnode), 20)
+
+    def test_set_cell(self):
+        self.container.set_cell((3, 3), setdata('test'))
+        self.assertEqual('test', getdata(self.container.get_cell((3, 3))))
+        self.assertIsNone(getdata(self.container.get_cell((2, 3))))
+        self.assertIsNone(getdata(self.container.get_cell((4, 3))))
+
+    def test_negative_indices(self):
+        self.container.set_cell((6, 6), setdata('neg'))
+        self.assertEqual('neg', getdata(self.container.get_cell((-1, -1))))
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.container.get_cell((7, 0))
+        with self.assertRaises(IndexError):
+            self.container.get_cell((0, 7))
+
+    def test_row_expands_cells(self):
+        row = self.container.row(3)
+        self.assertEqual(7, len(row))
+        self.assertEqual(7, self.container.nrows())
+
+    def test_column(self):
+        self.assertEqual(7, len(self.container.column(2)))
+
+    def test_reset(self):
+        self.container.reset((1000, 100))
+        self.assertEqual(1000, self.container.nrows())
+        self.assertEqual(100, self.container.ncols())
+        self.assertEqual(1, count_elements(self.container.xmlnode))
+        self.assertTrue(self.container.is_consistent())
+
+    def test_align_columns(self):
+        table = etree.XML(TABLE_REP_7x7)
+        get_table_rows(table)[-1].append(etree.Element(CN('table:table-cell'),
+            {CN('table:number-columns-repeated'): '3'}))
+        container = RunLengthRowController(table)
+        self.assertEqual(10, container.ncols())
+        self.assertIsNotNone(container.get_cell((0, 9)))
+
+    def test_append_rows(self):
+        self.container.append_rows(1000)
+        self.assertEqual(1007, self.container.nrows())
+        self.assertTrue(self.container.is_consistent())
+
+    def test_insert_rows(self):
+        self.container.set_cell((3, 0), setdata('x'))
+        self.container.insert_rows(2, 5)
+        self.assertEqual(12, self.container.nrows())
+        self.assertEqual('x', getdata(self.container.get_cell((8, 0))))
+        self.assertTrue(self.container.is_consistent())
+
+    def test_delete_rows(self):
+        self.container.set_cell((6, 0), setdata('x'))
+        self.container.delete_rows(1, 4)
+        self.assertEqual(3, self.container.nrows())
+        self.assertEqual('x', getdata(self.container.get_cell((2, 0))))
+        self.assertTrue(self.container.is_consistent())
+
+    def test_delete_rows_count_error(self):
+        with self.assertRaises(ValueError):
+            self.container.delete_rows(0, 7)
+
+    def test_delete_rows_index_error(self):
+        with self.assertRaises(IndexError):
+            self.container.delete_rows(5, 3)
+        with self.assertRaises(IndexError):
+            self.container.delete_rows(7, 1)
+        self.assertEqual(7, self.container.nrows())
+
+    def test_insert_columns_index_error(self):
+        with self.assertRaises(IndexError):
+            self.container.insert_columns(7, 1)
+        self.assertEqual(7, self.container.ncols())
+
+    def test_delete_columns_index_error(self):
+        with self.assertRaises(IndexError):
+            self.container.delete_columns(5, 3)
+        self.assertEqual(7, self.container.ncols())
+
+    def test_append_columns(self):
+        self.container.append_columns(3)
+        self.assertEqual(10, self.container.ncols())
+        self.assertEqual(10, len(self.container.row(6)))
+
+    def test_insert_columns(self):
+        self.container.set_cell((0, 3), setdata('x'))
+        self.container.insert_columns(1, 2)
+        self.assertEqual(9, self.container.ncols())
+        self.assertEqual('x', getdata(self.container.get_cell((0, 5))))
+
+    def test_delete_columns(self):
+        self.container.set_cell((0, 6), setdata('x'))
+        self.container.delete_columns(1, 4)
+        self.assertEqual(3, self.container.ncols())
+        self.assertEqual('x', getdata(self.container.get_cell((0, 2))))
+
+    def test_insert_rows_grows_empty_run(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        count = count_elements(container.xmlnode)
+        container.insert_rows(5, 100)
+        container.append_rows(10)
+        self.assertEqual(1048576 + 110, container.nrows())
+        self.assertEqual(count, count_elements(container.xmlnode))
+        self.assertTrue(container.is_consistent())
+
+    def test_insert_columns_grows_empty_run(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        count = count_elements(container.xmlnode)
+        container.insert_columns(1, 10)
+        self.assertEqual(1034, container.ncols())
+        self.assertEqual(count, count_elements(container.xmlnode))
+        self.assertEqual('a', getdata(container.get_cell((0, 0))))
+
+    def test_insert_rows_next_to_content(self):
+        self.container.set_cell((0, 0), setdata('x'))
+        xmlrow = self.container.xmlnode.find('.//'+CN('table:table-row'))
+        xmlrow.set('data', 'not empty')
+        self.container.insert_rows(0, 2)
+        self.assertEqual(9, self.container.nrows())
+        self.assertEqual('x', getdata(self.container.get_cell((2, 0))))
+        self.assertTrue(self.container.is_consistent())
+
+    def test_read_access_does_not_split_runs(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        count = count_elements(container.xmlnode)
+        self.assertEqual(1048576, len(container.column(5)))
+        self.assertEqual(1024, len(container.rows()[1000]))
+        self.assertEqual(10, len(container.row_wrappers(1000, 10, 20)))
+        self.assertIsNone(getdata(container.locate_cell((1000, 500))))
+        self.assertEqual(count, count_elements(container.xmlnode))
+        self.assertTrue(container.is_consistent())
+
+    def test_wrappers_do_not_split_runs(self):
+        count = count_elements(self.container.xmlnode)
+        self.assertEqual(7, len(self.container.column_wrappers(2)))
+        self.assertEqual(7, len(self.container.row_wrappers(3)))
+        self.assertEqual(count, count_elements(self.container.xmlnode))
+
+    def test_cell_wrapper_splits_runs_at_modification(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        count = count_elements(container.xmlnode)
+        cell = container.cell_wrapper((1000, 500))
+        self.assertEqual(count, count_elements(container.xmlnode))
+        cell.set_attr('data', 'x')
+        self.assertEqual('x', getdata(container.locate_cell((1000, 500))))
+        self.assertIsNone(getdata(container.locate_cell((999, 500))))
+        self.assertIsNone(getdata(container.locate_cell((1000, 501))))
+        self.assertTrue(container.is_consistent())
+
+    def test_itercolumnvalues_does_not_split_runs(self):
+        container = RunLengthRowController(etree.XML(TABLE_FULLSIZE))
+        count = count_elements(container.xmlnode)
+        result = list(container.itercolumnvalues(5, 0, container.nrows(), getdata))
+        self.assertEqual(container.nrows(), sum(n for value, n in result))
+        self.assertEqual(count, count_elements(container.xmlnode))
+
+
+class TestRunLengthColumnController(unittest.TestCase):
+    def setUp(self):
+        self.columns = RunLengthColumnController(etree.XML(TABLE_REP_7x7))
+
+    def test_len(self):
+        self.assertEqual(7, len(self.columns))
+
+    def test_get_column_splits_run(self):
+        column = self.columns[3]
+        self.assertEqual(CN('table:table-column'), column.tag)
+        self.assertEqual(3, len(self.columns._columns.elements()))
+        self.assertTrue(self.columns.is_consistent())
+
+    def test_reset(self):
+        self.columns.reset(1024)
+        self.assertEqual(1024, len(self.columns))
+        self.assertEqual(1, len(self.columns._columns.elements()))
+
+    def test_insert_grows_default_run(self):
+        self.columns.insert(2, 10)
+        self.assertEqual(1, len(self.columns._columns.elements()))
+        self.assertEqual(17, len(self.columns))
+
+    def test_insert_delete(self):
+        self.columns.insert(2, 10)
+        self.assertEqual(17, len(self.columns))
+        self.columns.delete(0, 16)
+        self.assertEqual(1, len(self.columns))
+        self.assertTrue(self.columns.is_consistent())
+
+if __name__=='__main__':
+    unittest.main()
@@ -111,6 +111,28 @@ class TestSheetsManagement(unittest.TestCase):
         object2 = self.sheets['Sheet1']
         self.assertTrue(object1 is object2)
 
+    def test_appended_object_is_cached(self):
+        table = Table(name='Sheet1')
+        self.sheets += table
+        self.assertTrue(table is self.sheets['Sheet1'])
+
+    def test_replaced_object_is_not_cached(self):
+        self.sheets += Table(name='Sheet1')
+        new_table = Table(name='Sheet2')
+        self.sheets[0] = new_table
+        self.assertTrue(new_table is self.sheets[0])
+        self.assertEqual(1, len(self.sheets.cache))
+
+    def test_removed_object_is_not_cached(self):
+        self.sheets += Table(name='Sheet1')
+        del self.sheets['Sheet1']
+        self.assertEqual(0, len(self.sheets.cache))
+
+    def test_cache_per_container(self):
+        other = Sheets(Element(CN('office:spreadsheet')))
+        self.sheets += Table(name='Sheet1')
+        self.assertEqual(0, len(other.cache))
+
     def test_sheet_names(self):
         self.sheets += Table(name='Sheet1')
         self.sheets += Table(name='Sheet2')
@@ -134,5 +156,76 @@ class TestSheetsManagement(unittest.TestCase):
         self.assertEqual(len(self.sheets), 3)
 
 
+class TestSheetsIndex(unittest.TestCase):
+    def setUp(self):
+        self.body = Element(CN('office:spreadsheet'))
+        # body children, which are not sheets
+        self.body.append(Element(CN('table:calculation-settings')))
+        self.sheets = Sheets(self.body)
+        for name in ('Sheet1', 'Sheet2', 'Sheet3'):
+            self.sheets += Table(name=name)
+        self.body.append(Element(CN('table:named-expressions')))
+
+    def names(self):
+        return list(self.sheets.names())
+
+    def test_rename(self):
+        self.sheets['Sheet2'].name = 'Renamed'
+        self.assertEqual('Renamed', self.sheets['Renamed'].name)
+        with self.assertRaises(KeyError):
+            self.sheets['Sheet2']
+
+    def test_duplicate_names(self):
+        self.sheets['Sheet3'].name = 'Sheet1'
+        self.assertTrue(self.sheets['Sheet1'] is self.sheets[0])
+        del self.sheets[0]
+        self.assertTrue(self.sheets['Sheet1'] is self.sheets[1])
+
+    def test_insert_position(self):
+        self.sheets.insert(2, Table(name='New'))
+        self.assertEqual(['Sheet1', 'New', 'Sheet2', 'Sheet3'], self.names())
+        self.assertEqual('New', self.sheets[1].name)
+
+    def test_append_after_other_children(self):
+        self.sheets.append(Table(name='Sheet4'))
+        self.assertEqual(4, len(self.sheets))
+        self.assertEqual('Sheet4', self.sheets[-1].name)
+
+    def test_move_existing_sheet(self):
+        self.sheets.append(self.sheets['Sheet1'])
+        self.assertEqual(['Sheet2', 'Sheet3', 'Sheet1'], self.names())
+
+    def test_replace(self):
+        self.sheets['Sheet2'] = Table(name='New')
+        self.assertEqual(['Sheet1', 'New', 'Sheet3'], self.names())
+        self.assertEqual('New', self.sheets['New'].name)
+        with self.assertRaises(KeyError):
+            self.sheets['Sheet2']
+
+    def test_delete(self):
+        del self.sheets['Sheet2']
+        self.assertEqual(['Sheet1', 'Sheet3'], self.names())
+        with self.assertRaises(KeyError):
+            self.sheets['Sheet2']
+        self.assertEqual('Sheet3', self.sheets[1].name)
+
+    def test_one_wrapper_per_sheet(self):
+        for index in range(300):
+            self.sheets += Table(name='Many%d' % index, size=(5, 2))
+        first = self.sheets['Many0']
+        for sheet in self.sheets:
+            pass
+        self.assertTrue(first is self.sheets['Many0'])
+        first.insert_rows(0, 2)
+        self.assertEqual(7, self.sheets['Many0'].nrows())
+
+    def test_direct_xml_modification(self):
+        self.body.append(Table(name='Sheet4').xmlnode)
+        self.assertEqual(4, len(self.sheets))
+        self.assertEqual('Sheet4', self.sheets['Sheet4'].name)
+        self.body.remove(self.sheets['Sheet1'].xmlnode)
+        self.assertEqual(['Sheet2', 'Sheet3', 'Sheet4'], self.names())
+
+
 if __name__=='__main__':
     unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test streaming spreadsheet reader
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from io import BytesIO
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.xmlns import CN
+
+# objects to test
+from ezodf.streamreader import get_mimetype, iter_rows, iter_sheets, sheet_names
+
+
+def build_spreadsheet():
+    doc = ezodf.newdoc('ods')
+    sheet = ezodf.Table('Sheet1', size=(4, 4))
+    sheet['A1'].set_value(1.5)
+    sheet['B1'].set_value('text')
+    sheet['A2'].set_value(True)
+    sheet['D4'].set_value(7)
+    doc.sheets += sheet
+    doc.sheets += ezodf.Table('Sheet2', size=(2, 2))
+    doc.sheets['Sheet2']['B2'].set_value('second')
+    return doc
+
+
+def set_repeated(xmlnode, key, count):
+    xmlnode.set(CN(key), str(count))
+
+
+class TestIterRows(unittest.TestCase):
+    def setUp(self):
+        self.doc = build_spreadsheet()
+
+    def stream(self):
+        return BytesIO(self.doc.tobytes())
+
+    def test_sheet_names(self):
+        self.assertEqual(sheet_names(self.stream()), ['Sheet1', 'Sheet2'])
+
+    def test_first_sheet_by_default(self):
+        rows = list(iter_rows(self.stream()))
+        self.assertEqual(rows, [
+            (1.5, 'text'),
+            (True, ),
+            (),
+            (None, None, None, 7.),
+        ])
+
+    def test_sheet_by_name(self):
+        rows = list(iter_rows(self.stream(), sheet='Sheet2'))
+        self.assertEqual(rows, [(), (None, 'second')])
+
+    def test_sheet_by_index(self):
+        rows = list(iter_rows(self.stream(), sheet=1))
+        self.assertEqual(rows, [(), (None, 'second')])
+
+    def test_sheet_not_found(self):
+        with self.assertRaises(KeyError):
+            list(iter_rows(self.stream(), sheet='Sheet3'))
+        with self.assertRaises(IndexError):
+            list(iter_rows(self.stream(), sheet=2))
+
+    def test_repeated_rows_and_cells(self):
+        sheet = self.doc.sheets[0]
+        first_row = sheet.xmlnode.findall(CN('table:table-row'))[0]
+        set_repeated(first_row, 'table:number-rows-repeated', 3)
+        set_repeated(first_row[1], 'table:number-columns-repeated', 2)
+        rows = list(iter_rows(self.stream()))
+        self.assertEqual(rows[:3], [(1.5, 'text', 'text')] * 3)
+        self.assertEqual(rows[3], (True, ))
+
+    def test_trailing_empty_rows_are_skipped(self):
+        sheet = self.doc.sheets[1]
+        last_row = sheet.xmlnode.findall(CN('table:table-row'))[-1]
+        empty_row = ezodf.table.TableRow(ncols=2).xmlnode
+        set_repeated(empty_row, 'table:number-rows-repeated', 1000000)
+        last_row.addnext(empty_row)
+        rows = list(iter_rows(self.stream(), sheet=1))
+        self.assertEqual(len(rows), 2)
+
+    def test_iter_sheets(self):
+        sheets = [(name, list(rows)) for name, rows in iter_sheets(self.stream())]
+        self.assertEqual(sheets[0], ('Sheet1', list(iter_rows(self.stream()))))
+        self.assertEqual(sheets[1], ('Sheet2', [(), (None, 'second')]))
+
+    def test_iter_sheets_skips_unconsumed_rows(self):
+        names = [name for name, rows in iter_sheets(self.stream())]
+        self.assertEqual(names, ['Sheet1', 'Sheet2'])
+
+    def test_get_mimetype(self):
+        self.assertEqual(get_mimetype(self.stream()),
+                         'application/vnd.oasis.opendocument.spreadsheet')
+
+    def test_from_file(self):
+        import os, tempfile
+        fd, filename = tempfile.mkstemp(suffix='.ods')
+        os.close(fd)
+        try:
+            self.doc.saveas(filename)
+            self.assertEqual(list(iter_rows(filename, 'Sheet2')), [(), (None, 'second')])
+        finally:
+            os.remove(filename)
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Purpose: test streaming spreadsheet writer
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT license
+from __future__ import unicode_literals, print_function, division
+__author__ = "mozman <mozman@gmx.at>"
+
+# Standard Library
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import os
+import zipfile
+import tempfile
+from datetime import date
+from io import BytesIO
+
+# trusted or separately tested modules
+import ezodf
+from ezodf.filemanager import check_zipfile_for_oasis_validity
+from ezodf.streamreader import iter_rows
+
+# objects to test
+from ezodf.streamwriter import StreamingSpreadsheetWriter, SpooledContentFile
+
+
+def get_content(buffer):
+    z = zipfile.ZipFile(BytesIO(buffer), 'r')
+    content = z.read('content.xml')
+    z.close()
+    return content
+
+
+def get_filelist(buffer):
+    z = zipfile.ZipFile(BytesIO(buffer), 'r')
+    files = z.namelist()
+    z.close()
+    return files
+
+
+class TestStreamingSpreadsheetWriter(unittest.TestCase):
+    def write(self, sheets):
+        stream = BytesIO()
+        with StreamingSpreadsheetWriter(stream) as writer:
+            for name, rows in sheets:
+                writer.add_sheet(name)
+                writer.append_rows(rows)
+        return stream.getvalue()
+
+    def test_package_structure(self):
+        result = self.write([('Sheet1', [[1, 2]])])
+        doc = ezodf.newdoc('ods')
+        doc.sheets += ezodf.Table('Sheet1')
+        expected = doc.tobytes()
+        self.assertEqual(get_filelist(result), get_filelist(expected))
+        self.assertEqual(result[30:38], b'mimetype')
+        self.assertEqual(result[38:38+len(doc.mimetype)], doc.mimetype.encode('ascii'))
+
+    def test_open_result(self):
+        result = self.write([('Sheet1', [[1, 'text'], [True, None, 'x']]), ('Sheet 2', [])])
+        doc = ezodf.opendoc(BytesIO(result))
+        self.assertEqual(list(doc.sheets.names()), ['Sheet1', 'Sheet 2'])
+        sheet = doc.sheets['Sheet1']
+        self.assertEqual(sheet['A1'].value, 1.)
+        self.assertEqual(sheet['B1'].value, 'text')
+        self.assertEqual(sheet['A2'].value, True)
+        self.assertEqual(sheet.ncols(), 3)
+        self.assertEqual(doc.sheets['Sheet 2'].nrows(), 1)
+
+    def test_stream_back(self):
+        rows = [(float(i), 'row %d' % i) for i in range(1000)]
+        result = self.write([('Data', rows)])
+        self.assertEqual(list(iter_rows(BytesIO(result))), rows)
+
+    def test_accepts_cells(self):
+        result = self.write([('Sheet1', [[ezodf.Cell(100, currency='EUR')]])])
+        doc = ezodf.opendoc(BytesIO(result))
+        self.assertEqual(doc.sheets[0]['A1'].currency, 'EUR')
+
+    def test_source_table_is_unchanged(self):
+        table = ezodf.Table('Source', size=(1, 2))
+        table.set_values('A1', [('a', 'b')])
+        with StreamingSpreadsheetWriter(BytesIO()) as writer:
+            writer.add_sheet('Sheet1')
+            writer.append_row([table['A1'], table['B1']])
+        self.assertEqual(2, len(table.xmlnode.findall('.//' + ezodf.xmlns.CN('table:table-cell'))))
+        self.assertEqual([['a'], ['b']], table.values())
+
+    def test_date_values(self):
+        result = self.write([('Sheet1', [[date(2026, 10, 18)]])])
+        doc = ezodf.opendoc(BytesIO(result))
+        self.assertEqual(doc.sheets[0]['A1'].value_type, 'date')
+        self.assertEqual(doc.sheets[0]['A1'].value, '2026-10-18')
+
+    def test_row_without_sheet(self):
+        writer = StreamingSpreadsheetWriter(BytesIO())
+        with self.assertRaises(ValueError):
+            writer.append_row([1])
+        writer.close()
+
+    def test_closed_writer(self):
+        writer = StreamingSpreadsheetWriter(BytesIO())
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.add_sheet('Sheet1')
+
+    def test_rows_inherit_namespaces(self):
+        content = get_content(self.write([('Sheet1', [[1, 'text']] * 100)]))
+        # declared once by the root element
+        self.assertEqual(1, content.count(b'xmlns:table='))
+        self.assertEqual(100, content.count(b'<table:table-row>'))
+
+    def test_spooled_content_file(self):
+        # fallback for Python < 3.6
+        class SpoolingWriter(StreamingSpreadsheetWriter):
+            def _open_content_file(self):
+                return SpooledContentFile(self._zippo, 'content.xml')
+
+        stream = BytesIO()
+        with SpoolingWriter(stream) as writer:
+            writer.add_sheet('Sheet1')
+            writer.append_rows([[1, 'text'], [2]])
+        self.assertEqual(list(iter_rows(BytesIO(stream.getvalue()))), [(1., 'text'), (2., )])
+
+    def test_oasis_validity(self):
+        fd, filename = tempfile.mkstemp(suffix='.ods')
+        os.close(fd)
+        try:
+            with StreamingSpreadsheetWriter(filename) as writer:
+                writer.add_sheet('Sheet1')
+                writer.append_row(['a', 'b'])
+            mimetype = StreamingSpreadsheetWriter.mimetype.encode('ascii')
+            self.assertTrue(check_zipfile_for_oasis_validity(filename, mimetype))
+        finally:
+            os.remove(filename)
+
+if __name__=='__main__':
+    unittest.main()
@@ -13,11 +13,13 @@ try:
 except ImportError:
     import unittest
 
+import array
 from itertools import chain
 
 # trusted or separately tested modules
 from ezodf.xmlns import CN, etree, wrap
 from ezodf.compatibility import is_string
+from ezodf.conf import config
 
 # objects to test
 from ezodf.cells import Cell
@@ -421,6 +423,445 @@ class TestCellSpan(unittest.TestCase):
         self.assertEqual((1, 1), self.table['A1'].span, "Span values for cell 'A1' should be (1, 1).")
         self.assertFalse(self.table['B2'].covered, "cell 'B1' is covered")
 
+REPEATED_TABLE = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" table:name="REP">
+<table:table-column table:number-columns-repeated="1024"/>
+<table:table-row table:number-rows-repeated="1048576">
+  <table:table-cell table:number-columns-repeated="1024"/>
+</table:table-row>
+</table:table>
+"""
+
+class TestRunLengthTable(unittest.TestCase):
+    def setUp(self):
+        config.set_table_expand_strategy('runlength')
+
+    def tearDown(self):
+        config.reset_table_expand_strategy()
+
+    def test_real_table_size(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        self.assertEqual(1048576, table.nrows())
+        self.assertEqual(1024, table.ncols())
+
+    def test_set_value(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        table['C1000'].set_value(100)
+        self.assertEqual(100, table['C1000'].value)
+        self.assertIsNone(table['C999'].value)
+        self.assertEqual(1048576, table.nrows())
+
+    def test_new_table(self):
+        table = Table(size=(100000, 100))
+        self.assertEqual(100000, table.nrows())
+        self.assertEqual(100, table.ncols())
+        self.assertEqual(100, len(table.row(99999)))
+
+    def test_column_info(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        table.column_info(10).style_name = 'c10'
+        self.assertEqual('c10', table.column_info(10).style_name)
+        self.assertIsNone(table.column_info(11).style_name)
+
+    def test_read_access_does_not_split_runs(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        self.assertIsNone(table['C1000'].value)
+        self.assertEqual(1048576, len(table.column(2)))
+        self.assertEqual(1024, len(table.row(5)))
+        self.assertEqual([None, None], [cell.value for cell in table.row(7)[1:3]])
+        self.assertEqual(1, len(table.xmlnode.findall(CN('table:table-row'))))
+
+    def test_modification_of_repeated_cells(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        row = table.row(1000)
+        row[2].set_value(100)
+        row[3].style_name = 'bold'
+        row[4].set_value('text')
+        self.assertEqual(100, table['C1001'].value)
+        self.assertEqual('bold', table['D1001'].style_name)
+        self.assertEqual('text', table['E1001'].plaintext())
+        self.assertIsNone(table['C1000'].value)
+        self.assertIsNone(table['C1002'].value)
+        self.assertIsNone(table['F1001'].style_name)
+        self.assertEqual(1048576, table.nrows())
+        self.assertLess(len(table.xmlnode.findall(CN('table:table-row'))), 10)
+
+    def test_cell_span(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        table.set_cell_span('B2', (2, 2))
+        self.assertEqual((2, 2), table['B2'].span)
+        self.assertTrue(table['C3'].covered)
+        self.assertFalse(table['D4'].covered)
+
+
+class TestLazyLoading(unittest.TestCase):
+    def test_table_name_without_loading(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        self.assertEqual('REP', table.name)
+        self.assertFalse(table.is_loaded())
+        # content is still unexpanded
+        self.assertEqual(1, len(table.xmlnode.findall(CN('table:table-row'))))
+
+    def test_load_at_cell_access(self):
+        table = Table(xmlnode=etree.XML(TABLE_5x3))
+        self.assertIsNone(table['A1'].value)
+        self.assertTrue(table.is_loaded())
+
+    def test_new_table_is_loaded(self):
+        table = Table(size=(2, 2))
+        self.assertTrue(table.is_loaded())
+
+    def test_reset_unloaded_table(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        table.reset(size=(3, 4))
+        self.assertEqual('REP', table.name)
+        self.assertEqual((3, 4), (table.nrows(), table.ncols()))
+
+    def test_copy_of_unloaded_table_is_not_loaded(self):
+        table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        self.assertFalse(table.copy().is_loaded())
+
+
+class TestTableCopy(unittest.TestCase):
+    def test_copy_of_loaded_table_is_loaded(self):
+        table = Table(size=(3, 2))
+        newtable = table.copy()
+        self.assertTrue(newtable.is_loaded())
+        self.assertEqual((3, 2), (newtable.nrows(), newtable.ncols()))
+
+    def test_copy_is_independent(self):
+        table = Table(size=(3, 2))
+        table.set_values('A1', [(1, 2)])
+        newtable = table.copy()
+        newtable['A1'].set_value('x')
+        newtable.append_rows(2)
+        self.assertEqual(1., table['A1'].value)
+        self.assertEqual('x', newtable['A1'].value)
+        self.assertEqual(2., newtable['B1'].value)
+        self.assertEqual((3, 5), (table.nrows(), newtable.nrows()))
+
+    def test_copy_keeps_controller_classes(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+            table['B3'].set_value(7)
+        finally:
+            config.reset_table_expand_strategy()
+        rows = len(table.xmlnode.findall(CN('table:table-row')))
+        newtable = table.copy()
+        self.assertEqual((1048576, 1024), (newtable.nrows(), newtable.ncols()))
+        self.assertEqual(7., newtable['B3'].value)
+        self.assertEqual(rows, len(newtable.xmlnode.findall(CN('table:table-row'))))
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestTableValues(unittest.TestCase):
+    def setUp(self):
+        self.table = Table(size=(4, 3))
+        for row in range(4):
+            self.table[row, 0].set_value(row)
+            self.table[row, 1].set_value('text%d' % row)
+        self.table['C2'].set_value(True)
+
+    def test_all_values(self):
+        columns = self.table.values()
+        self.assertEqual(3, len(columns))
+        self.assertEqual([0., 1., 2., 3.], columns[0])
+        self.assertEqual(['text0', 'text1', 'text2', 'text3'], columns[1])
+        self.assertEqual([None, True, None, None], columns[2])
+
+    def test_range(self):
+        self.assertEqual([[1., 2.], ['text1', 'text2']], self.table.values('A2:B3'))
+        self.assertEqual([[True]], self.table.values(((1, 2), (1, 2))))
+
+    def test_invalid_range(self):
+        with self.assertRaises(IndexError):
+            self.table.values('A1:D1')
+
+    def test_default(self):
+        self.assertEqual([0, True, 0, 0], self.table.values('C1:C4', default=0)[0])
+
+    def test_array(self):
+        columns = self.table.values('A1:B4', dtype='d', default=-1.)
+        self.assertEqual(array.array('d', [0., 1., 2., 3.]), columns[0])
+        self.assertEqual(array.array('d', [-1.] * 4), columns[1])
+
+    def test_int_array(self):
+        column = self.table.values('A1:A4', dtype='l')[0]
+        self.assertEqual(array.array('l', [0, 1, 2, 3]), column)
+
+    @unittest.skipUnless(numpy, "numpy not installed.")
+    def test_numpy_array(self):
+        column = self.table.values('A1:A4', dtype='float64')[0]
+        self.assertTrue(isinstance(column, numpy.ndarray))
+        self.assertEqual([0., 1., 2., 3.], column.tolist())
+
+class TestTableColumnValues(unittest.TestCase):
+    def setUp(self):
+        self.table = Table(size=(4, 3))
+        self.table.set_values('A1', [(1, 'a'), (2, 'b'), (3, None)])
+
+    def test_column_values(self):
+        self.assertEqual([1., 2., 3., None], self.table.column_values(0))
+        self.assertEqual(['a', 'b', None, None], self.table.column_values('B1'))
+        self.assertEqual(['a', 'b', '', ''], self.table.column_values(-2, default=''))
+
+    def test_array(self):
+        column = self.table.column_values(0, dtype='d', default=0.)
+        self.assertEqual(array.array('d', [1., 2., 3., 0.]), column)
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.table.column_values(3)
+
+    def test_changed_cell(self):
+        self.table.column_values(0)
+        self.table['A2'] = Cell(7)
+        self.assertEqual([1., 7., 3., None], self.table.column_values(0))
+
+    def test_single_column_range(self):
+        self.assertEqual([[2., 3.]], self.table.values('A2:A3'))
+
+
+class TestRunLengthTableValues(unittest.TestCase):
+    def setUp(self):
+        config.set_table_expand_strategy('runlength')
+        self.table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+        self.table['B3'].set_value(7)
+
+    def tearDown(self):
+        config.reset_table_expand_strategy()
+
+    def test_runs_are_not_split(self):
+        rows = len(self.table.xmlnode.findall(CN('table:table-row')))
+        columns = self.table.values('A1:C1000')
+        self.assertEqual(3, len(columns))
+        self.assertEqual(1000, len(columns[1]))
+        self.assertEqual(7., columns[1][2])
+        self.assertEqual(1, columns[1].count(7.))
+        self.assertEqual(rows, len(self.table.xmlnode.findall(CN('table:table-row'))))
+
+    def test_array(self):
+        column = self.table.values('B1:B5', dtype='d', default=0.)[0]
+        self.assertEqual(array.array('d', [0., 0., 7., 0., 0.]), column)
+
+
+class TestTableCellViews(unittest.TestCase):
+    def test_get_cell_view(self):
+        table = Table(size=(3, 3))
+        table['B2'].set_value('text')
+        view = table.get_cell_view('B2')
+        self.assertEqual('text', view.value)
+        self.assertEqual('string', view.value_type)
+        self.assertEqual(view, table.get_cell_view((1, 1)))
+
+    def test_iter_cell_views(self):
+        table = Table(size=(3, 3))
+        table.set_values('A1', [(1, 2), (3, 4)])
+        rows = list(table.iter_cell_views('A1:B2'))
+        self.assertEqual([[1., 2.], [3., 4.]], [[view.value for view in row] for row in rows])
+        self.assertEqual(3, len(list(table.iter_cell_views())))
+
+    def test_runlength_table(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+            rows = len(table.xmlnode.findall(CN('table:table-row')))
+            views = list(table.iter_cell_views('A1:C1000'))
+            self.assertEqual(1000, len(views))
+            self.assertTrue(views[0] is views[999])
+            self.assertEqual(rows, len(table.xmlnode.findall(CN('table:table-row'))))
+        finally:
+            config.reset_table_expand_strategy()
+
+
+TABLE_WITH_SUBTABLE = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+  xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0">
+<table:table-column />
+<table:table-row>
+  <table:table-cell office:value-type="float" office:value="1">
+    <table:table><table:table-column table:visibility="collapse"/></table:table>
+  </table:table-cell>
+  <table:table-cell office:value-type="float" office:value="2"/>
+  <table:table-cell office:value-type="float" office:value="3"/>
+</table:table-row>
+</table:table>
+"""
+
+class TestTableAggregate(unittest.TestCase):
+    def setUp(self):
+        self.table = Table(size=(4, 3))
+        self.table.set_values('A1', [(1, 'a', 4), (2, True, 5), (3, None, 6)])
+
+    def test_all_aggregates(self):
+        result = self.table.aggregate('A1:C3')
+        self.assertEqual({'sum': 21., 'count': 6, 'min': 1., 'max': 6., 'mean': 3.5}, result)
+
+    def test_selected_aggregates(self):
+        self.assertEqual({'sum': 6.}, self.table.aggregate('A1:A4', funcs=['sum']))
+
+    def test_no_numbers(self):
+        result = self.table.aggregate('B1:B4')
+        self.assertEqual({'sum': 0., 'count': 0, 'min': None, 'max': None, 'mean': None}, result)
+
+    def test_unknown_aggregate(self):
+        with self.assertRaises(ValueError):
+            self.table.aggregate(funcs=['median'])
+
+    def test_skip_hidden(self):
+        self.table.row_info(1).visibility = 'collapse'
+        self.table.column_info(2).visibility = 'filter'
+        self.assertEqual(21., self.table.aggregate(funcs=['sum'])['sum'])
+        self.assertEqual(4., self.table.aggregate(funcs=['sum'], skip_hidden=True)['sum'])
+
+    def test_skip_hidden_ignores_subtables(self):
+        # the column definitions do not cover all cells
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(TABLE_WITH_SUBTABLE))
+            result = table.aggregate(funcs=['sum'], skip_hidden=True)
+        finally:
+            config.reset_table_expand_strategy()
+        self.assertEqual(6., result['sum'])
+
+    def test_skip_covered(self):
+        self.table.set_cell_span('A1', (2, 1))
+        self.assertEqual(19., self.table.aggregate(funcs=['sum'])['sum'])
+        self.assertEqual(21., self.table.aggregate(funcs=['sum'], skip_covered=False)['sum'])
+
+    def test_runlength_table(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+            table.set_values('A1', [(1, 2)] * 3000)
+            result = table.aggregate('A1:C5000')
+            self.assertEqual({'sum': 9000., 'count': 6000, 'min': 1., 'max': 2., 'mean': 1.5}, result)
+        finally:
+            config.reset_table_expand_strategy()
+
+    def test_repeated_rows(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(REPEATED_VALUES_TABLE))
+            rows = len(table.xmlnode.findall(CN('table:table-row')))
+            result = table.aggregate()
+            self.assertEqual({'sum': 8001., 'count': 4001, 'min': 1., 'max': 2., 'mean': 8001. / 4001}, result)
+            self.assertEqual(rows, len(table.xmlnode.findall(CN('table:table-row'))))
+        finally:
+            config.reset_table_expand_strategy()
+
+REPEATED_VALUES_TABLE = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+  xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" table:name="REP">
+<table:table-column table:number-columns-repeated="2"/>
+<table:table-row table:number-rows-repeated="2000">
+  <table:table-cell table:number-columns-repeated="2" office:value-type="float" office:value="2"/>
+</table:table-row>
+<table:table-row>
+  <table:table-cell office:value-type="float" office:value="1"/><table:table-cell/>
+</table:table-row>
+</table:table>
+"""
+
+
+class TestTableCellRange(unittest.TestCase):
+    def setUp(self):
+        self.table = Table('Sheet1', size=(5, 4))
+        self.table.set_values('A1', [(1, 2, 3), (4, 5, 6), (7, 8, 9)])
+
+    def test_getitem_returns_range(self):
+        block = self.table['B2:C3']
+        self.assertEqual((2, 2), (block.nrows(), block.ncols()))
+        self.assertEqual('B2:C3', block.reference)
+        self.assertEqual(5., block[0, 0].value)
+        self.assertEqual(9., block['B2'].value)
+        self.assertEqual(9., block[-1, -1].value)
+
+    def test_absolute_and_sheet_references(self):
+        self.assertEqual('A1:C3', self.table['Sheet1.$A$1:$C$3'].reference)
+        self.assertEqual(5., self.table['$B$2'].value)
+        with self.assertRaises(ValueError):
+            self.table['Sheet2.A1:C3']
+
+    def test_whole_columns_and_rows(self):
+        self.assertEqual('B1:C5', self.table['B:C'].reference)
+        self.assertEqual('A2:D2', self.table['2:2'].reference)
+        self.assertEqual([[2., 5., 8., None, None]], self.table.values('B:B'))
+
+    def test_rows(self):
+        rows = [[cell.value for cell in row] for row in self.table['A1:B2']]
+        self.assertEqual([[1., 2.], [4., 5.]], rows)
+
+    def test_values_and_aggregate(self):
+        block = self.table['A2:C3']
+        self.assertEqual([[4., 7.], [5., 8.], [6., 9.]], block.values())
+        self.assertEqual({'sum': 39.}, block.aggregate(funcs=['sum']))
+
+    def test_set_values(self):
+        block = self.table['C4:D5']
+        block.set_values([('a', 'b')])
+        self.assertEqual('b', self.table['D4'].value)
+        with self.assertRaises(IndexError):
+            block.set_values([(1, 2, 3)])
+
+    def test_set_cell(self):
+        block = self.table['B2:C3']
+        block[1, 1] = Cell('x')
+        self.assertEqual('x', self.table['C3'].value)
+
+    def test_invalid_position(self):
+        with self.assertRaises(IndexError):
+            self.table['B2:C3'][2, 0]
+
+    def test_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.table['A1:E1']
+
+
+class TestTableSetValues(unittest.TestCase):
+    def test_set_block(self):
+        table = Table(size=(5, 5))
+        table.set_values('B2', [(1, 'a'), (2, 'b', True)])
+        self.assertEqual(1., table['B2'].value)
+        self.assertEqual('a', table['C2'].value)
+        self.assertTrue(table['D3'].value)
+        self.assertIsNone(table['D2'].value)
+
+    def test_row_out_of_range(self):
+        table = Table(size=(2, 2))
+        with self.assertRaises(IndexError):
+            table.set_values((1, 0), [(1, 2), (3, 4)])
+
+    def test_column_out_of_range(self):
+        table = Table(size=(2, 2))
+        with self.assertRaises(IndexError):
+            table.set_values((0, 1), [(1, 2)])
+
+    def test_table_is_unchanged_after_error(self):
+        table = Table(size=(2, 2))
+        with self.assertRaises(IndexError):
+            table.set_values('A1', [(1, 2), (3, 4, 5)])
+        with self.assertRaises(IndexError):
+            table.set_values('A1', [(1, 2), (3, 4), (5, 6)])
+        self.assertEqual([[None, None], [None, None]], table.values())
+
+    def test_runlength_table(self):
+        config.set_table_expand_strategy('runlength')
+        try:
+            table = Table(xmlnode=etree.XML(REPEATED_TABLE))
+            table.set_values('B1000', [(1, 2), (3, 4)])
+            self.assertEqual([[1., 3.], [2., 4.]], table.values('B1000:C1001'))
+            self.assertIsNone(table['B999'].value)
+            self.assertEqual(1048576, table.nrows())
+            self.assertEqual(1024, table.ncols())
+        finally:
+            config.reset_table_expand_strategy()
+
 
 if __name__=='__main__':
     unittest.main()
@@ -14,12 +14,16 @@ except ImportError:
     import unittest
 
 # trusted or separately tested modules
+from datetime import date, datetime
+from decimal import Decimal
+
 from ezodf.xmlns import CN, etree, wrap
 from ezodf.text import Paragraph
 from ezodf.base import GenericWrapper
 
 # objects to test
-from ezodf.cells import Cell, CoveredCell
+from ezodf.cells import Cell, CoveredCell, get_cell_value, get_cell_number
+from ezodf.cells import set_cell_value, get_cell_view, CellView
 
 COVERED_TABLE_CELL = """
 <table:covered-table-cell xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" />
@@ -396,5 +400,111 @@ class TestCellCreation(unittest.TestCase):
         self.assertEqual(cell[0].kind, 'Paragraph')
 
 
+class TestCellValueFunctions(unittest.TestCase):
+    def test_get_cell_value(self):
+        self.assertEqual(7., get_cell_value(Cell(7).xmlnode))
+        self.assertEqual('text', get_cell_value(Cell('text').xmlnode))
+        self.assertIsNone(get_cell_value(Cell().xmlnode))
+
+    def test_get_cell_value_with_whitespace_elements(self):
+        cell = Cell('a')
+        cell.append_text('  b\tc')
+        self.assertEqual('a  b\tc', get_cell_value(cell.xmlnode))
+
+    def test_get_cell_number(self):
+        self.assertEqual(7., get_cell_number(Cell(7).xmlnode))
+        self.assertEqual(.5, get_cell_number(Cell(.5, value_type='percentage').xmlnode))
+        self.assertIsNone(get_cell_number(Cell('7').xmlnode))
+        self.assertEqual(-1, get_cell_number(Cell(True).xmlnode, -1))
+
+
+class TestSetCellValue(unittest.TestCase):
+    def setUp(self):
+        self.cell = Cell()
+
+    def set_value(self, value):
+        set_cell_value(self.cell.xmlnode, value)
+        return self.cell
+
+    def test_number(self):
+        cell = self.set_value(7)
+        self.assertEqual('float', cell.value_type)
+        self.assertEqual(7., cell.value)
+        self.assertEqual(1.5, self.set_value(Decimal('1.5')).value)
+
+    def test_boolean(self):
+        cell = self.set_value(False)
+        self.assertEqual('boolean', cell.value_type)
+        self.assertFalse(cell.value)
+
+    def test_date(self):
+        cell = self.set_value(date(2026, 10, 18))
+        self.assertEqual('date', cell.value_type)
+        self.assertEqual('2026-10-18', cell.value)
+        self.assertEqual('2026-10-18T12:30:00', self.set_value(datetime(2026, 10, 18, 12, 30)).value)
+
+    def test_string(self):
+        cell = self.set_value('text')
+        self.assertEqual('string', cell.value_type)
+        self.assertEqual('text', cell.value)
+        self.assertEqual(1, len(cell))
+
+    def test_string_with_whitespaces(self):
+        self.assertEqual('a  b\tc\nd', self.set_value('a  b\tc\nd').value)
+
+    def test_replace_value(self):
+        cell = Cell(10, currency='EUR')
+        set_cell_value(cell.xmlnode, 'text')
+        self.assertEqual('text', cell.value)
+        self.assertIsNone(cell.currency)
+        self.assertIsNone(cell.xmlnode.get(CN('office:value')))
+
+    def test_clear(self):
+        cell = self.set_value('text')
+        set_cell_value(cell.xmlnode, None)
+        self.assertIsNone(cell.value_type)
+        self.assertEqual(0, len(cell))
+
+
+class TestCellView(unittest.TestCase):
+    def test_typed_cell(self):
+        cell = Cell(7, style_name='ce1')
+        view = get_cell_view(cell.xmlnode)
+        self.assertEqual(7., view.value)
+        self.assertEqual('float', view.value_type)
+        self.assertEqual('ce1', view.style_name)
+        self.assertEqual((1, 1), view.span)
+        self.assertFalse(view.covered)
+
+    def test_spanned_and_covered_cell(self):
+        cell = Cell()
+        cell._set_span((2, 3))
+        self.assertEqual((2, 3), get_cell_view(cell.xmlnode).span)
+        self.assertTrue(get_cell_view(CoveredCell().xmlnode).covered)
+
+    def test_equality(self):
+        self.assertEqual(get_cell_view(Cell('a').xmlnode), get_cell_view(Cell('a').xmlnode))
+        self.assertNotEqual(get_cell_view(Cell('a').xmlnode), get_cell_view(Cell('b').xmlnode))
+
+    def test_has_no_dict(self):
+        view = CellView(None, None, None, (1, 1), False)
+        with self.assertRaises(AttributeError):
+            view.extra = 1
+
+
+class TestCellSlots(unittest.TestCase):
+    def test_cell_has_no_dict(self):
+        self.assertFalse(hasattr(Cell(), '__dict__'))
+        self.assertFalse(hasattr(CoveredCell(), '__dict__'))
+        self.assertFalse(hasattr(Paragraph('text'), '__dict__'))
+
+    def test_uncover_cell(self):
+        cell = Cell()
+        cell._set_covered(True)
+        cell._set_covered(False)
+        self.assertFalse(cell.covered)
+        self.assertEqual(Cell.TAG, cell.TAG)
+
+
 if __name__=='__main__':
     unittest.main()
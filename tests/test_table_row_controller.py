@@ -16,6 +16,7 @@ except ImportError:
 from ezodf.xmlns import CN, etree
 
 # objects to test
+from ezodf import tablerowcontroller
 from ezodf.tablerowcontroller import TableRowController
 
 TABLE_5x3 = """
@@ -57,6 +58,9 @@ def setdata(data):
     return etree.Element(CN('table:table-cell'), data=data)
 def getdata(element):
     return element.get('data')
+def column_values(container, index):
+    return [value for value, count in
+            container.itercolumnvalues(index, 0, container.nrows(), getdata)]
 
 class TestTableRowContainer(unittest.TestCase):
 
@@ -146,6 +150,53 @@ class TestTableRowContainer_GetRowColumns(unittest.TestCase):
         result = ''.join([getdata(element) for element in container.column(3)])
         self.assertEqual('yyyyyyy', result)
 
+    def test_column_index_follows_set_cell(self):
+        container = TableRowController(etree.XML(TABLE_REP_7x7))
+        column_values(container, 3)
+        container.set_cell((2, 3), setdata('z'))
+        self.assertEqual('z', column_values(container, 3)[2])
+        self.assertEqual('z', column_values(container, -4)[2])
+        self.assertEqual('z', getdata(container.column(3)[2]))
+
+    def test_column_index_invalidated_by_structural_changes(self):
+        container = TableRowController(etree.XML(TABLE_REP_7x7))
+        container.set_cell((0, 4), setdata('x'))
+        self.assertEqual('x', column_values(container, 4)[0])
+        container.insert_columns(0, 1)
+        self.assertEqual('x', column_values(container, 5)[0])
+        container.insert_rows(0, 2)
+        self.assertEqual(9, len(column_values(container, 5)))
+        self.assertEqual('x', column_values(container, 5)[2])
+        container.delete_columns(0, 1)
+        self.assertEqual('x', column_values(container, 4)[2])
+
+    def test_column_index_is_bounded(self):
+        container = TableRowController(etree.XML(TABLE_REP_7x7))
+        for _ in range(3):
+            for index in range(container.ncols()):
+                column_values(container, index)
+        self.assertEqual(7, len(container._columns))
+        tablerowcontroller.MAX_CACHED_COLUMNS = 2
+        try:
+            column_values(container, 3)
+            self.assertEqual([3], list(container._columns)[-1:])
+            column_values(container, 4)
+            self.assertEqual([3, 4], list(container._columns))
+        finally:
+            tablerowcontroller.MAX_CACHED_COLUMNS = 16
+
+    def test_column_does_not_cache_index(self):
+        container = TableRowController(etree.XML(TABLE_REP_7x7))
+        for index in range(container.ncols()):
+            container.column(index)
+        self.assertEqual(0, len(container._columns))
+
+    def test_itercolumnvalues(self):
+        container = TableRowController(etree.XML(TABLE_REP_7x7))
+        container.set_cell((1, 2), setdata('a'))
+        result = list(container.itercolumnvalues(2, 1, 3, getdata))
+        self.assertEqual([('a', 1), (None, 1)], result)
+
 TABLE_10x10 = """
 <table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">
 <table:table-rows>
@@ -12,7 +12,27 @@ try:
 except ImportError:
     import unittest
 
-from ezodf.tableutils import address_to_index, iter_cell_range
+from ezodf.xmlns import CN, etree
+from ezodf.tableutils import address_to_index, iter_cell_range, get_cell_range
+from ezodf.tableutils import RunLengthIndex, get_repetition
+from ezodf.tableutils import is_empty_cell, is_empty_row, insert_before, insert_after
+from ezodf.tableutils import remove_elements, EmptyCellBlock, get_table_columns
+from ezodf.tableutils import parse_reference, index_to_address, CellReference
+from ezodf.tableutils import parse_endpoint
+
+TABLE_WITH_SUBTABLE = """
+<table:table xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">
+<table:table-column name="a"/>
+<table:table-column-group>
+  <table:table-header-columns><table:table-column name="b"/></table:table-header-columns>
+  <table:table-column-group><table:table-column name="c"/></table:table-column-group>
+</table:table-column-group>
+<table:table-columns><table:table-column name="d"/></table:table-columns>
+<table:table-row><table:table-cell>
+  <table:table><table:table-column name="sub"/></table:table>
+</table:table-cell></table:table-row>
+</table:table>
+"""
 
 class TestAddressToIndex(unittest.TestCase):
     def test_A1(self):
@@ -40,6 +60,60 @@ class TestAddressToIndex(unittest.TestCase):
             address_to_index('A')
         with self.assertRaises(ValueError):
             address_to_index('A1A')
+        with self.assertRaises(ValueError):
+            address_to_index('A0')
+
+    def test_absolute_address(self):
+        self.assertEqual(address_to_index('$B$12'), (11, 1))
+
+class TestIndexToAddress(unittest.TestCase):
+    def test_relative(self):
+        self.assertEqual('B12', index_to_address((11, 1)))
+        self.assertEqual('AA1', index_to_address((0, 26)))
+
+    def test_absolute(self):
+        self.assertEqual('$B$12', index_to_address((11, 1), absolute=True))
+
+    def test_round_trip(self):
+        for pos in [(0, 0), (99, 2108), (1048575, 1023)]:
+            self.assertEqual(pos, address_to_index(index_to_address(pos)))
+
+    def test_invalid_index(self):
+        with self.assertRaises(ValueError):
+            index_to_address((-1, 0))
+
+class TestParseReference(unittest.TestCase):
+    def test_cell(self):
+        self.assertEqual(CellReference(None, 1, 2, 1, 2), parse_reference('C2'))
+        self.assertEqual(CellReference(None, 1, 2, 1, 2), parse_reference('$C$2'))
+
+    def test_range(self):
+        self.assertEqual(CellReference(None, 0, 0, 9, 3), parse_reference('A1:D10'))
+
+    def test_sheet_qualified(self):
+        self.assertEqual(CellReference('Sheet2', 0, 0, 0, 0), parse_reference('Sheet2.A1'))
+        self.assertEqual(CellReference('Sheet2', 0, 0, 2, 2), parse_reference('$Sheet2.$A$1:.$C$3'))
+        self.assertEqual(CellReference("It's a:b", 0, 0, 0, 0), parse_reference("'It''s a:b'.A1"))
+
+    def test_whole_columns_and_rows(self):
+        self.assertEqual(CellReference(None, None, 0, None, 2), parse_reference('A:C'))
+        self.assertEqual(CellReference(None, 0, None, 2, None), parse_reference('$1:$3'))
+
+    def test_errors(self):
+        for reference in ('A', '1', 'A1:3', 'A1:', 'A:B:C', '', 'Sheet1.A1:Sheet2.B2'):
+            with self.assertRaises(ValueError):
+                parse_reference(reference)
+
+class TestParseEndpoint(unittest.TestCase):
+    def test_unconverted_parts(self):
+        self.assertEqual((None, 'A', '1'), parse_endpoint('A1'))
+        self.assertEqual(('$Sheet2', '$A', '$1'), parse_endpoint('$Sheet2.$A$1'))
+        self.assertEqual(("'It''s'", None, '3'), parse_endpoint("'It''s'.3"))
+        self.assertEqual(('', 'C', None), parse_endpoint('.C'))
+
+    def test_invalid_endpoints(self):
+        for endpoint in ('A1:C3', 'A1B', "'Sheet.A1", '[.A1]'):
+            self.assertIsNone(parse_endpoint(endpoint))
 
 class TestIterCellRange(unittest.TestCase):
     def test_range(self):
@@ -71,5 +145,134 @@ class TestIterCellRange(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(iter_cell_range((0, -1), (1, 1)))
 
+class TestGetCellRange(unittest.TestCase):
+    def test_address_range(self):
+        self.assertEqual(((0, 0), (9, 2)), get_cell_range('A1:C10'))
+
+    def test_tuple_range(self):
+        self.assertEqual(((1, 1), (2, 3)), get_cell_range(((1, 1), 'D3')))
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            get_cell_range('A1')
+        with self.assertRaises(ValueError):
+            get_cell_range("'a:b'.A1")
+        with self.assertRaises(TypeError):
+            get_cell_range(1)
+
+REPEATED = CN('table:number-columns-repeated')
+
+def new_run(name, count):
+    element = etree.Element(CN('table:table-cell'), name=name)
+    if count > 1:
+        element.set(REPEATED, str(count))
+    return element
+
+class TestRunLengthIndex(unittest.TestCase):
+    def setUp(self):
+        self.parent = etree.Element(CN('table:table-row'))
+        self.parent.extend([new_run('a', 3), new_run('b', 1), new_run('c', 5)])
+        self.index = RunLengthIndex(self.parent, REPEATED, self.parent)
+
+    def names(self):
+        result = []
+        for element in self.parent:
+            result.extend([element.get('name')] * get_repetition(element, REPEATED))
+        return ''.join(result)
+
+    def test_len(self):
+        self.assertEqual(9, len(self.index))
+
+    def test_locate(self):
+        self.assertEqual('a', self.index.locate(2).get('name'))
+        self.assertEqual('b', self.index.locate(3).get('name'))
+        self.assertEqual('c', self.index.locate(8).get('name'))
+        with self.assertRaises(IndexError):
+            self.index.locate(9)
+
+    def test_isolate(self):
+        element = self.index.isolate(5)
+        self.assertEqual(1, get_repetition(element, REPEATED))
+        self.assertEqual(5, len(self.parent))
+        self.assertEqual(9, len(self.index))
+        self.assertEqual('aaabccccc', self.names())
+
+    def test_insert(self):
+        self.index.insert(1, new_run('x', 1), 2)
+        self.assertEqual('axxaabccccc', self.names())
+        self.index.insert(11, new_run('y', 1))
+        self.assertEqual('axxaabcccccy', self.names())
+
+    def test_delete(self):
+        self.index.delete(2, 4)
+        self.assertEqual('aaccc', self.names())
+        self.assertEqual(5, len(self.index))
+
+    def test_replace(self):
+        self.index.replace(6, new_run('r', 1))
+        self.assertEqual('aaabccrcc', self.names())
+
+    def test_expand(self):
+        self.index.expand()
+        self.assertEqual(9, len(self.parent))
+        self.assertEqual('aaabccccc', self.names())
+        self.assertEqual(self.index.elements(), list(self.parent))
+
+    def test_grow(self):
+        is_c = lambda element: element.get('name') == 'c'
+        self.assertTrue(self.index.grow(9, 2, is_c))
+        self.assertEqual('aaabccccccc', self.names())
+        self.assertEqual(11, len(self.index))
+        self.assertFalse(self.index.grow(1, 2, is_c))
+        self.assertEqual('c', self.index.locate(10).get('name'))
+
+    def test_grow_run_in_front(self):
+        is_b = lambda element: element.get('name') == 'b'
+        self.assertTrue(self.index.grow(4, 2, is_b))
+        self.assertEqual('aaabbbccccc', self.names())
+        self.assertEqual('c', self.index.locate(6).get('name'))
+
+
+class TestStructureHelpers(unittest.TestCase):
+    def setUp(self):
+        self.parent = etree.Element(CN('table:table-row'))
+        self.parent.extend([new_run(name, 1) for name in 'abcde'])
+
+    def names(self):
+        return ''.join(element.get('name') for element in self.parent)
+
+    def test_insert_before_and_after(self):
+        insert_before(self.parent[1], [new_run('x', 1), new_run('y', 1)])
+        self.assertEqual('axybcde', self.names())
+        insert_after(self.parent[-1], [new_run('z', 1)])
+        self.assertEqual('axybcdez', self.names())
+
+    def test_remove_elements(self):
+        parent = self.parent
+        remove_elements([parent[0], parent[1], parent[3]])
+        self.assertEqual('ce', self.names())
+
+    def test_empty_cell_block(self):
+        block = EmptyCellBlock(3)
+        cells1, cells2 = block.new(), block.new()
+        self.assertEqual(3, len(cells1))
+        self.assertFalse(cells1[0] is cells2[0])
+        self.assertTrue(is_empty_cell(cells1[0]))
+
+    def test_is_empty(self):
+        row = etree.Element(CN('table:table-row'))
+        cell = etree.SubElement(row, CN('table:table-cell'))
+        cell.set(CN('table:number-columns-repeated'), '3')
+        self.assertTrue(is_empty_cell(cell))
+        self.assertTrue(is_empty_row(row))
+        cell.set(CN('office:value-type'), 'float')
+        self.assertFalse(is_empty_cell(cell))
+        self.assertFalse(is_empty_row(row))
+
+    def test_get_table_columns(self):
+        table = etree.XML(TABLE_WITH_SUBTABLE)
+        self.assertEqual(['a', 'b', 'c', 'd'],
+                         [column.get('name') for column in get_table_columns(table)])
+
 if __name__=='__main__':
     unittest.main()
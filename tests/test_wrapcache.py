@@ -18,28 +18,68 @@ from ezodf.base import GenericWrapper
 from ezodf import wrapcache
 
 class TestWrapCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = wrapcache.WrapCache()
 
     def test_add_and_wrap(self):
         original = GenericWrapper()
-        wrapcache.add(original)
-        copy = wrapcache.wrap(original.xmlnode)
+        self.cache.add(original)
+        copy = self.cache.wrap(original.xmlnode)
         self.assertTrue(original is copy)
 
     def test_clear(self):
         original = GenericWrapper()
-        wrapcache.add(original)
-        copy1 = wrapcache.wrap(original.xmlnode)
+        self.cache.add(original)
+        copy1 = self.cache.wrap(original.xmlnode)
         self.assertTrue(original is copy1)
-        wrapcache.clear()
-        copy2 = wrapcache.wrap(original.xmlnode)
+        self.cache.clear()
+        copy2 = self.cache.wrap(original.xmlnode)
         self.assertFalse(original is copy2)
 
     def test_remove(self):
         original = GenericWrapper()
-        wrapcache.add(original)
-        wrapcache.remove(original)
-        copy = wrapcache.wrap(original.xmlnode)
+        self.cache.add(original)
+        self.cache.remove(original)
+        copy = self.cache.wrap(original.xmlnode)
         self.assertTrue(original is not copy)
 
+class TestBoundedWrapCache(unittest.TestCase):
+    def test_wrap_counts_hits_and_misses(self):
+        cache = wrapcache.WrapCache()
+        element = GenericWrapper().xmlnode
+        first = cache.wrap(element)
+        self.assertTrue(first is cache.wrap(element))
+        stats = cache.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['size'])
+
+    def test_lru_eviction(self):
+        cache = wrapcache.WrapCache(maxsize=2)
+        objects = [GenericWrapper() for _ in range(3)]
+        cache.add(objects[0])
+        cache.add(objects[1])
+        cache.wrap(objects[0].xmlnode) # objects[1] is the least recently used
+        cache.add(objects[2])
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.stats()['evictions'])
+        self.assertTrue(objects[0] is cache.wrap(objects[0].xmlnode))
+        self.assertFalse(objects[1] is cache.wrap(objects[1].xmlnode))
+
+    def test_unlimited_cache(self):
+        cache = wrapcache.WrapCache(maxsize=None)
+        for _ in range(10):
+            cache.add(GenericWrapper())
+        self.assertEqual(10, len(cache))
+
+    def test_discard(self):
+        cache = wrapcache.WrapCache()
+        original = GenericWrapper()
+        cache.discard(original)
+        cache.add(original)
+        cache.discard(original)
+        self.assertEqual(0, len(cache))
+
+
 if __name__=='__main__':
     unittest.main()